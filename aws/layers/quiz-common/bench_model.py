@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+quiz_model 메모리/직렬화 벤치마크
+- 메모리: 문항 N개를 DynamoDB dict(Decimal) 그대로 보관 vs Question(__slots__) 변환 후 보관 (tracemalloc 순증가)
+- 직렬화: 조회 API 응답 생성 (기존 dict 변환 + json.dumps(default=Decimal→float) vs Quiz.from_item + dumps)
+  json / orjson 각각, 역방향(JSON 본문 → Quiz → DynamoDB 아이템) 포함
+
+사용법:
+    python bench_model.py
+    python bench_model.py --questions 500 --repeat 7
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'python'))
+
+import quiz_model
+from quiz_model import Question, Quiz
+
+MIN_RUN_SECONDS = 0.2
+
+
+# ===== 코퍼스 =====
+
+def make_item(question_count):
+    """조회 API가 받는 DynamoDB 아이템 (숫자는 Decimal, 일부 레거시 필드 문항 포함)"""
+    questions = []
+    for i in range(question_count):
+        question = {
+            'question': f'한국은행 기준금리 {i}차 인상 이후 시장에서 나타날 가장 적절한 해석은?',
+            'options': ['단기 유동성 확대', '수출 채산성 개선', '이자 부담 감소', '외국인 자금 유출'],
+            'correctAnswer': Decimal(i % 4),
+            'explanation': '기준금리 인상은 차입 비용을 높여 가계와 기업의 이자 부담을 키운다. ' * 4,
+            'newsLink': f'https://www.sedaily.com/NewsView/2K{i:04d}',
+            'explainers': {'whyCorrect': '정답 해설 ' * 20, 'background': '배경 설명 ' * 20}
+        }
+        if i % 5 == 0:
+            question['articleTitle'] = f'기준금리 {i}차 인상… 시장 영향은'
+            question['articleSummary'] = '한국은행이 기준금리를 0.25%포인트 인상했다.'
+        else:
+            question['relatedArticle'] = {'title': f'기준금리 {i}차 인상… 시장 영향은',
+                                          'excerpt': '한국은행이 기준금리를 0.25%포인트 인상했다.'}
+        questions.append(question)
+    return {'PK': 'QUIZ#BlackSwan', 'SK': 'DATE#2026-02-06', 'gameType': 'BlackSwan', 'date': '2026-02-06',
+            'questions': questions, 'createdAt': '2026-02-06T06:00:00', 'updatedAt': '2026-02-06T06:00:00'}
+
+
+# ===== 기존 방식 (모델 도입 전 handler.transform_question) =====
+
+def legacy_decimal_default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError
+
+
+def legacy_transform(q, index):
+    correct_index = int(q.get('correctAnswer', 0))
+    options = q.get('options', [])
+    related_article = q.get('relatedArticle', {})
+    if not related_article:
+        related_article = {'title': q.get('articleTitle', ''), 'excerpt': q.get('articleSummary', '')}
+    return {
+        'id': f"q{index + 1}",
+        'questionType': '객관식',
+        'question': q.get('question', ''),
+        'options': options,
+        'answer': options[correct_index] if correct_index < len(options) else '',
+        'explanation': q.get('explanation', ''),
+        'newsLink': q.get('newsLink', '#'),
+        'tags': '경제·금융',
+        'relatedArticle': related_article
+    }
+
+
+def legacy_response(item):
+    questions = [legacy_transform(q, i) for i, q in enumerate(item['questions'])]
+    return json.dumps({'gameType': item['gameType'], 'date': item['date'], 'questions': questions},
+                      default=legacy_decimal_default)
+
+
+# ===== 측정 =====
+
+def measure(func, repeat):
+    """호출당 최솟값/중앙값(초)"""
+    start = time.perf_counter()
+    func()
+    single = max(time.perf_counter() - start, 1e-7)
+    number = max(1, int(MIN_RUN_SECONDS / repeat / single))
+
+    gc.collect()
+    gc.disable()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    gc.enable()
+    return min(samples), statistics.median(samples)
+
+
+def retained_bytes(build):
+    """build()가 만든 객체가 유지하는 메모리 (tracemalloc 순증가)"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    value = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return after - before
+
+
+def with_json_backend(use_orjson, func):
+    """quiz_model.dumps/loads의 백엔드를 바꿔 실행"""
+    def run():
+        saved = quiz_model.orjson
+        if not use_orjson:
+            quiz_model.orjson = None
+        try:
+            return func()
+        finally:
+            quiz_model.orjson = saved
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description='quiz_model 메모리/직렬화 벤치마크')
+    parser.add_argument('--questions', type=int, default=200, help='아이템 1개의 문항 수')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    item = make_item(args.questions)
+    payload = json.dumps({'gameType': 'BlackSwan', 'date': '2026-02-06',
+                          'questions': [dict(q, correctAnswer=int(q['correctAnswer'])) for q in item['questions']]},
+                         ensure_ascii=False)
+    has_orjson = quiz_model.orjson is not None
+
+    # 결과 동일성 (JSON 백엔드/공백 차이는 무시)
+    assert json.loads(legacy_response(item)) == json.loads(Quiz.from_item(item).to_api_json())
+
+    print("=" * 72)
+    print(f"메모리 (문항 {args.questions}개 보관)")
+    print("=" * 72)
+    raw = retained_bytes(lambda: make_item(args.questions)['questions'])
+    model = retained_bytes(lambda: Quiz.from_item(make_item(args.questions)).questions)  # 원본 dict는 변환 후 해제
+    print(f"{'DynamoDB dict (Decimal)':40} {raw / 1024:10.1f}KiB {raw / args.questions:8.0f}B/문항")
+    print(f"{'Question (__slots__)':40} {model / 1024:10.1f}KiB {model / args.questions:8.0f}B/문항")
+
+    cases = [
+        ('api: legacy dict + json(Decimal→float)', lambda: legacy_response(item)),
+        ('api: Quiz.from_item + dumps (json)', with_json_backend(False, lambda: Quiz.from_item(item).to_api_json())),
+    ]
+    if has_orjson:
+        cases.append(('api: Quiz.from_item + dumps (orjson)',
+                      with_json_backend(True, lambda: Quiz.from_item(item).to_api_json())))
+    cases += [
+        ('item: Quiz.from_item', lambda: Quiz.from_item(item)),
+        ('item: Quiz.to_item', lambda quiz=Quiz.from_item(item): quiz.to_item()),
+        ('json → item (json)', with_json_backend(False, lambda: Quiz.from_json(payload).to_item())),
+    ]
+    if has_orjson:
+        cases.append(('json → item (orjson)', with_json_backend(True, lambda: Quiz.from_json(payload).to_item())))
+    cases.append(('Question.answer', lambda q=Question.from_dict(item['questions'][1]): q.answer))
+
+    print()
+    print("=" * 72)
+    print(f"{'직렬화 (아이템 1개)':40} {'best':>12} {'median':>12}")
+    print("=" * 72)
+    for name, func in cases:
+        best, median = measure(func, args.repeat)
+        print(f"{name:40} {best * 1e6:10.1f}µs {median * 1e6:10.1f}µs")
+    if not has_orjson:
+        print("\n(orjson 미설치: pip install orjson 후 orjson 케이스 포함)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/bin/bash
+
+# 서울경제 AI GAMES - 퀴즈 공용 모델 Lambda 레이어(quiz-common) 빌드/배포 스크립트
+# build/python/ 아래에 공용 모듈(quiz_model, quiz_rules, lambda_init) + orjson(Lambda용 manylinux 휠)을 담아 레이어 ZIP 생성
+# 사용법:
+#   ./build.sh            # 빌드 + 레이어 버전 배포 (ARN 출력)
+#   ./build.sh --no-publish   # 빌드만 (serverless 챗봇 배포는 build/ 디렉토리를 직접 사용)
+
+set -e
+
+LAYER_NAME="sedaily-quiz-common"
+REGION="us-east-1"
+RUNTIME="python3.11"
+PYTHON_VERSION="3.11"
+
+echo "📦 레이어 패키지 준비 중..."
+rm -rf build layer.zip
+mkdir -p build/python
+
+echo "📥 의존성 설치 중 (manylinux x86_64)..."
+pip install -r requirements.txt -t build/python/ --quiet \
+    --platform manylinux2014_x86_64 --implementation cp \
+    --python-version $PYTHON_VERSION --only-binary=:all:
+
+cp python/*.py build/python/
+
+cd build
+zip -r ../layer.zip python -q
+cd ..
+echo "✅ 레이어 ZIP 생성 완료: layer.zip"
+
+if [ "$1" == "--no-publish" ]; then
+    exit 0
+fi
+
+echo "🚀 레이어 버전 배포 중..."
+LAYER_ARN=$(aws lambda publish-layer-version \
+    --layer-name $LAYER_NAME \
+    --description "퀴즈 공용 모델/품질 규칙/init 워밍 + orjson" \
+    --zip-file fileb://layer.zip \
+    --compatible-runtimes $RUNTIME \
+    --region $REGION \
+    --query LayerVersionArn \
+    --output text)
+rm layer.zip
+
+echo ""
+echo "✅ 레이어 배포 완료: $LAYER_ARN"
+echo ""
+echo "다음 단계:"
+echo "  cd ../../quiz-lambda && QUIZ_COMMON_LAYER_ARN=$LAYER_ARN ./deploy.sh   # 조회 API에 레이어 연결"
@@ -0,0 +1,65 @@
+"""
+Lambda 초기화 단계 워밍 (quiz-common 레이어)
+무거운 의존성 import와 AWS 클라이언트 생성을 첫 요청이 아닌 init 단계로 옮기는 공용 훅
+- SnapStart (snapshot_restore_py 제공 런타임): 스냅샷 전에 prime(deep=True) → 복원 후 after_restore
+  스냅샷에 포함되므로 선택 경로 의존성(bs4 등)까지 미리 로드
+- 일반 콜드 스타트: init 단계에서 prime(deep=False) → 모든 요청에 필요한 것만 (선택 경로는 첫 사용 시 lazy import)
+- 로컬 실행/테스트: 워밍하지 않음 (import만으로 boto3 클라이언트를 만들지 않음)
+
+PRIME_ON_INIT 환경 변수: auto(기본, Lambda에서만) | true | false
+prime 함수는 네트워크 호출 없이 import/객체 생성만 해야 함 (스냅샷에 연결이 남지 않도록)
+"""
+
+import os
+import random
+import time
+from typing import Callable, Optional
+
+# 상수 정의
+PRIME_ON_INIT = os.environ.get('PRIME_ON_INIT', 'auto').lower()
+
+try:
+    from snapshot_restore_py import register_after_restore, register_before_snapshot
+except ImportError:  # SnapStart 미지원 런타임/로컬
+    register_before_snapshot = register_after_restore = None
+
+# 마지막 prime 소요 시간(초) (콜드 스타트 벤치마크/로그용)
+last_prime_seconds: Optional[float] = None
+
+
+def in_lambda() -> bool:
+    return bool(os.environ.get('AWS_LAMBDA_FUNCTION_NAME'))
+
+
+def _timed(prime: Callable[..., None], deep: bool) -> None:
+    global last_prime_seconds
+    start = time.perf_counter()
+    prime(deep=deep)
+    last_prime_seconds = time.perf_counter() - start
+
+
+def _reseed() -> None:
+    """복원된 실행 환경마다 난수 상태가 같지 않도록 재시드 (로그 샘플링 등)"""
+    random.seed()
+
+
+def register_priming(prime: Callable[..., None], after_restore: Optional[Callable[[], None]] = None) -> str:
+    """
+    모듈 최하단에서 호출 → 적용된 방식 ('snapstart' | 'init' | 'off')
+    prime(deep: bool): deep=True면 선택 경로 의존성까지 워밍
+    """
+    if PRIME_ON_INIT == 'false' or (PRIME_ON_INIT == 'auto' and not in_lambda()):
+        return 'off'
+
+    if register_before_snapshot is not None:
+        register_before_snapshot(lambda: _timed(prime, True))
+
+        def restore():
+            _reseed()
+            if after_restore:
+                after_restore()
+        register_after_restore(restore)
+        return 'snapstart'
+
+    _timed(prime, False)
+    return 'init'
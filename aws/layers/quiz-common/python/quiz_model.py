@@ -0,0 +1,209 @@
+"""
+퀴즈 공용 모델 (Lambda 레이어 quiz-common)
+생성기, 조회 API, 챗봇이 dict마다 다시 계산하던 필드(정답 선택지 문자열, 레거시 articleTitle/articleSummary 대체)를 한 곳에서 처리
+- from_dict / from_item: 생성기 dict, JSON, DynamoDB 아이템(숫자 Decimal) 모두 입력 가능, 숫자는 생성 시 1회만 int 변환
+- to_dict / to_item: DynamoDB 저장 형식 (float 없음 → boto3 Decimal 변환 불필요), 모르는 필드(explainers, duplicateOf 등)는 그대로 보존
+- to_api: 조회 API 응답 (웹사이트 Question 타입)
+- dumps / loads: orjson이 있으면 사용 (레이어 빌드 시 포함), 없으면 표준 json
+"""
+
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # 로컬/레이어 미적용 환경
+    orjson = None
+
+# 상수 정의
+DEFAULT_EDITION = 'standard'
+DEFAULT_TAGS = '경제·금융'
+QUESTION_TYPE = '객관식'
+MISSING_LINK = '#'
+
+_QUESTION_KEYS = frozenset(['question', 'options', 'correctAnswer', 'explanation', 'newsLink',
+                            'relatedArticle', 'articleTitle', 'articleSummary'])
+_QUIZ_KEYS = frozenset(['PK', 'SK', 'gameType', 'date', 'questions', 'edition', 'createdAt', 'updatedAt'])
+
+
+def _to_int(value: Any, default: int = -1) -> int:
+    """Decimal/int/숫자 문자열 → int (변환 불가는 default, bool 제외)"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError, ArithmeticError):
+        return default
+
+
+def _plain(value: Any) -> Any:
+    """JSON 직렬화 기본값: Decimal → int(정수) / float"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> str:
+    """JSON 문자열 (orjson 우선, Decimal 허용)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_plain).decode('utf-8')
+    return json.dumps(value, default=_plain, ensure_ascii=False)
+
+
+def loads(text: Any) -> Any:
+    """JSON 파싱 (str/bytes, orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@dataclass(slots=True)
+class Question:
+    """퀴즈 문항 1개"""
+
+    question: str
+    options: List[str]
+    correct_answer: int
+    explanation: str = ''
+    news_link: str = ''
+    article_title: str = ''
+    article_excerpt: str = ''
+    extra: Dict[str, Any] = field(default_factory=dict)  # 모델이 모르는 필드 (저장 시 그대로 기록)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Question':
+        """생성기/JSON/DynamoDB 문항 dict → Question (relatedArticle 없으면 레거시 articleTitle/articleSummary)"""
+        article = data.get('relatedArticle') or {}
+        # 위치 인자로 생성 (조회 API가 아이템마다 문항 수만큼 호출하는 경로, 키워드 인자보다 빠름)
+        return cls(
+            data.get('question') or '',
+            list(data.get('options') or ()),
+            _to_int(data.get('correctAnswer', 0)),
+            data.get('explanation') or '',
+            data.get('newsLink') or '',
+            article.get('title') or data.get('articleTitle') or '',
+            article.get('excerpt') or data.get('articleSummary') or '',
+            {k: v for k, v in data.items() if k not in _QUESTION_KEYS}
+        )
+
+    @property
+    def answer(self) -> str:
+        """정답 선택지 문자열 (정답 번호가 범위를 벗어나면 빈 문자열)"""
+        if 0 <= self.correct_answer < len(self.options):
+            return self.options[self.correct_answer]
+        return ''
+
+    @property
+    def related_article(self) -> Dict[str, str]:
+        return {'title': self.article_title, 'excerpt': self.article_excerpt}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저장 형식 dict (생성기 출력과 같은 필드 순서, 레거시 필드는 relatedArticle로 통합)"""
+        data = {
+            'question': self.question,
+            'options': list(self.options),
+            'correctAnswer': self.correct_answer,
+            'explanation': self.explanation,
+            'newsLink': self.news_link,
+            'relatedArticle': self.related_article
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    to_item = to_dict
+
+    def to_api(self, index: int) -> Dict[str, Any]:
+        """조회 API 응답 형식 (웹사이트 Question 타입)"""
+        return {
+            'id': f"q{index + 1}",
+            'questionType': QUESTION_TYPE,
+            'question': self.question,
+            'options': self.options,
+            'answer': self.answer,
+            'explanation': self.explanation,
+            'newsLink': self.news_link or MISSING_LINK,
+            'tags': DEFAULT_TAGS,
+            'relatedArticle': self.related_article
+        }
+
+
+@dataclass(slots=True)
+class Quiz:
+    """게임 1개, 날짜 1개의 퀴즈 (DynamoDB 아이템 1개)"""
+
+    game_type: str
+    date: str
+    questions: List[Question] = field(default_factory=list)
+    edition: str = DEFAULT_EDITION
+    created_at: str = ''
+    updated_at: str = ''
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def pk(self) -> str:
+        """standard 외 에디션은 QUIZ#{gameType}#{edition}"""
+        if self.edition == DEFAULT_EDITION:
+            return f'QUIZ#{self.game_type}'
+        return f'QUIZ#{self.game_type}#{self.edition}'
+
+    @property
+    def sk(self) -> str:
+        return f'DATE#{self.date}'
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> 'Quiz':
+        """DynamoDB 아이템 → Quiz (gameType/date 필드가 없으면 PK/SK에서 복원)"""
+        pk_parts = item.get('PK', '').split('#')
+        return cls(
+            game_type=item.get('gameType') or (pk_parts[1] if len(pk_parts) > 1 else ''),
+            date=item.get('date') or item.get('SK', '').replace('DATE#', ''),
+            questions=[Question.from_dict(q) for q in item.get('questions') or []],
+            edition=item.get('edition') or (pk_parts[2] if len(pk_parts) > 2 else DEFAULT_EDITION),
+            created_at=item.get('createdAt', ''),
+            updated_at=item.get('updatedAt', ''),
+            extra={k: v for k, v in item.items() if k not in _QUIZ_KEYS}
+        )
+
+    def to_item(self) -> Dict[str, Any]:
+        """DynamoDB 아이템 (edition은 standard 외에만 기록)"""
+        item = {
+            'PK': self.pk,
+            'SK': self.sk,
+            'gameType': self.game_type,
+            'date': self.date,  # 기존 필드명 유지
+            'questions': [q.to_dict() for q in self.questions],
+            'createdAt': self.created_at,
+            'updatedAt': self.updated_at
+        }
+        if self.edition != DEFAULT_EDITION:
+            item['edition'] = self.edition
+        if self.extra:
+            item.update(self.extra)
+        return item
+
+    def to_api(self) -> Dict[str, Any]:
+        """조회 API 응답 본문"""
+        return {
+            'gameType': self.game_type,
+            'date': self.date,
+            'questions': [q.to_api(i) for i, q in enumerate(self.questions)]
+        }
+
+    def to_api_json(self) -> str:
+        return dumps(self.to_api())
+
+    @classmethod
+    def from_json(cls, text: Any, game_type: Optional[str] = None, date: Optional[str] = None) -> 'Quiz':
+        """JSON 본문({gameType, date, questions}) → Quiz (인자로 준 gameType/date가 우선)"""
+        data = loads(text)
+        return cls(
+            game_type=game_type or data.get('gameType', ''),
+            date=date or data.get('date', ''),
+            questions=[Question.from_dict(q) for q in data.get('questions') or []],
+            edition=data.get('edition') or DEFAULT_EDITION
+        )
@@ -0,0 +1,231 @@
+"""
+퀴즈 품질 규칙 엔진
+문항을 게임/인덱스/필드별 열(column)로 한 번 펼친 뒤 규칙마다 전체 문항을 한 번에 검사
+- error: 저장 불가 (검증 실패 → 재시도)
+- warning: 저장 가능하지만 점수 감점 (재시도/후보 선택 기준)
+
+규칙 추가:
+    @register_rule('my_rule', 'warning', weight=5)
+    def my_rule(table):
+        for row in table.rows():
+            if ...:
+                yield row, '메시지'
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 상수 정의
+GAME_TYPES = ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']
+QUESTIONS_PER_GAME = 2
+OPTION_COUNT = 4
+REQUIRED_FIELDS = ['question', 'options', 'correctAnswer']
+MAX_SCORE = 100
+OPTION_LENGTH_RATIO = 2.5  # 최장/최단 선택지 길이 비율 상한
+ANSWER_LONGEST_RATIO = 1.6  # 정답이 나머지 평균보다 이 배수 이상 길면 '긴 선택지 = 정답' 단서
+MIN_EXPLANATION_CHARS = 30
+MIN_LEAK_CHARS = 4  # 이보다 짧은 정답 선택지는 문제에 포함돼도 누설로 보지 않음
+
+_NORMALIZE = re.compile(r'[\s\W_]+')
+
+Row = Tuple[str, int]  # (게임, 문항 인덱스)
+
+
+class QuestionTable:
+    """quiz_data → 열 단위 문항 표 (규칙들이 공유, 정규화는 1회만)"""
+
+    __slots__ = ('counts', 'games', 'indices', 'raw', 'questions', 'options', 'answers', 'explanations',
+                 'links', 'norm_question', 'norm_options')
+
+    def __init__(self, quiz_data: Dict[str, List[Dict[str, Any]]]):
+        self.counts = {game: len(quiz_data.get(game) or []) for game in GAME_TYPES}
+        self.games: List[str] = []
+        self.indices: List[int] = []
+        self.raw: List[Dict[str, Any]] = []
+        for game, questions in quiz_data.items():
+            for index, question in enumerate(questions or []):
+                self.games.append(game)
+                self.indices.append(index)
+                self.raw.append(question)
+        self.questions = [str(q.get('question') or '') for q in self.raw]
+        self.options = [[str(o) for o in (q.get('options') or [])] for q in self.raw]
+        self.answers = [_answer_index(q.get('correctAnswer')) for q in self.raw]
+        self.explanations = [str(q.get('explanation') or '') for q in self.raw]
+        self.links = [str(q.get('newsLink') or '') for q in self.raw]
+        self.norm_question = [_normalize(text) for text in self.questions]
+        self.norm_options = [[_normalize(o) for o in options] for options in self.options]
+
+    def rows(self) -> Iterable[Tuple[int, Row]]:
+        """(행 번호, (게임, 문항 인덱스))"""
+        return enumerate(zip(self.games, self.indices))
+
+
+def _normalize(text: str) -> str:
+    return _NORMALIZE.sub('', text.lower())
+
+
+def _answer_index(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ===== 규칙 등록 =====
+
+RuleFunc = Callable[[QuestionTable], Iterable[Tuple[Optional[Row], str]]]
+RULES: List[Tuple[str, str, int, RuleFunc]] = []  # (이름, 심각도, 감점, 함수)
+
+
+def register_rule(name: str, severity: str, weight: int = 0) -> Callable[[RuleFunc], RuleFunc]:
+    """규칙 등록 (severity: 'error' | 'warning', weight: warning 1건당 감점)"""
+    if severity not in ('error', 'warning'):
+        raise ValueError(f"Unknown severity: {severity}")
+
+    def decorator(func: RuleFunc) -> RuleFunc:
+        RULES[:] = [r for r in RULES if r[0] != name]  # 같은 이름 재등록 시 교체
+        RULES.append((name, severity, weight, func))
+        return func
+    return decorator
+
+
+# ===== 오류 규칙 =====
+
+@register_rule('game_missing', 'error')
+def game_missing(table):
+    for game, count in table.counts.items():
+        if count == 0:
+            yield (game, -1), f"{game}: 문제 없음 (최소 1개 필요)"
+
+
+@register_rule('required_fields', 'error')
+def required_fields(table):
+    for row, (game, index) in table.rows():
+        for field in REQUIRED_FIELDS:
+            if field not in table.raw[row]:
+                yield (game, index), f"{game} 문제{index + 1}: {field} 필드 누락"
+
+
+@register_rule('option_count', 'error')
+def option_count(table):
+    for row, (game, index) in table.rows():
+        if 'options' in table.raw[row] and len(table.options[row]) != OPTION_COUNT:
+            yield (game, index), f"{game} 문제{index + 1}: 선택지 {len(table.options[row])}개 ({OPTION_COUNT}개 필요)"
+
+
+@register_rule('answer_range', 'error')
+def answer_range(table):
+    for row, (game, index) in table.rows():
+        answer = table.answers[row]
+        if 'correctAnswer' in table.raw[row] and (answer is None or not 0 <= answer < len(table.options[row])):
+            yield (game, index), f"{game} 문제{index + 1}: 정답 번호 범위 벗어남 ({table.raw[row].get('correctAnswer')})"
+
+
+@register_rule('empty_question', 'error')
+def empty_question(table):
+    for row, (game, index) in table.rows():
+        if 'question' in table.raw[row] and not table.norm_question[row]:
+            yield (game, index), f"{game} 문제{index + 1}: 문제 내용 없음"
+
+
+# ===== 경고 규칙 =====
+
+@register_rule('question_count', 'warning', weight=5)
+def question_count(table):
+    for game, count in table.counts.items():
+        if count and count != QUESTIONS_PER_GAME:
+            yield (game, -1), f"{game}: {count}개 문제 ({QUESTIONS_PER_GAME}개 권장)"
+
+
+@register_rule('duplicate_answer_position', 'warning', weight=3)
+def duplicate_answer_position(table):
+    by_game: Dict[str, List[Optional[int]]] = {}
+    for row, (game, _) in table.rows():
+        by_game.setdefault(game, []).append(table.answers[row])
+    for game, answers in by_game.items():
+        if len(answers) >= 2 and len(set(answers)) < 2:
+            yield (game, -1), f"{game}: 정답 번호 중복 ({answers})"
+
+
+@register_rule('duplicate_options', 'warning', weight=15)
+def duplicate_options(table):
+    for row, (game, index) in table.rows():
+        options = [o for o in table.norm_options[row] if o]
+        if len(set(options)) < len(options):
+            yield (game, index), f"{game} 문제{index + 1}: 중복 선택지"
+
+
+@register_rule('empty_option', 'warning', weight=15)
+def empty_option(table):
+    for row, (game, index) in table.rows():
+        if any(not o for o in table.norm_options[row]):
+            yield (game, index), f"{game} 문제{index + 1}: 빈 선택지"
+
+
+@register_rule('option_length_imbalance', 'warning', weight=4)
+def option_length_imbalance(table):
+    for row, (game, index) in table.rows():
+        lengths = [len(o) for o in table.norm_options[row] if o]
+        if len(lengths) < 2:
+            continue
+        if max(lengths) > OPTION_LENGTH_RATIO * min(lengths):
+            yield (game, index), f"{game} 문제{index + 1}: 선택지 길이 불균형 ({min(lengths)}~{max(lengths)}자)"
+            continue
+        answer = table.answers[row]
+        if answer is not None and 0 <= answer < len(table.norm_options[row]):
+            others = [len(o) for i, o in enumerate(table.norm_options[row]) if i != answer]
+            if others and len(table.norm_options[row][answer]) > ANSWER_LONGEST_RATIO * (sum(others) / len(others)):
+                yield (game, index), f"{game} 문제{index + 1}: 정답 선택지만 눈에 띄게 김"
+
+
+@register_rule('answer_leak', 'warning', weight=20)
+def answer_leak(table):
+    for row, (game, index) in table.rows():
+        answer = table.answers[row]
+        options = table.norm_options[row]
+        if answer is None or not 0 <= answer < len(options):
+            continue
+        correct = options[answer]
+        if len(correct) >= MIN_LEAK_CHARS and correct in table.norm_question[row]:
+            yield (game, index), f"{game} 문제{index + 1}: 문제에 정답 포함"
+
+
+@register_rule('missing_news_link', 'warning', weight=5)
+def missing_news_link(table):
+    for row, (game, index) in table.rows():
+        if not table.links[row].startswith(('http://', 'https://')):
+            yield (game, index), f"{game} 문제{index + 1}: newsLink 없음"
+
+
+@register_rule('short_explanation', 'warning', weight=3)
+def short_explanation(table):
+    for row, (game, index) in table.rows():
+        if len(table.explanations[row].strip()) < MIN_EXPLANATION_CHARS:
+            yield (game, index), f"{game} 문제{index + 1}: 해설 부족 ({len(table.explanations[row].strip())}자)"
+
+
+# ===== 평가 =====
+
+def evaluate_quiz(quiz_data: Dict[str, List[Dict[str, Any]]], rules=None) -> Dict[str, Any]:
+    """
+    전체 규칙 실행 → {'valid', 'score', 'errors', 'warnings', 'diagnostics'}
+    score: error가 있으면 0, 없으면 MAX_SCORE - warning 감점 합 (최소 1)
+    diagnostics: [{'rule', 'severity', 'gameType', 'questionIndex'(-1은 게임 단위), 'message'}]
+    """
+    table = QuestionTable(quiz_data)
+    diagnostics = []
+    penalty = 0
+    for name, severity, weight, func in (RULES if rules is None else rules):
+        for (game, index), message in func(table):
+            diagnostics.append({'rule': name, 'severity': severity, 'gameType': game,
+                                'questionIndex': index, 'message': message})
+            if severity == 'warning':
+                penalty += weight
+    errors = [d['message'] for d in diagnostics if d['severity'] == 'error']
+    return {
+        'valid': not errors,
+        'score': 0 if errors else max(MAX_SCORE - penalty, 1),
+        'errors': errors,
+        'warnings': [d['message'] for d in diagnostics if d['severity'] == 'warning'],
+        'diagnostics': diagnostics
+    }
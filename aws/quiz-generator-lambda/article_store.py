@@ -0,0 +1,176 @@
+"""
+BigKinds 기사 저장소 (증분 수집용)
+실행마다 새 기사만 gzip JSONL 세그먼트로 추가하고, index.json에 기사 ID 색인과 수집 최고 수위(high-water mark) 보관
+로컬 디렉토리 또는 s3://bucket/prefix 모두 지원 (S3는 append가 없으므로 세그먼트 단위로 추가)
+
+index.json:
+{
+  "version": 1,
+  "highWater": {"publishedAt": "...", "newsIds": [같은 시각에 수집된 ID들]},
+  "segments": {"seg-...jsonl.gz": {"count": n, "minPublishedAt": "...", "maxPublishedAt": "..."}},
+  "ids": {"news_id": "seg-...jsonl.gz"}
+}
+"""
+
+import gzip
+import json
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+INDEX_VERSION = 1
+INDEX_FILE = 'index.json'
+
+# 저장 필드 (Step 1/URL 매핑/사전 랭킹에 쓰는 필드만)
+STORED_FIELDS = ['news_id', 'title', 'content', 'published_at', 'provider', 'category', 'hilight',
+                 'byline', 'url', 'provider_link_page']
+
+
+class ArticleStore:
+    """세그먼트 기반 gzip JSONL 기사 저장소"""
+
+    def __init__(self, path: str, s3_client=None):
+        self.path = path
+        self._s3 = s3_client
+        if path.startswith('s3://'):
+            self.bucket, _, prefix = path[5:].partition('/')
+            self.prefix = prefix.strip('/')
+        else:
+            self.bucket = None
+            self.root = Path(path)
+        self.index = self._load_index()
+
+    # ===== 저장소 I/O =====
+
+    def _client(self):
+        if self._s3 is None:
+            import boto3
+            self._s3 = boto3.client('s3')
+        return self._s3
+
+    def _key(self, name: str) -> str:
+        return f'{self.prefix}/{name}' if self.prefix else name
+
+    def _read(self, name: str) -> Optional[bytes]:
+        if self.bucket:
+            try:
+                return self._client().get_object(Bucket=self.bucket, Key=self._key(name))['Body'].read()
+            except self._client().exceptions.NoSuchKey:
+                return None
+        path = self.root / name
+        return path.read_bytes() if path.exists() else None
+
+    def _write(self, name: str, data: bytes) -> None:
+        if self.bucket:
+            self._client().put_object(Bucket=self.bucket, Key=self._key(name), Body=data)
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f'.{name}.tmp'
+        tmp.write_bytes(data)
+        tmp.replace(self.root / name)  # 원자적 교체 (중간 실패 시 기존 파일 유지)
+
+    def _delete(self, name: str) -> None:
+        if self.bucket:
+            self._client().delete_object(Bucket=self.bucket, Key=self._key(name))
+        else:
+            (self.root / name).unlink(missing_ok=True)
+
+    def _load_index(self) -> Dict[str, Any]:
+        data = self._read(INDEX_FILE)
+        if data:
+            index = json.loads(data)
+            if index.get('version') == INDEX_VERSION:
+                return index
+        return {'version': INDEX_VERSION, 'highWater': {'publishedAt': '', 'newsIds': []}, 'segments': {}, 'ids': {}}
+
+    def _save_index(self) -> None:
+        self._write(INDEX_FILE, json.dumps(self.index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    # ===== 조회 =====
+
+    @property
+    def high_water(self) -> Dict[str, Any]:
+        return self.index['highWater']
+
+    def __contains__(self, news_id: str) -> bool:
+        return news_id in self.index['ids']
+
+    def __len__(self) -> int:
+        return len(self.index['ids'])
+
+    def is_seen(self, article: Dict[str, Any]) -> bool:
+        """이미 저장했거나 최고 수위 이전(같은 시각이면 같은 ID)인 기사"""
+        if article.get('news_id') in self.index['ids']:
+            return True
+        published_at = article.get('published_at', '')
+        mark = self.high_water
+        return bool(mark['publishedAt']) and (
+            published_at < mark['publishedAt']
+            or (published_at == mark['publishedAt'] and article.get('news_id') in mark['newsIds'])
+        )
+
+    def recent(self, since: str) -> List[Dict[str, Any]]:
+        """published_at >= since(날짜 또는 ISO 시각)인 기사 최신순 (해당 세그먼트만 읽음)"""
+        articles = []
+        for name, meta in self.index['segments'].items():
+            if meta['maxPublishedAt'] < since:
+                continue
+            articles.extend(a for a in self._read_segment(name) if a.get('published_at', '') >= since)
+        articles.sort(key=lambda a: a.get('published_at', ''), reverse=True)
+        return articles
+
+    def _read_segment(self, name: str) -> Iterable[Dict[str, Any]]:
+        data = self._read(name)
+        if not data:
+            return []
+        return [json.loads(line) for line in gzip.decompress(data).decode('utf-8').splitlines() if line]
+
+    # ===== 추가/정리 =====
+
+    def append(self, articles: List[Dict[str, Any]]) -> int:
+        """새 기사만 세그먼트 하나로 추가하고 색인/최고 수위 갱신 → 추가된 개수"""
+        new = []
+        seen = set()
+        for article in articles:
+            news_id = article.get('news_id')
+            if not news_id or news_id in self.index['ids'] or news_id in seen:
+                continue
+            seen.add(news_id)
+            new.append({field: article[field] for field in STORED_FIELDS if field in article})
+        if not new:
+            return 0
+
+        name = f"seg-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}.jsonl.gz"
+        body = '\n'.join(json.dumps(a, ensure_ascii=False, separators=(',', ':')) for a in new)
+        self._write(name, gzip.compress(body.encode('utf-8')))
+
+        published = sorted(a.get('published_at', '') for a in new)
+        self.index['segments'][name] = {'count': len(new), 'minPublishedAt': published[0], 'maxPublishedAt': published[-1]}
+        for article in new:
+            self.index['ids'][article['news_id']] = name
+
+        newest = published[-1]
+        mark = self.high_water
+        if newest > mark['publishedAt']:
+            mark['publishedAt'] = newest
+            mark['newsIds'] = [a['news_id'] for a in new if a.get('published_at') == newest]
+        elif newest == mark['publishedAt']:
+            mark['newsIds'] = sorted(set(mark['newsIds']) | {a['news_id'] for a in new if a.get('published_at') == newest})
+        self._save_index()
+        return len(new)
+
+    def prune(self, before: str) -> int:
+        """최신 기사가 before보다 오래된 세그먼트 삭제 → 삭제된 기사 수 (최고 수위는 유지)"""
+        removed = 0
+        for name, meta in list(self.index['segments'].items()):
+            if meta['maxPublishedAt'] >= before:
+                continue
+            self._delete(name)
+            del self.index['segments'][name]
+            removed += meta['count']
+        if removed:
+            live = set(self.index['segments'])
+            self.index['ids'] = {news_id: seg for news_id, seg in self.index['ids'].items() if seg in live}
+            self._save_index()
+        return removed
@@ -0,0 +1,271 @@
+"""
+Bedrock 호출 실행 백엔드 (배치 생성용)
+- SyncBackend: 요청마다 invoke_model (스레드 풀, 동시 호출 상한)
+- BedrockBatchBackend: 요청을 JSONL로 묶어 배치 추론 작업(create_model_invocation_job) 제출 → 출력 JSONL 수집
+두 백엔드 모두 invoke_all({recordId: 요청}) → {recordId: 응답 텍스트 또는 Exception}로 교체 가능
+
+배치 추론은 수 분~수 시간 걸리므로 Lambda에서는 기다리지 않고 단계를 나눔:
+  submit(작업 제출) → save_state(실행 상태 저장) → 반환
+  → 작업 완료 이벤트(EventBridge) 또는 재호출 → load_state → job_status → collect(출력 수집) → 다음 라운드
+invoke_all(제출 → 폴링 → 수집)은 로컬/장기 실행 환경용
+
+로컬 테스트: LocalStorage(파일 시스템) + LocalBatchClient(배치 작업 대역)로 S3/Bedrock 없이 같은 경로 실행
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# 상수 정의
+BATCH_S3_URI = os.environ.get('BEDROCK_BATCH_S3_URI', '')  # s3://bucket/prefix
+BATCH_ROLE_ARN = os.environ.get('BEDROCK_BATCH_ROLE_ARN', '')
+BATCH_POLL_SECONDS = int(os.environ.get('BEDROCK_BATCH_POLL_SECONDS', '60'))
+BATCH_TIMEOUT_SECONDS = int(os.environ.get('BEDROCK_BATCH_TIMEOUT_SECONDS', str(24 * 3600)))
+BATCH_MIN_RECORDS = int(os.environ.get('BEDROCK_BATCH_MIN_RECORDS', '100'))  # Bedrock 작업당 최소 레코드 수 (계정 할당량)
+BATCH_JOB_PREFIX = 'g2-quiz'
+STATE_FILE = 'state.json'
+
+TERMINAL_STATUSES = {'Completed', 'PartiallyCompleted', 'Failed', 'Stopped', 'Expired'}
+
+# 요청: {'system': str, 'user': str, 'max_tokens': int}
+Request = Dict[str, Any]
+
+
+def batch_id_from_job_name(job_name: str, job_prefix: str = BATCH_JOB_PREFIX) -> Optional[str]:
+    """작업 이름({job_prefix}-{batchId}-{라운드}) → batchId (형식이 다르면 None)"""
+    match = re.match(rf'^{re.escape(job_prefix)}-([0-9a-f]{{12}})-', job_name or '')
+    return match.group(1) if match else None
+
+
+class BatchJobError(Exception):
+    """배치 작업 실패/시간 초과 또는 레코드 단위 오류"""
+
+
+class SyncBackend:
+    """invoke_model 동기 호출 (스레드 풀로 동시 호출 수 제한)"""
+
+    name = 'sync'
+
+    def __init__(self, invoke: Callable[[str, str, int], str], concurrency: int = 3):
+        self.invoke = invoke
+        self.concurrency = concurrency
+
+    def invoke_all(self, requests: Dict[str, Request]) -> Dict[str, Any]:
+        def run(request):
+            try:
+                return self.invoke(request['system'], request['user'], request['max_tokens'])
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            outputs = executor.map(run, requests.values())
+            return dict(zip(requests.keys(), outputs))
+
+
+class S3Storage:
+    """배치 입출력 저장소 (s3://bucket/prefix 기준 상대 키)"""
+
+    def __init__(self, uri: str, client=None):
+        bucket, _, prefix = uri.replace('s3://', '', 1).partition('/')
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+        if client is None:
+            import boto3
+            client = boto3.client('s3')
+        self.client = client
+
+    def _key(self, key: str) -> str:
+        return f'{self.prefix}/{key}' if self.prefix else key
+
+    def uri(self, key: str) -> str:
+        return f's3://{self.bucket}/{self._key(key)}'
+
+    def put_text(self, key: str, text: str) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=text.encode('utf-8'))
+
+    def get_text(self, key: str) -> str:
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(key))['Body'].read().decode('utf-8')
+
+
+class LocalStorage:
+    """S3Storage 대역 (로컬 디렉토리, URI는 file://)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def uri(self, key: str) -> str:
+        return f'file://{(self.root / key).resolve()}'
+
+    def put_text(self, key: str, text: str) -> None:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+
+    def get_text(self, key: str) -> str:
+        return (self.root / key).read_text(encoding='utf-8')
+
+
+class LocalBatchClient:
+    """
+    Bedrock 배치 추론 API 대역 (create_model_invocation_job / get_model_invocation_job)
+    입력 JSONL의 modelInput마다 invoke_body(body) → 응답 본문 딕셔너리를 호출해
+    Bedrock과 같은 위치/형식({outputUri}{jobId}/{입력 파일명}.out)으로 출력 JSONL 작성
+    """
+
+    def __init__(self, invoke_body: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        self.invoke_body = invoke_body
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _path(uri: str) -> Path:
+        return Path(uri.replace('file://', '', 1))
+
+    def create_model_invocation_job(self, jobName, roleArn, modelId, inputDataConfig, outputDataConfig, **kwargs):
+        job_id = uuid.uuid4().hex[:12]
+        arn = f'arn:aws:bedrock:local:000000000000:model-invocation-job/{job_id}'
+        self.jobs[arn] = {
+            'jobName': jobName,
+            'status': 'Submitted',
+            'input': inputDataConfig['s3InputDataConfig']['s3Uri'],
+            'output': outputDataConfig['s3OutputDataConfig']['s3Uri'],
+            'jobId': job_id
+        }
+        return {'jobArn': arn}
+
+    def get_model_invocation_job(self, jobIdentifier):
+        job = self.jobs[jobIdentifier]
+        if job['status'] == 'Submitted':
+            job['status'] = 'InProgress'
+        elif job['status'] == 'InProgress':
+            self._run(job)
+        return {'jobArn': jobIdentifier, 'status': job['status'], 'message': job.get('message', '')}
+
+    def _run(self, job):
+        input_path = self._path(job['input'])
+        lines = []
+        for line in input_path.read_text(encoding='utf-8').splitlines():
+            record = json.loads(line)
+            try:
+                record['modelOutput'] = self.invoke_body(record['modelInput'])
+            except Exception as e:
+                record['error'] = {'errorCode': 500, 'errorMessage': str(e)}
+            lines.append(json.dumps(record, ensure_ascii=False))
+        output_path = self._path(job['output'].rstrip('/')) / job['jobId'] / f'{input_path.name}.out'
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text('\n'.join(lines), encoding='utf-8')
+        job['status'] = 'Completed'
+
+
+class BedrockBatchBackend:
+    """
+    Bedrock 배치 추론 백엔드
+    요청이 min_records 미만이면(작업 최소 레코드 수 제약) fallback 백엔드로 위임
+    작업 이름: {job_prefix}-{batchId}-{라운드} → 완료 이벤트의 작업 이름으로 실행 상태({batchId}/state.json)를 찾음
+    """
+
+    name = 'batch'
+
+    def __init__(self, storage, client, model_id: str, build_body: Callable[[str, str, int], Dict[str, Any]],
+                 role_arn: str = BATCH_ROLE_ARN, poll_seconds: float = BATCH_POLL_SECONDS,
+                 timeout_seconds: float = BATCH_TIMEOUT_SECONDS, min_records: int = BATCH_MIN_RECORDS,
+                 fallback: Optional[SyncBackend] = None, job_prefix: str = BATCH_JOB_PREFIX):
+        self.storage = storage
+        self.client = client
+        self.model_id = model_id
+        self.build_body = build_body
+        self.role_arn = role_arn
+        self.poll_seconds = poll_seconds
+        self.timeout_seconds = timeout_seconds
+        self.min_records = min_records
+        self.fallback = fallback
+        self.job_prefix = job_prefix
+
+    def uses_job(self, requests: Dict[str, Request]) -> bool:
+        """배치 작업으로 실행할지 (False면 fallback 동기 호출)"""
+        return bool(requests) and (len(requests) >= self.min_records or not self.fallback)
+
+    def job_name(self, batch_id: str, round_name: str) -> str:
+        return f"{self.job_prefix}-{batch_id}-{round_name}"
+
+    # ===== 실행 상태 (Lambda 호출 간 이어서 실행) =====
+
+    def save_state(self, batch_id: str, state: Dict[str, Any]) -> None:
+        self.storage.put_text(f'{batch_id}/{STATE_FILE}', json.dumps(state, ensure_ascii=False))
+
+    def load_state(self, batch_id: str) -> Dict[str, Any]:
+        return json.loads(self.storage.get_text(f'{batch_id}/{STATE_FILE}'))
+
+    # ===== 작업 단계 =====
+
+    def submit(self, requests: Dict[str, Request], job_name: Optional[str] = None) -> Dict[str, Any]:
+        """입력 JSONL 업로드 + 작업 제출 → 작업 핸들 {'jobArn', 'jobName', 'recordIds'} (JSON 저장 가능)"""
+        job_name = job_name or f"{self.job_prefix}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        input_key = f'{job_name}/input.jsonl'
+        self.storage.put_text(input_key, '\n'.join(
+            json.dumps({
+                'recordId': record_id,
+                'modelInput': self.build_body(request['system'], request['user'], request['max_tokens'])
+            }, ensure_ascii=False)
+            for record_id, request in requests.items()
+        ))
+        response = self.client.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=self.model_id,
+            inputDataConfig={'s3InputDataConfig': {'s3Uri': self.storage.uri(input_key), 's3InputFormat': 'JSONL'}},
+            outputDataConfig={'s3OutputDataConfig': {'s3Uri': self.storage.uri(f'{job_name}/output/')}}
+        )
+        return {'jobArn': response['jobArn'], 'jobName': job_name, 'recordIds': list(requests)}
+
+    def job_status(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """작업 상태 1회 조회 → {'status', 'message', 'terminal'}"""
+        response = self.client.get_model_invocation_job(jobIdentifier=job['jobArn'])
+        return {'status': response['status'], 'message': response.get('message', ''),
+                'terminal': response['status'] in TERMINAL_STATUSES}
+
+    def collect(self, job: Dict[str, Any], status: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        종료된 작업의 출력 수집 ({output}/{jobId}/input.jsonl.out)
+        작업 실패 시 모든 레코드, 출력이 없는 레코드는 개별로 BatchJobError
+        """
+        if status['status'] not in ('Completed', 'PartiallyCompleted'):
+            error = BatchJobError(f"배치 작업 실패: {job['jobName']} ({status['status']}) {status['message']}")
+            return {record_id: error for record_id in job['recordIds']}
+
+        job_id = job['jobArn'].rsplit('/', 1)[-1]
+        outputs: Dict[str, Any] = {
+            record_id: BatchJobError(f'출력 없음: {record_id}') for record_id in job['recordIds']
+        }
+        for line in self.storage.get_text(f"{job['jobName']}/output/{job_id}/input.jsonl.out").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('recordId') not in outputs:
+                continue
+            if record.get('modelOutput'):
+                outputs[record['recordId']] = record['modelOutput']['content'][0]['text']
+            else:
+                outputs[record['recordId']] = BatchJobError(str(record.get('error', '알 수 없는 오류')))
+        return outputs
+
+    def invoke_all(self, requests: Dict[str, Request]) -> Dict[str, Any]:
+        """제출 → 완료까지 폴링 → 수집 (로컬/장기 실행용, Lambda는 submit/collect를 호출 간에 나눔)"""
+        if not requests:
+            return {}
+        if not self.uses_job(requests):
+            return self.fallback.invoke_all(requests)
+
+        job = self.submit(requests)
+        deadline = time.monotonic() + self.timeout_seconds
+        while True:
+            status = self.job_status(job)
+            if status['terminal']:
+                return self.collect(job, status)
+            if time.monotonic() > deadline:
+                raise BatchJobError(f"배치 작업 시간 초과: {job['jobName']} ({status['status']})")
+            time.sleep(self.poll_seconds)
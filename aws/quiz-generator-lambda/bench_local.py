@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+퀴즈 파이프라인 CPU 구간 벤치마크
+- 생성기: parse_quiz_output, parse_structured_quiz(도구 입력), find_article_url(제목 매칭), clean_text, validate_quiz,
+  prescreen_articles(사전 랭킹)
+- 조회 API: Quiz.from_item + to_api_json (quiz_model, orjson 사용 가능 시)
+
+사용법:
+    python bench_local.py                    # 전체 실행 후 결과 출력
+    python bench_local.py --check            # bench_baseline.json 대비 회귀 시 exit 1 (기준값이 없으면 이번 결과로 생성)
+    python bench_local.py --save-baseline    # 현재 결과를 기준값으로 저장
+    python bench_local.py --filter parse --scale 200 --rounds 5
+
+비교 값은 같은 실행 안에서 케이스 직전/직후에 잰 기준 작업 대비 배수 (라운드별 배수의 최솟값)
+허용치를 넘고 호출당 증가분이 --min-delta-us 이상인 케이스만 한 번 더 측정해 재현될 때 회귀로 판정
+기준값은 머신/Python 버전 의존적이므로 커밋하지 않음 (.gitignore) → 같은 머신에서 변경 전 코드로
+--save-baseline 실행 후 변경 후 코드로 --check
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+# 현재 디렉토리 + 조회 API 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'quiz-lambda'))
+
+# 환경 변수 설정 (테스트용, AWS 호출 없음)
+os.environ.setdefault('AWS_REGION', 'us-east-1')
+os.environ.setdefault('AWS_DEFAULT_REGION', os.environ['AWS_REGION'])
+
+import lambda_function
+import handler
+from replay_local import make_articles, make_step2_output, make_tool_output
+
+BASELINE_FILE = Path(__file__).parent / 'bench_baseline.json'
+DEFAULT_TOLERANCE = 0.5  # 기준 대비 50% 초과 느려지면 회귀
+DEFAULT_MIN_DELTA_US = 100  # 호출당 증가분(기준값 시간 × 배수 증가)이 이보다 작으면 회귀로 보지 않음 (수십 µs 케이스는 잡음이 지배)
+DEFAULT_ROUNDS = 3  # 케이스별 측정 라운드 (라운드마다 기준 작업과 번갈아 측정)
+MIN_RUN_SECONDS = 0.2
+WARMUP_SECONDS = 0.05  # 측정 전 워밍업 (인터프리터 특수화/CPU 클럭 상승 전 느린 초기 호출 제외)
+
+
+# ===== 코퍼스 =====
+
+def build_url_maps(articles):
+    """step1_screen_articles와 동일한 제목 → URL 매핑"""
+    url_map = {}
+    url_map_normalized = {}
+    for article in articles:
+        data = {
+            'url': article['provider_link_page'].split('?')[0],
+            'publishedDate': article['published_at'],
+            'originalTitle': article['title']
+        }
+        url_map[article['title']] = data
+        url_map_normalized[lambda_function.normalize_title(article['title'])] = data
+    return url_map, url_map_normalized
+
+
+def make_dynamodb_item(question_count, seed=0):
+    """조회 API가 받는 DynamoDB 아이템 (숫자는 Decimal)"""
+    articles = make_articles(max(question_count, 1), seed)
+    return {
+        'PK': 'QUIZ#BlackSwan',
+        'SK': 'DATE#2026-02-06',
+        'gameType': 'BlackSwan',
+        'date': '2026-02-06',
+        'questions': [{
+            'question': f'{a["title"]} 이후 가장 적절한 해석은?',
+            'options': ['단기 유동성 확대', '수출 채산성 개선', '이자 부담 감소', '외국인 자금 유출'],
+            'correctAnswer': Decimal(i % 4),
+            'explanation': a['content'][:300],
+            'newsLink': a['provider_link_page'].split('?')[0],
+            'relatedArticle': {'title': a['title'], 'excerpt': a['content'][:120]}
+        } for i, a in enumerate(articles[:question_count])]
+    }
+
+
+def build_cases(scale):
+    """(이름, 함수) 목록, scale은 대용량 케이스의 세트/문항 수"""
+    articles = make_articles(max(12, scale * 3))
+    url_map, url_map_normalized = build_url_maps(articles)
+    small_map = build_url_maps(articles[:12])
+
+    normal = make_step2_output(articles[:12])
+    large = make_step2_output(articles, sets=scale)
+    crlf = normal.replace('\n', '\r\n')  # 파싱 실패 → 0문항, 재시도 유발 입력
+    truncated = normal[:len(normal) // 2]  # 정답 섹션 없이 잘린 출력
+    headers_only = '🌊 블랙스완 - 연쇄반응 분석\n\n' * 100  # 선택지 없는 헤더 반복 (정규식 백트래킹)
+    unknown_titles = make_step2_output(make_articles(12, seed=5))  # 모든 제목이 매핑에 없음 → 전체 fallback
+
+    noisy = ('![차트](https://img.sedaily.com/a.png) 기준금리 <img src="x.jpg"> 인상 [이미지 제공=연합] '
+             '(사진=뉴스1) 자세한 내용은 https://www.sedaily.com/NewsView/2K0001 참고   ') * 20
+    missing_title = '완전히 다른 주제의 존재하지 않는 기사 제목입니다 테스트'
+
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        parsed_normal = lambda_function.parse_quiz_output(normal, *small_map)
+        parsed_large = lambda_function.parse_quiz_output(large, url_map, url_map_normalized)
+
+    pool = make_articles(lambda_function.PRESCREEN_POOL_SIZE)
+    pool_now = datetime(2026, 2, 7)
+
+    item_small = make_dynamodb_item(2)
+    item_archive = make_dynamodb_item(scale * 10)
+
+    def api_response(item):
+        return handler.Quiz.from_item(item).to_api_json()
+
+    def find_url(title, maps):
+        return lambda: lambda_function.find_article_url(title, *maps)
+
+    structured = make_tool_output(articles[:12])
+    structured_invalid = dict(structured, BlackSwan=[dict(q, correctAnswer='②') for q in structured['BlackSwan']])
+
+    return [
+        ('parse.normal', lambda: lambda_function.parse_quiz_output(normal, *small_map)),
+        (f'parse.large_{scale}sets', lambda: lambda_function.parse_quiz_output(large, url_map, url_map_normalized)),
+        ('parse.crlf', lambda: lambda_function.parse_quiz_output(crlf, *small_map)),
+        ('parse.truncated', lambda: lambda_function.parse_quiz_output(truncated, *small_map)),
+        ('parse.headers_only', lambda: lambda_function.parse_quiz_output(headers_only, *small_map)),
+        ('parse.unknown_titles', lambda: lambda_function.parse_quiz_output(unknown_titles, *small_map)),
+        ('parse.structured', lambda: lambda_function.parse_structured_quiz(structured, *small_map)),
+        ('parse.structured_invalid', lambda: lambda_function.parse_structured_quiz(structured_invalid, *small_map)),
+        ('match.exact', find_url(articles[0]['title'], small_map)),
+        (f'match.miss_{len(url_map)}titles', find_url(missing_title, (url_map, url_map_normalized))),
+        ('clean_text.short', lambda: lambda_function.clean_text('기준금리 인상 이후 시장 반응은?')),
+        ('clean_text.noisy', lambda: lambda_function.clean_text(noisy)),
+        ('validate.normal', lambda: lambda_function.validate_quiz(parsed_normal)),
+        (f'validate.large_{scale}sets', lambda: lambda_function.validate_quiz(parsed_large)),
+        (f'prescreen.pool_{len(pool)}', lambda: lambda_function.prescreen_articles(pool, now=pool_now)),
+        ('api.transform_dumps', lambda: api_response(item_small)),
+        (f'api.transform_dumps_{scale * 10}q', lambda: api_response(item_archive)),
+    ]
+
+
+# ===== 측정 =====
+
+def _reference_workload():
+    """머신 속도 보정용 고정 작업 (문자열/딕셔너리/정규식 위주)"""
+    text = '기준금리 인상 이후 시장 반응 ' * 20
+    counts = {}
+    for word in text.split():
+        counts[word] = counts.get(word, 0) + 1
+    return lambda_function.normalize_title(text), sorted(counts.items())
+
+
+def calibrate():
+    """기준 작업 1회 최소 소요 시간(초)"""
+    return measure(_reference_workload, 5)['best']
+
+
+def warm_up(func):
+    """WARMUP_SECONDS 동안(최소 1회) 반복 실행 → 마지막 1회 소요 시간(초)"""
+    deadline = time.perf_counter() + WARMUP_SECONDS
+    while True:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if start + elapsed >= deadline:
+            return max(elapsed, 1e-7)
+
+
+def measure(func, repeat):
+    """반복 실행 → 호출당 중앙값/최솟값(초), 초당 처리량, 호출당 최대 할당 바이트"""
+    # 워밍업 후 1회 호출 시간으로 한 묶음의 반복 횟수 결정
+    single = warm_up(func)
+    number = max(1, int(MIN_RUN_SECONDS / repeat / single))
+
+    # timeit과 동일하게 측정 중 GC 비활성화
+    gc.collect()
+    gc.disable()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    gc.enable()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(samples)
+    return {'median': median, 'best': min(samples), 'ops': 1 / median, 'peak_bytes': peak, 'number': number}
+
+
+def measure_relative(func, repeat, rounds):
+    """
+    라운드마다 기준 작업 → 케이스 → 기준 작업 순으로 측정, 케이스 최솟값 / 앞뒤 기준 작업 최솟값의 작은 값
+    → 라운드별 배수의 최솟값 (잡음은 느려지는 쪽으로만 작용하므로 부하/클럭 변동이 걸린 라운드는 결과에서 빠짐)
+    """
+    relatives = []
+    results = []
+    reference = calibrate()
+    for _ in range(rounds):
+        result = measure(func, repeat)
+        after = calibrate()
+        relatives.append(result['best'] / min(reference, after))
+        results.append(result)
+        reference = after
+    return {
+        'median': statistics.median(r['median'] for r in results),
+        'best': min(r['best'] for r in results),
+        'ops': statistics.median(r['ops'] for r in results),
+        'peak_bytes': max(r['peak_bytes'] for r in results),
+        'relative': min(relatives),
+        'spread': max(relatives) / min(relatives)
+    }
+
+
+def is_regression(ratio, base, tolerance, min_delta_us):
+    """기준 대비 배수가 허용치를 넘고, 호출당 증가분(기준값 최솟값 × 배수 증가)도 min_delta_us 이상인지"""
+    return ratio > 1 + tolerance and (ratio - 1) * base['best'] * 1e6 >= min_delta_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description='퀴즈 파이프라인 CPU 구간 벤치마크')
+    parser.add_argument('--filter', default='', help='케이스 이름 부분 문자열')
+    parser.add_argument('--scale', type=int, default=50, help='대용량 케이스 크기 (세트 수, 문항 수 ×10)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='케이스별 측정 라운드 (배수는 최솟값)')
+    parser.add_argument('--check', action='store_true', help='기준값 대비 회귀 시 실패')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--min-delta-us', type=float, default=DEFAULT_MIN_DELTA_US,
+                        help='회귀로 판정할 호출당 최소 증가분(µs)')
+    args = parser.parse_args()
+
+    cases = [(name, func) for name, func in build_cases(args.scale) if args.filter in name]
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+
+    print("=" * 88)
+    print(f"{'case':32} {'median':>10} {'ops/s':>10} {'peak alloc':>12} {'spread':>7} {'vs base':>9}")
+    print("=" * 88)
+
+    results = {}
+    regressions = []
+    below_floor = []  # 배수는 허용치를 넘었지만 호출당 증가분이 --min-delta-us 미만 (참고용)
+    for name, func in cases:
+        # 생성기 함수의 진행 로그 출력은 측정에 포함하되 화면에는 표시하지 않음
+        with contextlib.redirect_stdout(open(os.devnull, 'w')):
+            result = measure_relative(func, args.repeat, max(1, args.rounds))
+        # relative: 같은 실행의 기준 작업 대비 배수 (머신/부하 차이에 덜 민감)
+        results[name] = {'median': result['median'], 'best': result['best'],
+                         'relative': result['relative'], 'peak_bytes': result['peak_bytes']}
+
+        delta = ''
+        base = baseline.get(name)
+        if base:
+            ratio = results[name]['relative'] / base['relative']
+            if is_regression(ratio, base, args.tolerance, args.min_delta_us):
+                # 재측정해 재현될 때만 회귀 (일시적 부하로 인한 오탐 방지)
+                with contextlib.redirect_stdout(open(os.devnull, 'w')):
+                    retry = measure_relative(func, args.repeat, max(1, args.rounds))
+                results[name]['relative'] = min(results[name]['relative'], retry['relative'])
+                ratio = results[name]['relative'] / base['relative']
+            delta = f"{(ratio - 1) * 100:+.0f}%"
+            if is_regression(ratio, base, args.tolerance, args.min_delta_us):
+                regressions.append((name, ratio))
+            elif ratio > 1 + args.tolerance:
+                below_floor.append((name, ratio))
+                delta += '*'
+        print(f"{name:32} {result['median'] * 1e6:8.1f}µs {result['ops']:10.0f} "
+              f"{result['peak_bytes'] / 1024:9.1f}KiB {result['spread']:6.2f}x {delta:>9}")
+
+    if args.save_baseline or (args.check and not baseline):
+        baseline.update(results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+        print(f"\n💾 기준값 저장: {BASELINE_FILE.name} ({len(results)}개 케이스, 이 머신 전용 — 커밋하지 않음)")
+
+    if args.check:
+        if regressions:
+            print(f"\n❌ 성능 회귀 ({args.tolerance * 100:.0f}% 초과):")
+            for name, ratio in regressions:
+                print(f"   - {name}: 기준 대비 {ratio:.2f}배")
+            sys.exit(1)
+        if below_floor:
+            print(f"\nℹ️  * 호출당 증가분 {args.min_delta_us:.0f}µs 미만 (잡음 범위, 회귀로 보지 않음): "
+                  + ', '.join(f"{name} {ratio:.2f}배" for name, ratio in below_floor))
+        missing = [name for name in results if name not in baseline]
+        if missing:
+            print(f"\n⚠️  기준값 없는 케이스 (비교 생략): {', '.join(missing)}")
+        print("\n✅ 기준값 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Lambda 콜드 스타트 import 감사 + 예산 검사
+대상별로 새 프로세스에서 `python -X importtime`으로 핸들러 모듈을 import한 뒤 prime()(init 단계 워밍)까지 측정
+- import: 핸들러 모듈 누적 import 시간 (-X importtime, 로컬 실행과 같이 워밍 없음)
+- prime: init 단계 워밍 (boto3 클라이언트 생성 등, SnapStart면 스냅샷 전)
+- init: import + prime = 일반 콜드 스타트에서 첫 요청 전에 쓰는 시간 → COLD_START_BUDGET_MS와 비교
+- deep: SnapStart 스냅샷 전 워밍(prime(deep=True))의 추가 시간 (예산 제외, 참고용)
+
+사용법:
+    python coldstart_local.py                      # 전체 대상 측정, 무거운 import 상위 목록 출력
+    python coldstart_local.py --target chatbot --top 20
+    python coldstart_local.py --check              # 예산 초과 또는 기준값 대비 회귀 시 exit 1
+    python coldstart_local.py --save-baseline      # coldstart_baseline.json 갱신
+
+기준값/예산은 머신 의존적이므로 CI/측정 머신에서 --save-baseline으로 다시 만든 뒤 커밋
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+BASELINE_FILE = Path(__file__).parent / 'coldstart_baseline.json'
+DEFAULT_TOLERANCE = 0.5  # 기준 대비 50% 초과 느려지면 회귀
+
+# 대상: (핸들러 디렉토리, 모듈 이름)
+TARGETS = {
+    'generator': (ROOT / 'aws' / 'quiz-generator-lambda', 'lambda_function'),
+    'quiz-api': (ROOT / 'aws' / 'quiz-lambda', 'handler'),
+    'chatbot': (ROOT / 'backend' / 'lambda', 'enhanced-chatbot-handler')
+}
+
+# init(import + prime) 예산 (ms)
+COLD_START_BUDGET_MS = {
+    'generator': 600,
+    'quiz-api': 500,
+    'chatbot': 800
+}
+
+# 자식 프로세스: import → prime → prime(deep) 시간(초)을 stdout에 JSON 한 줄로
+PROBE = """
+import json, sys, time
+sys.path.insert(0, '.')
+start = time.perf_counter()
+module = __import__({module!r})  # importlib.import_module은 -X importtime에 기록되지 않음
+result = {{'import_wall': time.perf_counter() - start}}
+start = time.perf_counter()
+module.prime(deep=False)
+result['prime'] = time.perf_counter() - start
+start = time.perf_counter()
+try:
+    module.prime(deep=True)
+    result['deep'] = time.perf_counter() - start
+except ImportError as e:
+    result['deep_error'] = str(e)
+print(json.dumps(result))
+"""
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → [(모듈, self µs, 누적 µs, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        head, cumulative_us, name = line.split('|', 2)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2  # 구분자 뒤 공백 1칸 + 깊이당 2칸
+        rows.append((name.strip(), int(head.split(':')[1]), int(cumulative_us), depth))
+    return rows
+
+
+def probe(target):
+    """새 프로세스 1회 측정 → (결과 dict, importtime 행)"""
+    directory, module = TARGETS[target]
+    env = dict(os.environ, PRIME_ON_INIT='false', TRACE_OUTPUT='off', LOG_LEVEL='ERROR')
+    env.setdefault('AWS_REGION', 'us-east-1')
+    env.setdefault('AWS_DEFAULT_REGION', env['AWS_REGION'])
+    env.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE.format(module=module)],
+                               cwd=directory, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{target} 측정 실패:\n{completed.stderr.strip().splitlines()[-1]}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    rows = parse_importtime(completed.stderr)
+    # 핸들러 모듈 행 (import 중 로드된 모듈의 누적 시간 포함)
+    result['import'] = next(cumulative for name, _, cumulative, depth in rows
+                            if name == module and depth == 0) / 1e6
+    return result, rows
+
+
+def heaviest(rows, module, top):
+    """핸들러 import 중 로드된 모듈 중 누적 시간 상위 (직계 하위 모듈 기준)"""
+    # importtime은 자식이 부모보다 먼저 출력됨 → 핸들러 행 이전의 depth 1 행이 직계 import
+    end = next(i for i, (name, _, _, depth) in enumerate(rows) if name == module and depth == 0)
+    start = max((i for i in range(end) if rows[i][3] == 0), default=-1) + 1
+    direct = [r for r in rows[start:end] if r[3] == 1]
+    return sorted(direct, key=lambda r: -r[2])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lambda 콜드 스타트 import 감사')
+    parser.add_argument('--target', choices=list(TARGETS), action='append', help='대상 (반복 가능, 기본 전체)')
+    parser.add_argument('--runs', type=int, default=5, help='대상별 새 프로세스 측정 횟수 (중앙값)')
+    parser.add_argument('--top', type=int, default=8, help='무거운 import 상위 개수')
+    parser.add_argument('--check', action='store_true', help='예산 초과/기준값 대비 회귀 시 실패')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    results = {}
+    failures = []
+
+    for target in args.target or list(TARGETS):
+        runs = [probe(target) for _ in range(args.runs)]
+        samples = [r for r, _ in runs]
+        median = {key: statistics.median(s[key] for s in samples) for key in ('import', 'prime')}
+        median['init'] = median['import'] + median['prime']
+        if all('deep' in s for s in samples):
+            median['deep'] = statistics.median(s['deep'] for s in samples)
+        results[target] = {key: round(value * 1000, 2) for key, value in median.items()}
+
+        budget = COLD_START_BUDGET_MS[target]
+        init_ms = results[target]['init']
+        print("=" * 72)
+        print(f"{target}: init {init_ms:.1f}ms (import {results[target]['import']:.1f}ms + "
+              f"prime {results[target]['prime']:.1f}ms) / 예산 {budget}ms")
+        if 'deep' in results[target]:
+            print(f"   SnapStart 스냅샷 전 추가 워밍(deep): {results[target]['deep']:.1f}ms")
+        else:
+            print(f"   deep 워밍 실패: {samples[0].get('deep_error')}")
+        base = baseline.get(target)
+        if base:
+            ratio = init_ms / base['init']
+            print(f"   기준값 대비 {(ratio - 1) * 100:+.0f}% (기준 {base['init']:.1f}ms)")
+            if ratio > 1 + args.tolerance:
+                failures.append(f"{target}: 기준 대비 {ratio:.2f}배")
+        if init_ms > budget:
+            failures.append(f"{target}: 예산 초과 ({init_ms:.1f}ms > {budget}ms)")
+
+        print(f"   {'무거운 import':40} {'누적':>10} {'self':>10}")
+        for name, self_us, cumulative_us, _ in heaviest(runs[-1][1], TARGETS[target][1], args.top):
+            print(f"   {name:40} {cumulative_us / 1000:8.1f}ms {self_us / 1000:8.1f}ms")
+
+    if args.save_baseline:
+        baseline.update(results)
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+        print(f"\n💾 기준값 저장: {BASELINE_FILE.name} ({len(results)}개 대상)")
+
+    if args.check:
+        if failures:
+            print(f"\n❌ 콜드 스타트 예산/회귀 실패:")
+            for failure in failures:
+                print(f"   - {failure}")
+            sys.exit(1)
+        print("\n✅ 콜드 스타트 예산 이내, 기준값 대비 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
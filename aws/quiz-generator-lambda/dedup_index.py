@@ -0,0 +1,133 @@
+"""
+최근 퀴즈 중복 탐지 색인 (MinHash + LSH)
+최근 N일 퀴즈의 관련 기사 제목과 문항(문제 + 선택지)을 문자 n-gram MinHash 서명으로 색인
+- 서명: 단일 해시 + 구간 분할(one permutation hashing) 후 빈 구간 채움(densification) → n-gram 1회 순회
+- 조회: 밴드 버킷으로 후보만 찾은 뒤 서명 일치율(자카드 유사도 추정)로 확인 → 색인 크기와 무관
+- 실행당 1회 DynamoDB에서 읽어 생성 (build_from_items)
+
+기본값(64 해시, 16밴드 × 4행)은 유사도 0.5에서 후보 포함 확률 ~64%, 0.7에서 ~98%
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 상수 정의
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.6
+_MIX = 0x9E3779B1  # crc32 비트 혼합용 홀수 곱수 (Knuth)
+_MASK = (1 << 32) - 1
+_EMPTY = 1 << 32
+_NORMALIZE = re.compile(r'[\s\W_]+')
+
+KIND_ARTICLE = 'article'
+KIND_QUESTION = 'question'
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """공백/문장부호를 제거한 문자 n-gram 해시 집합 (한국어는 띄어쓰기 차이가 흔하므로 문자 단위)"""
+    normalized = _NORMALIZE.sub('', text.lower())
+    if len(normalized) <= size:
+        return {zlib.crc32(normalized.encode('utf-8'))} if normalized else set()
+    return {zlib.crc32(normalized[i:i + size].encode('utf-8')) for i in range(len(normalized) - size + 1)}
+
+
+def question_text(question: Dict[str, Any]) -> str:
+    """문항 비교용 텍스트 (문제 + 선택지)"""
+    return ' '.join([question.get('question', '')] + list(question.get('options', [])))
+
+
+def article_title(question: Dict[str, Any]) -> str:
+    """문항의 관련 기사 제목 (레거시 articleTitle 포함)"""
+    return (question.get('relatedArticle') or {}).get('title') or question.get('articleTitle', '')
+
+
+class DuplicateIndex:
+    """MinHash 서명 + LSH 밴드 버킷 색인"""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, threshold: float = DEFAULT_THRESHOLD):
+        if num_perm % bands:
+            raise ValueError('num_perm은 bands의 배수여야 합니다')
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        self._entries: List[Tuple[str, Tuple[int, ...], Dict[str, Any]]] = []  # (kind, 서명, 메타)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        hashes = shingles(text)
+        if not hashes:
+            return None
+        k = self.num_perm
+        bins = [_EMPTY] * k
+        for h in hashes:
+            mixed = (h * _MIX) & _MASK
+            position, value = mixed % k, mixed // k
+            if value < bins[position]:
+                bins[position] = value
+        if _EMPTY not in bins:
+            return tuple(bins)
+        # 빈 구간은 오른쪽으로 가장 가까운 채워진 구간 값 + 거리 (두 텍스트에 같은 규칙 → 일치 확률 유지)
+        signature = list(bins)
+        for position in range(k):
+            if bins[position] == _EMPTY:
+                step = 1
+                while bins[(position + step) % k] == _EMPTY:
+                    step += 1
+                signature[position] = bins[(position + step) % k] + step * _EMPTY
+        return tuple(signature)
+
+    def _band_keys(self, kind: str, signature: Tuple[int, ...]) -> Iterable[Tuple[str, int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            yield kind, band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, kind: str, text: str, meta: Dict[str, Any]) -> None:
+        signature = self.signature(text)
+        if signature is None:
+            return
+        entry_id = len(self._entries)
+        self._entries.append((kind, signature, meta))
+        for key in self._band_keys(kind, signature):
+            self._buckets[key].append(entry_id)
+
+    def query(self, kind: str, text: str, threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """유사도 threshold 이상인 색인 항목 메타 (+ similarity), 유사도 내림차순"""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        threshold = self.threshold if threshold is None else threshold
+        candidates = set()
+        for key in self._band_keys(kind, signature):
+            candidates.update(self._buckets.get(key, ()))
+        matches = []
+        for entry_id in candidates:
+            _, other, meta = self._entries[entry_id]
+            similarity = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+            if similarity >= threshold:
+                matches.append(dict(meta, similarity=round(similarity, 3)))
+        return sorted(matches, key=lambda m: -m['similarity'])
+
+    def add_quiz_item(self, item: Dict[str, Any]) -> None:
+        """DynamoDB 퀴즈 아이템 1개(게임 1개, 날짜 1개)의 기사 제목/문항 색인"""
+        titles = set()
+        for position, question in enumerate(item.get('questions', [])):
+            meta = {'date': item.get('date'), 'gameType': item.get('gameType'), 'questionIndex': position}
+            title = article_title(question)
+            if title and title not in titles:
+                titles.add(title)
+                self.add(KIND_ARTICLE, title, dict(meta, title=title))
+            self.add(KIND_QUESTION, question_text(question), dict(meta, question=question.get('question', '')))
+
+
+def build_from_items(items: Iterable[Dict[str, Any]], threshold: float = DEFAULT_THRESHOLD) -> DuplicateIndex:
+    index = DuplicateIndex(threshold=threshold)
+    for item in items:
+        index.add_quiz_item(item)
+    return index
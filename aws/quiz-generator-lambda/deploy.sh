@@ -27,7 +27,9 @@ pip install -r requirements.txt -t package/ --quiet
 
 # 3. Lambda 함수 코드 복사
 echo "📄 Lambda 함수 복사 중..."
-cp lambda_function.py package/
+cp lambda_function.py tracing.py structured_log.py bedrock_batch.py article_store.py prescreen.py dedup_index.py quiz_schema.py package/
+cp ../../backend/lambda/metrics.py package/  # 공용 EMF 메트릭 모듈
+cp ../layers/quiz-common/python/*.py package/  # quiz-common 레이어 소스 (공용 모델, 품질 규칙, init 워밍)
 
 # 4. 프롬프트 파일 복사
 echo "📝 프롬프트 파일 복사 중..."
@@ -96,6 +98,8 @@ echo "2. Configuration → Environment variables 설정:"
 echo "   - BIGKINDS_API_KEY: (당신의 API 키)"
 echo "   - DYNAMODB_TABLE: sedaily-quiz-data"
 echo "   - AWS_REGION: us-east-1"
+echo "   - ARTICLE_STORE_PATH: s3://bucket/articles (선택, 증분 기사 수집 — S3 Get/Put/DeleteObject 권한 필요)"
+echo "   - PRIME_ON_INIT: auto (선택, init 단계에서 boto3 클라이언트/프롬프트 워밍 — false면 첫 사용 시 생성)"
 echo ""
 echo "3. Configuration → Permissions에서 IAM 역할 권한 확인:"
 echo "   - Bedrock InvokeModel 권한"
@@ -105,3 +109,13 @@ echo "4. EventBridge 규칙 생성:"
 echo "   - Schedule: cron(0 21 * * ? *)"
 echo "   - Target: $FUNCTION_NAME"
 echo ""
+echo "5. (선택) Bedrock 배치 추론 백엔드 (event.backend = \"batch\"):"
+echo "   - 환경 변수: BEDROCK_BATCH_S3_URI (s3://bucket/prefix), BEDROCK_BATCH_ROLE_ARN, BEDROCK_BATCH_MIN_RECORDS (기본 100)"
+echo "   - Lambda 역할 권한: BEDROCK_BATCH_S3_URI/BEDROCK_BATCH_ROLE_ARN을 설정하고 ./setup-iam.sh 실행"
+echo "     (iam:PassRole, 배치 버킷 S3 Get/PutObject/ListBucket, bedrock:Create/GetModelInvocationJob)"
+echo "   - EventBridge 규칙 (작업 완료 시 이어서 실행):"
+echo "       Event pattern: {\"source\": [\"aws.bedrock\"], \"detail-type\": [\"Batch Inference Job State Change\"],"
+echo "                       \"detail\": {\"status\": [\"Completed\", \"PartiallyCompleted\", \"Failed\", \"Stopped\", \"Expired\"]}}"
+echo "       Target: $FUNCTION_NAME"
+echo "   - 이벤트를 놓쳤으면 수동 재개: {\"mode\": \"batch\", \"resume\": \"<batchId>\"}"
+echo ""
@@ -5,87 +5,224 @@ BigKinds API → Step1 스크리닝 → Step2 문제 제작 → DynamoDB 저장
 """
 
 import os
+import re
+import sys
 import json
-import boto3
-import requests
-from datetime import datetime, timedelta
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    from metrics import MetricsLogger
+except ImportError:
+    # 로컬 실행: 챗봇 백엔드의 공용 모듈 사용 (배포 시 deploy.sh가 패키지에 복사)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'backend' / 'lambda'))
+    from metrics import MetricsLogger
+try:
+    from quiz_model import Question, Quiz
+except ImportError:
+    # 로컬 실행: quiz-common 레이어 소스 사용 (배포 시 deploy.sh가 패키지에 복사)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'layers' / 'quiz-common' / 'python'))
+    from quiz_model import Question, Quiz
+from lambda_init import register_priming
+from tracing import Tracer
+from structured_log import StructuredLogger
+from article_store import ArticleStore
+from prescreen import ArticleRanker
+from quiz_rules import evaluate_quiz
+from quiz_schema import QUESTION_SCHEMA, QUIZ_TOOL, check_schema
+from dedup_index import KIND_ARTICLE, KIND_QUESTION, build_from_items, question_text
+
 # 설정
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 BEDROCK_MODEL_ID = 'anthropic.claude-3-haiku-20240307-v1:0'  # Claude 3 Haiku (빠르고 안정적)
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'sedaily-quiz-data')
 BIGKINDS_API_KEY = os.environ.get('BIGKINDS_API_KEY')
+PREGENERATE_EXPLAINERS = os.environ.get('PREGENERATE_EXPLAINERS', 'false').lower() == 'true'
+
+# 배치 생성 (기간 × 에디션)
+BATCH_CONCURRENCY = int(os.environ.get('BATCH_CONCURRENCY', '3'))  # 동시 Bedrock 호출 상한
+BATCH_MAX_DAYS = 31  # sync 백엔드 (한 번의 호출 안에서 완료)
+BATCH_JOB_MAX_DAYS = int(os.environ.get('BATCH_JOB_MAX_DAYS', '366'))  # batch 백엔드 (작업 제출 후 완료 이벤트로 이어서 실행)
+BATCH_MAX_RETRIES = 2  # Step 2 검증 실패 건 재시도 라운드
+BIGKINDS_PAGE_SIZE = 100
+ARTICLE_WINDOW_DAYS = 7  # 날짜별 후보 기사 범위 (fetch_bigkinds_news와 동일)
+
+# 증분 기사 수집 (설정 시 새 기사만 받아 저장소에 누적, 로컬 디렉토리 또는 s3://bucket/prefix)
+ARTICLE_STORE_PATH = os.environ.get('ARTICLE_STORE_PATH', '')
+ARTICLE_STORE_RETENTION_DAYS = int(os.environ.get('ARTICLE_STORE_RETENTION_DAYS', '30'))
+
+# Step 1 사전 랭킹 (후보 PRESCREEN_POOL_SIZE개 중 게임별 상위 PRESCREEN_TOP_K개만 모델에 전달, 0이면 끔)
+PRESCREEN_TOP_K = int(os.environ.get('PRESCREEN_TOP_K', '4'))
+PRESCREEN_POOL_SIZE = int(os.environ.get('PRESCREEN_POOL_SIZE', '100'))
+STEP1_ARTICLE_COUNT = PRESCREEN_POOL_SIZE if PRESCREEN_TOP_K else 12
+
+# 최근 퀴즈 중복 탐지 (최근 DEDUP_LOOKBACK_DAYS일 기사 제목/문항과 유사도 비교, 0이면 끔)
+DEDUP_LOOKBACK_DAYS = int(os.environ.get('DEDUP_LOOKBACK_DAYS', '7'))
+DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', '0.6'))
+
+# Step 2 동시 후보 생성 (1이면 기존 순차 재시도, N이면 온도를 달리해 N개 동시 생성)
+STEP2_CANDIDATES = int(os.environ.get('STEP2_CANDIDATES', '1'))
+STEP2_SELECTION = os.environ.get('STEP2_SELECTION', 'first')  # first: 가장 먼저 통과한 후보 | best: 전부 받아 최고 점수
+STEP2_TEMPERATURES = [0.7, 0.9, 0.5, 1.0]  # 후보별 temperature (순환)
+DEFAULT_TEMPERATURE = 0.7
+
+# 품질 점수 하한 (quiz_rules 점수 0~100, 통과했더라도 미달이면 재시도/다음 후보, 끝까지 미달이면 최고 점수 채택)
+QUIZ_MIN_SCORE = int(os.environ.get('QUIZ_MIN_SCORE', '0'))
+
+# Step 2 출력 형식 (text: 이모지 텍스트 → parse_quiz_output | tool: submit_quiz 도구 입력 → 스키마 검사 후 변환)
+STEP2_OUTPUT_FORMAT = os.environ.get('STEP2_OUTPUT_FORMAT', 'text')
+GAME_TYPES = ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']
+
+# 난이도 에디션 (standard 외 에디션은 PK에 접미사: QUIZ#{gameType}#{edition})
+DEFAULT_EDITION = 'standard'
+EDITION_INSTRUCTIONS = {
+    'standard': '',
+    'easy': '경제 기초 지식만으로 풀 수 있는 쉬운 난이도로 출제하세요. 전문 용어는 문제 안에서 짧게 풀어 설명하세요.',
+    'hard': '여러 단계의 추론과 경제 원리 적용이 필요한 높은 난이도로 출제하세요. 오답 선택지도 그럴듯하게 구성하세요.'
+}
+
+# AWS 클라이언트 (첫 사용 시 생성, Lambda에서는 init 단계의 prime()에서 미리 생성)
+# boto3/botocore import만 ~170ms이므로 파싱/검증만 쓰는 로컬 테스트·벤치마크는 로드하지 않음
+bedrock = None
+dynamodb = None
+_client_lock = threading.Lock()  # 후보 동시 생성 스레드가 기본 boto3 세션을 동시에 쓰지 않도록
+
+KST = timezone(timedelta(hours=9))
+_TITLE_NORMALIZE = re.compile(r'[^\w가-힣]')
+_CLEAN_PATTERNS = [
+    re.compile(r'!\[.*?\]\(.*?\)'),  # Markdown 이미지
+    re.compile(r'<img[^>]*>'),  # HTML 이미지
+    re.compile(r'\[이미지.*?\]'),  # [이미지] 텍스트
+    re.compile(r'\(사진.*?\)'),  # (사진...) 텍스트
+    re.compile(r'https?://[^\s]+')  # URL (https://www.sedaily.com 등)
+]
+_WHITESPACE = re.compile(r'\s+')
+
+# 호출 단위 EMF 메트릭 (실행 종료 시 로그로 일괄 출력)
+metrics = MetricsLogger('G2/QuizGenerator')
+
+# 실행 단위 트레이스 (단계별 span, 실행 종료 시 OTLP JSON 한 건 출력)
+tracer = Tracer('sedaily-quiz-generator')
+
+# 구조화 JSON 로그 (LOG_LEVEL, LOG_DEBUG_SAMPLE_RATE 환경 변수로 조정)
+log = StructuredLogger('quiz-generator')
+
+
+def _get_bedrock():
+    global bedrock
+    with _client_lock:
+        if bedrock is None:
+            import boto3
+            from botocore.config import Config
+            
+            bedrock_config = Config(
+                read_timeout=300,  # 5분
+                connect_timeout=60,
+                retries={'max_attempts': 3, 'mode': 'adaptive'}  # 배치 동시 호출 시 스로틀링에 맞춰 클라이언트 측 속도 조절
+            )
+            bedrock = boto3.client('bedrock-runtime', region_name=AWS_REGION, config=bedrock_config)
+    return bedrock
+
 
-# AWS 클라이언트 (타임아웃 설정)
-from botocore.config import Config
+def _get_dynamodb():
+    global dynamodb
+    with _client_lock:
+        if dynamodb is None:
+            import boto3
+            dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+    return dynamodb
 
-bedrock_config = Config(
-    read_timeout=300,  # 5분
-    connect_timeout=60,
-    retries={'max_attempts': 3}
-)
 
-bedrock = boto3.client('bedrock-runtime', region_name=AWS_REGION, config=bedrock_config)
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+def prime(deep=False):
+    """
+    init 단계 워밍 (lambda_init.register_priming, 네트워크 호출 없음)
+    모든 실행에 필요한 boto3 클라이언트/requests와 Step 1·2 프롬프트 파일, 사전 랭킹기를 미리 준비
+    deep: SnapStart 스냅샷 전 → 배치 모드 전용 모듈까지 로드
+    """
+    import requests  # noqa: F401 (BigKinds 호출용, 모듈 캐시에 로드)
+    _get_bedrock()
+    _get_dynamodb()
+    for step in ('step1', 'step2'):
+        load_prompt_files(Path(__file__).parent / 'prompts' / step)
+    if PRESCREEN_TOP_K:
+        _get_ranker()
+    if deep:
+        import bedrock_batch  # noqa: F401
+        from boto3.dynamodb.conditions import Key  # noqa: F401
 
 
 def lambda_handler(event, context):
     """
     Lambda 메인 핸들러
     EventBridge에서 매일 자동 호출
+    event['mode'] == 'batch'이면 기간 × 에디션 일괄 생성 (batch_handler)
+    Bedrock 배치 추론 작업 상태 변경 이벤트(source: aws.bedrock)는 제출한 배치 생성을 이어서 실행
+    event['step2Candidates']로 Step 2 동시 후보 수 지정 가능 (기본 STEP2_CANDIDATES)
     """
-    print("=" * 60)
-    print("🎮 서울경제 AI GAMES - 퀴즈 자동 생성 시작")
-    print("=" * 60)
+    if event.get('mode') == 'batch' or event.get('source') == 'aws.bedrock':
+        return batch_handler(event, context)
     
     max_retries = 2  # 최대 재시도 횟수
+    run_id = log.start_run(getattr(context, 'aws_request_id', None))
+    metrics.reset()
+    metrics.set_property('runId', run_id)
+    run_start = time.perf_counter()
+    tracer.start_trace('lambda_handler', **{'faas.coldstart': _cold_start(), 'max_retries': max_retries, 'run_id': run_id})
+    log.info("퀴즈 자동 생성 시작", traceId=tracer.trace_id)
+    error_message = None
     
     try:
+        # KST 기준 날짜 사용 (UTC+9)
+        today = datetime.now(KST).strftime('%Y-%m-%d')
+        
         # 1. BigKinds에서 뉴스 가져오기
-        articles = fetch_bigkinds_news(count=12)
+        with metrics.timer('BigKindsLatency'), tracer.span('bigkinds.fetch') as span:
+            articles = fetch_bigkinds_news(count=STEP1_ARTICLE_COUNT)
+            span.set_attribute('article_count', len(articles))
+        
+        # 1-1. 최근 퀴즈에 이미 쓰인 기사 제외
+        with tracer.span('dedup.filter_articles') as span:
+            duplicate_index = load_duplicate_index(today)
+            articles = drop_duplicate_articles(articles, duplicate_index)
+            span.set_attribute('article_count', len(articles))
         
         # 2. Step 1: 기사 스크리닝
-        screening_result, article_url_maps = step1_screen_articles(articles)
+        with metrics.timer('Step1Latency'), tracer.span('step1.screen'):
+            screening_result, article_url_maps = step1_screen_articles(articles)
         article_url_map, article_url_map_normalized = article_url_maps
         
-        # 3. Step 2: 문제 제작 (재시도 로직)
-        quiz_data = None
-        for attempt in range(max_retries + 1):
-            quiz_output = step2_generate_quiz(screening_result, retry_count=attempt, max_retries=max_retries)
-            
-            # 4. JSON 파싱
-            quiz_data = parse_quiz_output(quiz_output, article_url_map, article_url_map_normalized)
-            
-            # 5. 품질 검증
-            is_valid, errors = validate_quiz(quiz_data)
-            
-            if is_valid:
-                print(f"✅ 시도 {attempt + 1}에서 성공!")
-                break
-            else:
-                if attempt < max_retries:
-                    print(f"⚠️ 시도 {attempt + 1} 실패. 재시도 중...")
-                else:
-                    raise Exception(f"품질 검증 실패 (최대 재시도 초과): {errors}")
+        # 3~5. Step 2: 문제 제작 → 파싱 → 품질 검증 (재시도 로직)
+        quiz_data, attempts = generate_quiz(screening_result, article_url_map, article_url_map_normalized,
+                                            max_retries=max_retries,
+                                            candidates=int(event.get('step2Candidates', STEP2_CANDIDATES)))
         
-        # 6. DynamoDB 저장
-        # KST 기준 날짜 사용 (UTC+9)
-        from datetime import timezone
-        kst = timezone(timedelta(hours=9))
-        today = datetime.now(kst).strftime('%Y-%m-%d')
-        save_to_dynamodb(quiz_data, today)
+        # 5-1. (선택) 챗봇용 해설 답변 사전 생성
+        if event.get('pregenerateExplainers', PREGENERATE_EXPLAINERS):
+            with metrics.timer('ExplainerLatency'), tracer.span('step3.explainers'):
+                step3_generate_explainers(quiz_data)
+        
+        # 6. DynamoDB 저장 (최근 퀴즈와 유사한 문항은 duplicateOf 표시)
+        metrics.put_metric('DuplicateQuestions', flag_duplicate_questions(quiz_data, duplicate_index))
+        with metrics.timer('DynamoDBLatency'), tracer.span('dynamodb.save', date=today):
+            save_to_dynamodb(quiz_data, today)
+        tracer.root.set_attribute('attempts', attempts)
+        metrics.put_metric('GenerationAttempts', attempts)
+        metrics.put_metric('GenerationSuccess', 1)
         
-        print("\n" + "=" * 60)
-        print("✅ 전체 프로세스 완료!")
-        print("=" * 60)
+        log.info("퀴즈 생성 완료", date=today, attempts=attempts,
+                 questions={game: len(questions) for game, questions in quiz_data.items()},
+                 durationMs=round((time.perf_counter() - run_start) * 1000, 2))
         
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': '퀴즈 생성 완료',
                 'date': today,
-                'attempts': attempt + 1,
+                'attempts': attempts,
                 'questions': {
                     'BlackSwan': len(quiz_data.get('BlackSwan', [])),
                     'PrisonersDilemma': len(quiz_data.get('PrisonersDilemma', [])),
@@ -95,23 +232,479 @@ def lambda_handler(event, context):
         }
         
     except Exception as e:
-        print(f"\n❌ 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("퀴즈 생성 실패", error=str(e))
         
+        metrics.put_metric('GenerationError', 1)
+        error_message = str(e)
         return {
             'statusCode': 500,
             'body': json.dumps({
                 'error': str(e)
             }, ensure_ascii=False)
         }
+    
+    finally:
+        metrics.put_metric('TotalLatency', round((time.perf_counter() - run_start) * 1000, 2), 'Milliseconds')
+        metrics.flush()
+        tracer.finish(error=error_message)
+
+
+def generate_quiz(screening_result, article_url_map, article_url_map_normalized,
+                  edition=DEFAULT_EDITION, max_retries=2, candidates=None):
+    """
+    Step 2 문제 제작 → 파싱 → 품질 검증 (검증 실패 시 재시도)
+    candidates > 1이면 generate_quiz_candidates로 동시 생성
+    반환: (quiz_data, 시도 횟수), 최대 재시도 초과 시 예외
+    """
+    candidates = STEP2_CANDIDATES if candidates is None else candidates
+    if candidates > 1:
+        return generate_quiz_candidates(screening_result, article_url_map, article_url_map_normalized,
+                                        edition, candidates, max_generations=max_retries + 1)
+    
+    best = None  # 통과했지만 QUIZ_MIN_SCORE 미달인 결과 중 최고 (점수, quiz_data)
+    for attempt in range(max_retries + 1):
+        with metrics.timer('Step2Latency'), tracer.span('step2.generate', attempt=attempt + 1, edition=edition):
+            quiz_output = step2_generate_quiz(screening_result, retry_count=attempt, max_retries=max_retries,
+                                              edition=edition)
+        
+        # 4. 텍스트 파싱
+        with tracer.span('step2.parse', attempt=attempt + 1) as span:
+            quiz_data = parse_step2_output(quiz_output, article_url_map, article_url_map_normalized)
+            span.set_attribute('question_count', sum(len(q) for q in quiz_data.values()))
+        
+        # 5. 품질 검증
+        with tracer.span('step2.validate', attempt=attempt + 1) as span:
+            report = check_quiz(quiz_data)
+            span.set_attribute('valid', report['valid'])
+            span.set_attribute('score', report['score'])
+            span.set_attribute('error_count', len(report['errors']))
+        errors = report['errors']
+        
+        if report['valid'] and report['score'] >= QUIZ_MIN_SCORE:
+            log.info("품질 검증 통과", attempt=attempt + 1, edition=edition, score=report['score'])
+            return quiz_data, attempt + 1
+        if report['valid'] and (best is None or report['score'] > best[0]):
+            best = (report['score'], quiz_data)
+        if attempt < max_retries:
+            log.warning("품질 검증 실패, 재시도", attempt=attempt + 1, edition=edition, score=report['score'],
+                        errors=errors or report['warnings'])
+    
+    if best:
+        log.warning("최소 점수 미달, 최고 점수 결과 채택", score=best[0], minScore=QUIZ_MIN_SCORE, edition=edition)
+        return best[1], max_retries + 1
+    raise Exception(f"품질 검증 실패 (최대 재시도 초과): {errors}")
+
+
+def _bind_run(fn):
+    """작업 스레드용: fn을 현재 실행의 메트릭/트레이스/로그 runId에 묶음 (실행보다 늦게 끝나는 스레드 대비)"""
+    return log.bind(tracer.bind(metrics.bind(fn)))
+
+
+def generate_quiz_candidates(screening_result, article_url_map, article_url_map_normalized,
+                             edition=DEFAULT_EDITION, candidates=3, max_generations=3, selection=None):
+    """
+    Step 2를 temperature를 달리해 candidates개 동시 생성, 도착 순서대로 파싱/검증
+    - first: 처음 통과한(점수 QUIZ_MIN_SCORE 이상) 후보 채택, 나머지는 버림 (시작 전이면 취소, 호출 중이면 결과 무시)
+    - best: 모든 후보를 받아 품질 점수 최고 후보 채택
+    전부 실패하면 생성 횟수가 max_generations(순차 재시도와 같은 토큰 상한)에 닿을 때까지 다음 라운드
+    반환: (quiz_data, 검증한 생성 수), 실패 시 예외
+    """
+    selection = selection or STEP2_SELECTION
+    generated = 0
+    errors = []
+    best = None  # (점수, temperature, quiz_data)
+    round_number = 0
+    while generated < max_generations:
+        round_number += 1
+        count = min(candidates, max_generations - generated)
+        temperatures = [STEP2_TEMPERATURES[(generated + i) % len(STEP2_TEMPERATURES)] for i in range(count)]
+        with metrics.timer('Step2Latency'), tracer.span('step2.candidates', round=round_number, count=count,
+                                                        selection=selection, edition=edition) as span:
+            executor = ThreadPoolExecutor(max_workers=count)
+            generate = _bind_run(step2_generate_quiz)
+            futures = {
+                executor.submit(generate, screening_result, retry_count=generated + i,
+                                max_retries=max_generations - 1, edition=edition, temperature=temperature): temperature
+                for i, temperature in enumerate(temperatures)
+            }
+            try:
+                for future in as_completed(futures):
+                    generated += 1
+                    try:
+                        quiz_output = future.result()
+                    except Exception as e:
+                        errors = [f"생성 실패: {e}"]
+                        continue
+                    quiz_data = parse_step2_output(quiz_output, article_url_map, article_url_map_normalized)
+                    report = check_quiz(quiz_data)
+                    errors = report['errors']
+                    if not report['valid']:
+                        continue
+                    if best is None or report['score'] > best[0]:
+                        best = (report['score'], futures[future], quiz_data)
+                    if selection == 'first' and report['score'] >= QUIZ_MIN_SCORE:
+                        break
+            finally:
+                # 시작 전 후보 취소, 호출 중인 후보는 완료를 기다리지 않음 (결과 폐기)
+                # 후보 스레드는 이번 실행에 묶여 있어 다음 실행이 시작된 뒤 끝나도 그 실행의 메트릭/트레이스에 기록되지 않음
+                executor.shutdown(wait=False, cancel_futures=True)
+            span.set_attribute('valid', best is not None)
+            span.set_attribute('score', best[0] if best else 0)
+        
+        if best and (best[0] >= QUIZ_MIN_SCORE or generated >= max_generations):
+            score, temperature, quiz_data = best
+            log.info("품질 검증 통과", attempt=generated, edition=edition, candidates=count,
+                     temperature=temperature, score=score)
+            return quiz_data, generated
+        log.warning("후보 전체 품질 검증 실패", round=round_number, generated=generated, edition=edition,
+                    errors=errors, bestScore=best[0] if best else None)
+    
+    raise Exception(f"품질 검증 실패 (최대 재시도 초과): {errors}")
+
+
+def batch_handler(event, context):
+    """
+    기간 × 에디션 일괄 생성 (누락일 백필, 난이도 에디션 제작)
+    event: {"mode": "batch", "startDate": "YYYY-MM-DD", "endDate": "YYYY-MM-DD",
+            "editions": ["standard", "easy"], "concurrency": 3, "backend": "sync", "pregenerateExplainers": false,
+            "minRecords": 100}
+    
+    backend: "sync"(invoke_model, 동시 호출 상한) | "batch"(Bedrock 배치 추론 작업, bedrock_batch 참고)
+    
+    1. BigKinds에서 기간 전체 기사를 페이지 단위로 한 번에 조회 후 날짜별 후보 선정
+    2. 날짜별 Step 1 → 에디션별 Step 2를 라운드 단위로 실행, 출력은 일괄 파싱/검증 (실패 건만 재시도)
+    3. 성공한 결과를 batch_writer로 일괄 저장 (일부 실패해도 나머지는 저장)
+    
+    batch 백엔드에서 라운드 요청이 minRecords 이상이면 작업만 제출하고 실행 상태를 저장한 뒤 202 반환
+    → 작업 완료 이벤트(EventBridge "Batch Inference Job State Change") 또는 {"mode": "batch", "resume": batchId}로
+      다시 호출되면 출력을 수집해 다음 라운드부터 이어서 실행 (Lambda 15분 제한 안에서 작업 완료를 기다리지 않음)
+    """
+    run_id = log.start_run(getattr(context, 'aws_request_id', None))
+    metrics.reset()
+    metrics.set_property('runId', run_id)
+    run_start = time.perf_counter()
+    
+    if event.get('resume') or event.get('source') == 'aws.bedrock':
+        tracer.start_trace('batch_resume', **{'faas.coldstart': _cold_start(), 'run_id': run_id})
+        error_message = None
+        try:
+            return resume_batch(event, run_start)
+        except Exception as e:
+            log.exception("배치 재개 실패", error=str(e))
+            metrics.put_metric('GenerationError', 1)
+            error_message = str(e)
+            return {'statusCode': 500, 'body': json.dumps({'error': str(e)}, ensure_ascii=False)}
+        finally:
+            metrics.put_metric('TotalLatency', round((time.perf_counter() - run_start) * 1000, 2), 'Milliseconds')
+            metrics.flush()
+            tracer.finish(error=error_message)
+    
+    start_date = datetime.strptime(event['startDate'], '%Y-%m-%d')
+    end_date = datetime.strptime(event.get('endDate', event['startDate']), '%Y-%m-%d')
+    dates = [(start_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end_date - start_date).days + 1)]
+    editions = event.get('editions', [DEFAULT_EDITION])
+    concurrency = max(1, int(event.get('concurrency', BATCH_CONCURRENCY)))
+    pregenerate = event.get('pregenerateExplainers', PREGENERATE_EXPLAINERS)
+    backend_name = event.get('backend', 'sync')
+    max_days = BATCH_JOB_MAX_DAYS if backend_name == 'batch' else BATCH_MAX_DAYS
+    
+    if not dates or len(dates) > max_days:
+        return {'statusCode': 400, 'body': json.dumps({'error': f'기간은 1~{max_days}일이어야 합니다'}, ensure_ascii=False)}
+    unknown = [edition for edition in editions if edition not in EDITION_INSTRUCTIONS]
+    if unknown:
+        return {'statusCode': 400, 'body': json.dumps({'error': f'알 수 없는 에디션: {unknown}'}, ensure_ascii=False)}
+    
+    tracer.start_trace('batch_handler', **{'faas.coldstart': _cold_start(), 'run_id': run_id,
+                                           'days': len(dates), 'editions': editions, 'concurrency': concurrency})
+    log.info("배치 생성 시작", dates=[dates[0], dates[-1]], days=len(dates), editions=editions, concurrency=concurrency)
+    
+    error_message = None
+    
+    try:
+        backend = make_backend(backend_name, concurrency, event.get('minRecords'))
+        tracer.root.set_attribute('backend', backend.name)
+        state = prepare_batch_state(dates, editions, concurrency, pregenerate, backend)
+        return run_batch(state, backend, run_start)
+    
+    except Exception as e:
+        log.exception("배치 생성 실패", error=str(e))
+        metrics.put_metric('GenerationError', 1)
+        error_message = str(e)
+        return {'statusCode': 500, 'body': json.dumps({'error': str(e)}, ensure_ascii=False)}
+    
+    finally:
+        metrics.put_metric('TotalLatency', round((time.perf_counter() - run_start) * 1000, 2), 'Milliseconds')
+        metrics.flush()
+        tracer.finish(error=error_message)
+
+
+def prepare_batch_state(dates, editions, concurrency, pregenerate, backend):
+    """
+    배치 실행 상태 (JSON 직렬화 가능, batch 백엔드는 작업 제출 시 저장소에 저장해 다음 호출에서 이어서 실행)
+    기간 전체 기사를 일괄 조회해 날짜별 후보(articlesByDate)까지 준비, 나머지는 라운드마다 채움
+    """
+    # 기간 전체 기사 일괄 조회 (각 날짜의 ARTICLE_WINDOW_DAYS일 전까지 포함)
+    sweep_from = datetime.strptime(dates[0], '%Y-%m-%d') - timedelta(days=ARTICLE_WINDOW_DAYS)
+    with metrics.timer('BigKindsLatency'), tracer.span('bigkinds.fetch_range') as span:
+        articles = fetch_bigkinds_range(sweep_from.strftime('%Y-%m-%d'), dates[-1])
+        span.set_attribute('article_count', len(articles))
+    duplicate_index = load_duplicate_index(dates[0])
+    
+    state = {
+        'batchId': uuid.uuid4().hex[:12],
+        'backend': backend.name,
+        'minRecords': getattr(backend, 'min_records', None),
+        'dates': dates,
+        'editions': editions,
+        'concurrency': concurrency,
+        'pregenerate': bool(pregenerate),
+        'articlesByDate': {},
+        'step1Done': False,
+        'screenings': {},  # 날짜 → Step 1 출력
+        'urlMaps': {},  # 날짜 → (원본 제목, 정규화 제목) URL 매핑
+        'jobs': {},  # recordId → (날짜, 에디션)
+        'attempt': 0,  # 완료한 Step 2 라운드 수
+        'succeeded': [],
+        'lastErrors': {},
+        'results': [],
+        'failures': [],
+        'pending': None,  # 제출 후 완료 대기 중인 작업 {'phase', 'job'}
+        'done': False
+    }
+    for date in dates:
+        candidates = drop_duplicate_articles(select_articles_for_date(articles, date, STEP1_ARTICLE_COUNT),
+                                             duplicate_index)
+        if len(candidates) < 6:
+            state['failures'].append({'date': date, 'edition': None, 'error': f'후보 기사 부족 ({len(candidates)}개)'})
+        else:
+            state['articlesByDate'][date] = prescreen_articles(
+                candidates, now=datetime.strptime(date, '%Y-%m-%d') + timedelta(days=1))
+    return state
+
+
+def next_batch_round(state):
+    """다음 라운드 (phase, {recordId: 요청}) 또는 None (모든 라운드 완료)"""
+    if not state['step1Done']:
+        requests = {}
+        for date, candidates in state['articlesByDate'].items():
+            system_prompt, user_prompt = build_step1_prompts(candidates)
+            requests[f'step1-{date}'] = {'system': system_prompt, 'user': user_prompt, 'max_tokens': 8000}
+        return 'step1', requests
+    
+    succeeded = set(state['succeeded'])
+    pending = [record_id for record_id in state['jobs'] if record_id not in succeeded]
+    if not pending or state['attempt'] > BATCH_MAX_RETRIES:
+        return None
+    requests = {}
+    for record_id in pending:
+        date, edition = state['jobs'][record_id]
+        system_prompt, user_prompt = build_step2_prompts(state['screenings'][date], edition, output_format='text')
+        requests[record_id] = {'system': system_prompt, 'user': user_prompt, 'max_tokens': 8000}
+    return f"step2-{state['attempt'] + 1}", requests
+
+
+def apply_batch_outputs(state, phase, outputs):
+    """라운드 출력 반영 (Step 1: 스크리닝 결과/Step 2 작업 목록, Step 2: 파싱/검증 → 성공 결과 또는 오류)"""
+    if phase == 'step1':
+        for date, candidates in state['articlesByDate'].items():
+            output = outputs[f'step1-{date}']
+            if isinstance(output, Exception):
+                log.warning("배치 Step 1 실패", date=date, error=str(output))
+                state['failures'].extend({'date': date, 'edition': edition, 'error': str(output)}
+                                         for edition in state['editions'])
+                continue
+            state['screenings'][date] = output
+            state['urlMaps'][date] = build_article_url_maps(candidates)
+            for edition in state['editions']:
+                state['jobs'][f'step2-{date}-{edition}'] = (date, edition)
+        state['step1Done'] = True
+        return
+    
+    attempt = state['attempt']
+    with tracer.span('step2.parse_validate_all', attempt=attempt + 1):
+        for record_id, output in outputs.items():
+            date, edition = state['jobs'][record_id]
+            if isinstance(output, Exception):
+                state['lastErrors'][record_id] = str(output)
+                continue
+            quiz_data = parse_quiz_output(output, *state['urlMaps'][date])
+            report = check_quiz(quiz_data)
+            if not report['valid']:
+                state['lastErrors'][record_id] = f"품질 검증 실패: {report['errors']}"
+                continue
+            if report['score'] < QUIZ_MIN_SCORE and attempt < BATCH_MAX_RETRIES:
+                state['lastErrors'][record_id] = f"품질 점수 미달: {report['score']} {report['warnings']}"
+                continue
+            state['succeeded'].append(record_id)
+            metrics.put_metric('GenerationAttempts', attempt + 1)
+            state['results'].append({'date': date, 'edition': edition, 'attempts': attempt + 1, 'quizData': quiz_data})
+    state['attempt'] = attempt + 1
+    log.info("배치 Step 2 라운드 완료", attempt=attempt + 1, requested=len(outputs), succeeded=len(state['results']))
+
+
+def run_batch(state, backend, run_start):
+    """
+    남은 라운드 실행 → 완료 시 finish_batch 응답
+    batch 백엔드에서 작업으로 보낼 만큼 요청이 많으면 제출 후 상태 저장, 202 반환 (완료 이벤트로 resume_batch)
+    """
+    while True:
+        next_round = next_batch_round(state)
+        if next_round is None:
+            return finish_batch(state, backend, run_start)
+        phase, requests = next_round
+        
+        if hasattr(backend, 'uses_job') and backend.uses_job(requests):
+            with tracer.span('batch.submit', phase=phase, count=len(requests)) as span:
+                job = backend.submit(requests, backend.job_name(state['batchId'], phase))
+                span.set_attribute('job_arn', job['jobArn'])
+            state['pending'] = {'phase': phase, 'job': job}
+            backend.save_state(state['batchId'], state)
+            log.info("배치 작업 제출", batchId=state['batchId'], phase=phase, records=len(requests), jobArn=job['jobArn'])
+            return {
+                'statusCode': 202,
+                'body': json.dumps({'message': '배치 작업 제출', 'batchId': state['batchId'], 'phase': phase,
+                                    'jobArn': job['jobArn'], 'records': len(requests)}, ensure_ascii=False)
+            }
+        
+        timer, span_name = ('Step1Latency', 'step1.screen_all') if phase == 'step1' else ('Step2Latency', 'step2.generate_all')
+        with metrics.timer(timer), tracer.span(span_name, phase=phase, count=len(requests)):
+            outputs = backend.invoke_all(requests)
+        apply_batch_outputs(state, phase, outputs)
+
+
+def resume_batch(event, run_start):
+    """
+    제출한 작업 완료 후 이어서 실행
+    event: Bedrock 작업 상태 변경 이벤트(detail.batchJobName/batchJobArn) 또는 {"mode": "batch", "resume": batchId}
+    - 대기 중인 작업과 다른 작업의 이벤트, 이미 수집한 작업의 중복 이벤트, 종료 전 상태 이벤트는 무시
+    - 수동 resume은 대기 중인 작업이 없어도 남은 라운드부터 실행 (중간 실패 후 복구)
+    """
+    from bedrock_batch import batch_id_from_job_name
+    
+    detail = event.get('detail') or {}
+    batch_id = event.get('resume') or batch_id_from_job_name(detail.get('batchJobName', ''))
+    if not batch_id:
+        return {'statusCode': 400, 'body': json.dumps({'error': '배치 ID를 찾을 수 없습니다'}, ensure_ascii=False)}
+    
+    backend = make_backend('batch', BATCH_CONCURRENCY)
+    state = backend.load_state(batch_id)
+    backend.min_records = state['minRecords']
+    backend.fallback.concurrency = state['concurrency']
+    tracer.root.set_attribute('batch_id', batch_id)
+    
+    pending = state['pending']
+    job_arn = detail.get('batchJobArn')
+    if state['done'] or (job_arn and (not pending or pending['job']['jobArn'] != job_arn)):
+        log.info("배치 재개 건너뜀 (대기 중인 작업 아님)", batchId=batch_id, jobArn=job_arn, done=state['done'])
+        return {'statusCode': 200, 'body': json.dumps({'message': '대기 중인 작업 없음', 'batchId': batch_id},
+                                                      ensure_ascii=False)}
+    
+    if pending:
+        status = backend.job_status(pending['job'])
+        if not status['terminal']:
+            return {'statusCode': 202, 'body': json.dumps({'message': '작업 대기 중', 'batchId': batch_id,
+                                                           'phase': pending['phase'], 'status': status['status']},
+                                                          ensure_ascii=False)}
+        
+        log.info("배치 작업 완료, 이어서 실행", batchId=batch_id, phase=pending['phase'], status=status['status'])
+        with tracer.span('batch.collect', phase=pending['phase'], status=status['status']):
+            outputs = backend.collect(pending['job'], status)
+        state['pending'] = None
+        apply_batch_outputs(state, pending['phase'], outputs)
+        backend.save_state(batch_id, state)  # 같은 작업의 중복 이벤트가 다시 수집하지 않도록 먼저 기록
+    return run_batch(state, backend, run_start)
+
+
+def finish_batch(state, backend, run_start):
+    """해설 사전 생성(선택) → 중복 문항 표시 → 일괄 저장 → 요약 응답"""
+    results = state['results']
+    failures = state['failures']
+    succeeded = set(state['succeeded'])
+    for record_id, (date, edition) in state['jobs'].items():
+        if record_id not in succeeded:
+            log.warning("배치 생성 실패", date=date, edition=edition, error=state['lastErrors'].get(record_id))
+            failures.append({'date': date, 'edition': edition, 'error': state['lastErrors'].get(record_id, '')})
+    
+    # (선택) 챗봇용 해설 답변 사전 생성 (동시 호출 상한 내 병렬)
+    if state['pregenerate'] and results:
+        with metrics.timer('ExplainerLatency'), tracer.span('step3.explainers', count=len(results)):
+            with ThreadPoolExecutor(max_workers=state['concurrency']) as executor:
+                list(executor.map(lambda r: step3_generate_explainers(r['quizData']), results))
+    
+    # 일괄 저장 (최근 퀴즈와 유사한 문항은 duplicateOf 표시)
+    duplicate_index = load_duplicate_index(state['dates'][0])
+    metrics.put_metric('DuplicateQuestions',
+                       sum(flag_duplicate_questions(r['quizData'], duplicate_index) for r in results))
+    if results:
+        with metrics.timer('DynamoDBLatency'), tracer.span('dynamodb.batch_write', count=len(results)):
+            save_quizzes_batch(results)
+    
+    summary = [{
+        'date': r['date'],
+        'edition': r['edition'],
+        'attempts': r['attempts'],
+        'questions': {game: len(r['quizData'].get(game, [])) for game in GAME_TYPES}
+    } for r in sorted(results, key=lambda r: (r['date'], r['edition']))]
+    failed = sorted(failures, key=lambda f: (f['date'], f['edition'] or ''))
+    if hasattr(backend, 'save_state'):
+        state['done'] = True
+        backend.save_state(state['batchId'], state)
+    
+    metrics.put_metric('GenerationSuccess', len(results))
+    metrics.put_metric('GenerationError', len(failures))
+    log.info("배치 생성 완료", batchId=state['batchId'], succeeded=len(results), failed=len(failures),
+             durationMs=round((time.perf_counter() - run_start) * 1000, 2))
+    return {
+        'statusCode': 200 if results else 500,
+        'body': json.dumps({
+            'message': '배치 생성 완료',
+            'batchId': state['batchId'],
+            'succeeded': summary,
+            'failed': failed
+        }, ensure_ascii=False)
+    }
+
+
+def _bedrock_control_client():
+    import boto3
+    return boto3.client('bedrock', region_name=AWS_REGION)
+
+
+def make_backend(name, concurrency, min_records=None):
+    """배치 생성 실행 백엔드 (bedrock_batch.SyncBackend / BedrockBatchBackend, min_records 생략 시 BEDROCK_BATCH_MIN_RECORDS)"""
+    from bedrock_batch import SyncBackend, BedrockBatchBackend, S3Storage, BATCH_S3_URI, BATCH_MIN_RECORDS
+    
+    sync_backend = SyncBackend(call_claude, concurrency)
+    if name == 'sync':
+        return sync_backend
+    if name != 'batch':
+        raise ValueError(f"알 수 없는 백엔드: {name}")
+    if not BATCH_S3_URI:
+        raise ValueError("BEDROCK_BATCH_S3_URI 환경 변수가 설정되지 않았습니다")
+    return BedrockBatchBackend(
+        storage=S3Storage(BATCH_S3_URI),
+        client=_bedrock_control_client(),
+        model_id=BEDROCK_MODEL_ID,
+        build_body=build_claude_request,
+        min_records=BATCH_MIN_RECORDS if min_records is None else int(min_records),
+        fallback=sync_backend
+    )
+
+
+_invocation_count = 0
+
+
+def _cold_start():
+    """컨테이너의 첫 호출 여부"""
+    global _invocation_count
+    _invocation_count += 1
+    return _invocation_count == 1
 
 
 def normalize_title(title):
     """기사 제목 정규화 (매칭용)"""
-    import re
     # 공백, 특수문자 제거하고 소문자로 변환
-    normalized = re.sub(r'[^\w가-힣]', '', title)
+    normalized = _TITLE_NORMALIZE.sub('', title)
     return normalized.lower()
 
 
@@ -127,34 +720,46 @@ def convert_newsid_to_sedaily_url(news_id):
         # BigKinds 기사 상세 페이지 URL
         bigkinds_url = f"https://www.bigkinds.or.kr/v2/news/newsDetailView.do?newsId={news_id}"
         
+        import requests
+        
         # 페이지 요청
-        response = requests.get(bigkinds_url, timeout=10)
+        with tracer.span('bigkinds.scrape_url', news_id=news_id) as span:
+            response = requests.get(bigkinds_url, timeout=10)
+            span.set_attribute('http.status_code', response.status_code)
         if response.status_code != 200:
-            print(f"   ⚠️ BigKinds 페이지 로드 실패: {news_id}")
+            log.warning("BigKinds 페이지 로드 실패", newsId=news_id, status=response.status_code)
             return bigkinds_url
         
         # HTML 파싱하여 언론사URL 버튼 찾기
-        import re
         # <button ... onclick="location.href='URL'">언론사URL</button> 패턴 찾기
         match = re.search(r"onclick=\"location\.href='([^']+)'\"[^>]*>언론사URL", response.text)
         if match:
             provider_url = match.group(1)
             # ?ref=kpf 파라미터 제거
             provider_url = provider_url.split('?')[0]
-            print(f"   ✅ 스크래핑 성공: {provider_url}")
+            log.debug("언론사 URL 스크래핑 성공", newsId=news_id, url=provider_url)
             return provider_url
         else:
-            print(f"   ⚠️ 언론사URL 버튼 못 찾음: {news_id}")
+            log.warning("언론사URL 버튼 못 찾음", newsId=news_id)
             return bigkinds_url
             
     except Exception as e:
-        print(f"   ⚠️ 스크래핑 오류: {str(e)}")
+        log.warning("언론사 URL 스크래핑 오류", newsId=news_id, error=str(e))
         # fallback: BigKinds URL 반환
         return f"https://www.bigkinds.or.kr/v2/news/newsDetailView.do?newsId={news_id}"
 
 
+# 프롬프트 번들 캐시 (컨테이너 재사용 및 배치 생성 시 파일 재로드 생략)
+_prompt_cache = {}
+_ranker = None  # 사전 랭킹 키워드/용어 (Step 1 참조 파일에서 1회 생성)
+
+
 def load_prompt_files(step_dir):
-    """프롬프트, 지침, 메모리, 파일들 로드"""
+    """프롬프트, 지침, 메모리, 파일들 로드 (디렉토리별 캐시)"""
+    cached = _prompt_cache.get(str(step_dir))
+    if cached:
+        return cached
+    
     prompt = (step_dir / 'prompt.txt').read_text(encoding='utf-8')
     instructions = (step_dir / 'instructions.txt').read_text(encoding='utf-8')
     memory = (step_dir / 'memory.txt').read_text(encoding='utf-8')
@@ -166,38 +771,210 @@ def load_prompt_files(step_dir):
         for file_path in files_dir.glob('*.txt'):
             reference_files[file_path.name] = file_path.read_text(encoding='utf-8')
     
-    return {
+    bundle = {
         'prompt': prompt,
         'instructions': instructions,
         'memory': memory,
         'reference_files': reference_files
     }
+    _prompt_cache[str(step_dir)] = bundle
+    return bundle
 
 
 def fetch_bigkinds_news(count=12):
-    """BigKinds API에서 최근 경제 뉴스 가져오기"""
-    print(f"\n📰 BigKinds API에서 뉴스 {count}개 가져오는 중...")
+    """BigKinds API에서 최근 경제 뉴스 가져오기 (ARTICLE_STORE_PATH 설정 시 증분 수집 후 저장소에서 선택)"""
+    log.info("BigKinds 뉴스 조회 시작", count=count)
     
     if not BIGKINDS_API_KEY:
         raise ValueError("BIGKINDS_API_KEY 환경 변수가 설정되지 않았습니다")
     
+    if ARTICLE_STORE_PATH:
+        return fetch_from_article_store(ArticleStore(ARTICLE_STORE_PATH), count)
+    
     end_date = datetime.now()
-    start_date = end_date - timedelta(days=7)
+    start_date = end_date - timedelta(days=ARTICLE_WINDOW_DAYS)
+    
+    data = bigkinds_search(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), 0, count)
+    articles = data.get('return_object', {}).get('documents', [])
+    
+    log.info("BigKinds 뉴스 조회 완료", articleCount=len(articles))
+    return articles
+
+
+def fetch_from_article_store(store, count, now=None):
+    """증분 수집 → 최근 ARTICLE_WINDOW_DAYS일 후보 중 최신순 count개 (보존 기간 지난 세그먼트 정리)"""
+    now = now or datetime.now()
+    added = fetch_bigkinds_incremental(store, now)
+    candidates = store.recent((now - timedelta(days=ARTICLE_WINDOW_DAYS)).strftime('%Y-%m-%d'))
+    pruned = store.prune((now - timedelta(days=ARTICLE_STORE_RETENTION_DAYS)).strftime('%Y-%m-%d'))
+    
+    log.info("BigKinds 뉴스 조회 완료", articleCount=min(count, len(candidates)), newArticles=added,
+             candidatePool=len(candidates), storeSize=len(store), pruned=pruned)
+    return candidates[:count]
+
+
+def fetch_bigkinds_incremental(store, now=None, page_size=BIGKINDS_PAGE_SIZE):
+    """
+    최고 수위(마지막으로 저장한 published_at) 이후 기사만 페이지 단위로 받아 저장소에 추가 → 추가된 개수
+    최신순으로 페이지를 넘기다가 최고 수위 이전 기사에 도달하면 중단 (어제 받은 본문은 다시 받지 않음)
+    """
+    now = now or datetime.now()
+    mark = store.high_water['publishedAt']
+    date_from = mark[:10] if mark else (now - timedelta(days=ARTICLE_WINDOW_DAYS)).strftime('%Y-%m-%d')
+    
+    articles = []
+    return_from = 0
+    pages = 0
+    while True:
+        data = bigkinds_search(date_from, now.strftime('%Y-%m-%d'), return_from, page_size)
+        pages += 1
+        return_object = data.get('return_object', {})
+        documents = return_object.get('documents', [])
+        articles.extend(doc for doc in documents if not store.is_seen(doc))
+        return_from += len(documents)
+        if len(documents) < page_size or return_from >= return_object.get('total_hits', 0):
+            break
+        if mark and documents[-1].get('published_at', '') < mark:
+            break
+    
+    added = store.append(articles)
+    log.debug("BigKinds 증분 수집", dateFrom=date_from, pages=pages, scanned=return_from, added=added,
+              highWater=store.high_water['publishedAt'])
+    return added
+
+
+def fetch_bigkinds_range(date_from, date_until, page_size=BIGKINDS_PAGE_SIZE):
+    """BigKinds 기간 전체 기사를 페이지 단위로 조회 (배치 생성용, 최신순)"""
+    log.info("BigKinds 기간 조회 시작", dateFrom=date_from, dateUntil=date_until)
+    
+    if not BIGKINDS_API_KEY:
+        raise ValueError("BIGKINDS_API_KEY 환경 변수가 설정되지 않았습니다")
+    
+    articles = []
+    return_from = 0
+    pages = 0
+    while True:
+        data = bigkinds_search(date_from, date_until, return_from, page_size)
+        pages += 1
+        return_object = data.get('return_object', {})
+        documents = return_object.get('documents', [])
+        articles.extend(documents)
+        return_from += len(documents)
+        if len(documents) < page_size or return_from >= return_object.get('total_hits', 0):
+            break
+    
+    log.info("BigKinds 기간 조회 완료", articleCount=len(articles), pages=pages)
+    return articles
+
+
+def select_articles_for_date(articles, date, count=12):
+    """기간 조회 결과에서 해당 날짜 기준 최근 ARTICLE_WINDOW_DAYS일 기사 최신순 count개"""
+    window_start = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=ARTICLE_WINDOW_DAYS)).strftime('%Y-%m-%d')
+    candidates = [a for a in articles if window_start <= a.get('published_at', '')[:10] <= date]
+    candidates.sort(key=lambda a: a.get('published_at', ''), reverse=True)
+    return candidates[:count]
+
+
+def load_duplicate_index(until_date, lookback_days=DEDUP_LOOKBACK_DAYS):
+    """until_date 이전 lookback_days일 퀴즈로 중복 색인 생성 (실행당 1회, 실패 시 중복 검사 없이 진행)"""
+    if not lookback_days:
+        return None
+    end = datetime.strptime(until_date, '%Y-%m-%d')
+    try:
+        items = query_recent_quizzes((end - timedelta(days=lookback_days)).strftime('%Y-%m-%d'),
+                                     (end - timedelta(days=1)).strftime('%Y-%m-%d'))
+    except Exception as e:
+        log.warning("중복 색인 로드 실패", error=str(e))
+        return None
+    index = build_from_items(items, DEDUP_THRESHOLD)
+    log.info("중복 색인 로드 완료", quizItems=len(items), entries=len(index))
+    return index
+
+
+def query_recent_quizzes(date_from, date_until):
+    """standard 에디션 게임별 기간 퀴즈 (중복 색인에 필요한 필드만)"""
+    from boto3.dynamodb.conditions import Key
+    
+    table = _get_dynamodb().Table(DYNAMODB_TABLE)
+    items = []
+    for game_type in GAME_TYPES:
+        kwargs = {
+            'KeyConditionExpression': Key('PK').eq(f'QUIZ#{game_type}') & Key('SK').between(f'DATE#{date_from}', f'DATE#{date_until}'),
+            'ProjectionExpression': '#d, questions',
+            'ExpressionAttributeNames': {'#d': 'date'}
+        }
+        while True:
+            response = table.query(**kwargs)
+            for item in response.get('Items', []):
+                items.append({
+                    'date': item.get('date'),
+                    'gameType': game_type,
+                    'questions': [{
+                        'question': q.get('question', ''),
+                        'options': list(q.get('options', [])),
+                        'relatedArticle': {'title': Question.from_dict(q).article_title}
+                    } for q in item.get('questions', [])]
+                })
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return items
+
+
+def drop_duplicate_articles(articles, duplicate_index, min_remaining=6):
+    """최근 퀴즈의 관련 기사와 제목이 유사한 후보 제외 (남는 기사가 min_remaining 미만이면 그대로)"""
+    if not duplicate_index:
+        return articles
+    kept = [a for a in articles if not duplicate_index.query(KIND_ARTICLE, a.get('title', ''))]
+    if len(kept) < min_remaining:
+        log.warning("중복 제외 후 후보 부족, 제외하지 않음", candidates=len(articles), remaining=len(kept))
+        return articles
+    if len(kept) < len(articles):
+        log.info("최근 출제 기사 제외", candidates=len(articles), dropped=len(articles) - len(kept))
+    return kept
+
+
+def flag_duplicate_questions(quiz_data, duplicate_index):
+    """최근 퀴즈와 유사한 문항에 duplicateOf 표시 → 표시한 문항 수"""
+    if not duplicate_index:
+        return 0
+    flagged = 0
+    for game_type, questions in quiz_data.items():
+        for position, question in enumerate(questions):
+            matches = duplicate_index.query(KIND_QUESTION, question_text(question))
+            if not matches:
+                continue
+            match = matches[0]
+            question['duplicateOf'] = {
+                'date': match['date'],
+                'gameType': match['gameType'],
+                'questionIndex': match['questionIndex'],
+                'similarity': str(match['similarity'])  # DynamoDB는 float 미지원
+            }
+            flagged += 1
+            log.warning("최근 퀴즈와 유사한 문항", gameType=game_type, questionIndex=position,
+                        duplicateOf=question['duplicateOf'], question=question.get('question', '')[:60])
+    return flagged
+
+
+def bigkinds_search(date_from, date_until, return_from, return_size):
+    """BigKinds 뉴스 검색 API 1회 호출 (서울경제 경제 기사) → 응답 JSON"""
+    import requests
     
     payload = {
         'access_key': BIGKINDS_API_KEY,
         'argument': {
             'query': '',
             'published_at': {
-                'from': start_date.strftime('%Y-%m-%d'),
-                'until': end_date.strftime('%Y-%m-%d')
+                'from': date_from,
+                'until': date_until
             },
             'provider': ['서울경제'],
             'category': ['경제'],
             'sort': {'date': 'desc'},
             'hilight': 200,
-            'return_from': 0,
-            'return_size': count,
+            'return_from': return_from,
+            'return_size': return_size,
             'fields': ['title', 'content', 'published_at', 'provider', 'category', 'hilight', 'news_id', 'url', 'byline', 'provider_link_page']  # 추가 필드 요청
         }
     }
@@ -211,27 +988,24 @@ def fetch_bigkinds_news(count=12):
         )
         
         if response.status_code != 200:
-            print(f"❌ API 응답 코드: {response.status_code}")
+            log.error("BigKinds API 응답 오류", status=response.status_code)
             raise Exception(f"BigKinds API 오류: {response.status_code}")
         
         data = response.json()
         
         if data.get('result') != 0:
-            print(f"❌ API result 코드: {data.get('result')}")
+            log.error("BigKinds API result 오류", result=data.get('result'))
             raise Exception(f"BigKinds API returned error result: {data.get('result')}")
         
-        articles = data.get('return_object', {}).get('documents', [])
-        
-        print(f"✅ {len(articles)}개 뉴스 가져오기 완료")
-        return articles
+        return data
         
     except requests.exceptions.JSONDecodeError as e:
-        print(f"❌ JSON 파싱 오류")
+        log.error("BigKinds 응답 JSON 파싱 오류")
         raise Exception(f"BigKinds API 응답이 JSON 형식이 아닙니다: {str(e)}")
 
 
-def call_claude(system_prompt, user_prompt, max_tokens=4000):
-    """AWS Bedrock Claude 호출"""
+def build_claude_request(system_prompt, user_prompt, max_tokens=4000, temperature=DEFAULT_TEMPERATURE, tool=None):
+    """Bedrock Claude 요청 본문 (동기 호출과 배치 추론 입력 공용, tool 지정 시 해당 도구 호출 강제)"""
     request_body = {
         "anthropic_version": "bedrock-2023-05-31",
         "max_tokens": max_tokens,
@@ -242,23 +1016,77 @@ def call_claude(system_prompt, user_prompt, max_tokens=4000):
                 "content": user_prompt
             }
         ],
-        "temperature": 0.7,
+        "temperature": temperature,
         "top_p": 0.9
     }
+    if tool:
+        request_body["tools"] = [tool]
+        request_body["tool_choice"] = {"type": "tool", "name": tool["name"]}
+    return request_body
+
+
+def call_claude(system_prompt, user_prompt, max_tokens=4000, temperature=DEFAULT_TEMPERATURE, tool=None):
+    """AWS Bedrock Claude 호출 → 응답 텍스트 (tool 지정 시 도구 입력 dict, 도구 호출이 없으면 텍스트)"""
+    request_body = build_claude_request(system_prompt, user_prompt, max_tokens, temperature, tool)
     
-    response = bedrock.invoke_model(
-        modelId=BEDROCK_MODEL_ID,
-        body=json.dumps(request_body)
-    )
+    with metrics.timer('BedrockLatency'), tracer.span('bedrock.invoke_model', model=BEDROCK_MODEL_ID, max_tokens=max_tokens,
+                                                      temperature=temperature) as span:
+        response = _get_bedrock().invoke_model(
+            modelId=BEDROCK_MODEL_ID,
+            body=json.dumps(request_body)
+        )
+        response_body = json.loads(response['body'].read())
+        usage = response_body.get('usage', {})
+        span.set_attribute('gen_ai.usage.input_tokens', usage.get('input_tokens'))
+        span.set_attribute('gen_ai.usage.output_tokens', usage.get('output_tokens'))
+        span.set_attribute('stop_reason', response_body.get('stop_reason'))
     
-    response_body = json.loads(response['body'].read())
-    return response_body['content'][0]['text']
+    if tool:
+        for block in response_body['content']:
+            if block.get('type') == 'tool_use' and block.get('name') == tool['name']:
+                return block['input']
+        log.warning("도구 호출 없이 텍스트 응답", tool=tool['name'], stopReason=response_body.get('stop_reason'))
+    return ''.join(block.get('text', '') for block in response_body['content'])
 
 
 def step1_screen_articles(articles):
-    """Step 1: 기사 스크리닝"""
-    print("\n🔍 Step 1: 기사 스크리닝 시작...")
+    """Step 1: 기사 스크리닝 (사전 랭킹으로 추린 기사만 모델에 전달)"""
+    with tracer.span('step1.prescreen', pool=len(articles)):
+        articles = prescreen_articles(articles)
+    log.info("Step 1 기사 스크리닝 시작", articleCount=len(articles))
+    
+    system_prompt, user_prompt = build_step1_prompts(articles)
+    
+    # Claude 호출
+    response = call_claude(system_prompt, user_prompt, max_tokens=8000)
+    
+    log.info("Step 1 완료", responseChars=len(response))
+    
+    return response, build_article_url_maps(articles)
+
+
+def prescreen_articles(articles, top_k=None, now=None):
+    """게임별 상위 top_k개 기사 (후보가 게임 수 × top_k 이하이거나 사전 랭킹이 꺼져 있으면 그대로)"""
+    top_k = PRESCREEN_TOP_K if top_k is None else top_k
+    if not top_k or len(articles) <= top_k * len(GAME_TYPES):
+        return articles
     
+    shortlisted, picked = _get_ranker().shortlist(articles, top_k, now)
+    log.debug("사전 랭킹 완료", pool=len(articles), shortlisted=len(shortlisted),
+              picked={game: [articles[i].get('title', '')[:40] for i in indices] for game, indices in picked.items()})
+    return shortlisted
+
+
+def _get_ranker():
+    global _ranker
+    if _ranker is None:
+        step1_data = load_prompt_files(Path(__file__).parent / 'prompts' / 'step1')
+        _ranker = ArticleRanker.from_reference_files(step1_data['reference_files'])
+    return _ranker
+
+
+def build_step1_prompts(articles):
+    """Step 1 (system, user) 프롬프트"""
     # 프롬프트 로드
     prompt_dir = Path(__file__).parent / 'prompts' / 'step1'
     step1_data = load_prompt_files(prompt_dir)
@@ -295,12 +1123,11 @@ def step1_screen_articles(articles):
 
 분석 시작
 """
-    
-    # Claude 호출
-    response = call_claude(system_prompt, user_prompt, max_tokens=8000)
-    
-    print("✅ Step 1 완료: 기사 스크리닝 결과 생성")
-    
+    return system_prompt, user_prompt
+
+
+def build_article_url_maps(articles):
+    """기사 제목 → URL 매핑 (원본 제목, 정규화된 제목)"""
     # 기사 제목-URL 매핑 생성 (정규화된 제목으로)
     article_url_map = {}
     article_url_map_normalized = {}  # 정규화된 제목으로 검색용
@@ -331,15 +1158,33 @@ def step1_screen_articles(articles):
             normalized_title = normalize_title(title)
             article_url_map_normalized[normalized_title] = article_data
     
-    print(f"📋 URL 매핑 생성 완료: {len(article_url_map)}개 기사")
+    log.debug("URL 매핑 생성 완료", articleCount=len(article_url_map))
     
-    return response, (article_url_map, article_url_map_normalized)
+    return article_url_map, article_url_map_normalized
 
 
-def step2_generate_quiz(selected_articles, retry_count=0, max_retries=2):
-    """Step 2: 문제 제작 (텍스트 형식)"""
-    print(f"\n✏️ Step 2: 문제 제작 시작... (시도 {retry_count + 1}/{max_retries + 1})")
+def step2_generate_quiz(selected_articles, retry_count=0, max_retries=2, edition=DEFAULT_EDITION,
+                        temperature=DEFAULT_TEMPERATURE, output_format=None):
+    """Step 2: 문제 제작 (텍스트 형식 또는 submit_quiz 도구 입력, 에디션별 난이도 지시 추가)"""
+    output_format = output_format or STEP2_OUTPUT_FORMAT
+    log.info("Step 2 문제 제작 시작", attempt=retry_count + 1, maxAttempts=max_retries + 1, edition=edition,
+             temperature=temperature, outputFormat=output_format)
+    
+    system_prompt, user_prompt = build_step2_prompts(selected_articles, edition, output_format)
+    
+    # Claude 호출
+    if output_format == 'tool':
+        response = call_claude(system_prompt, user_prompt, max_tokens=8000, temperature=temperature, tool=QUIZ_TOOL)
+    else:
+        response = call_claude(system_prompt, user_prompt, max_tokens=8000, temperature=temperature)
     
+    log.info("Step 2 완료", responseChars=len(response) if isinstance(response, str) else None,
+             structured=isinstance(response, dict))
+    return response
+
+
+def build_step2_prompts(selected_articles, edition=DEFAULT_EDITION, output_format='text'):
+    """Step 2 (system, user) 프롬프트 (output_format='tool'이면 텍스트 형식 대신 submit_quiz 도구로 제출 지시)"""
     # 프롬프트 로드
     prompt_dir = Path(__file__).parent / 'prompts' / 'step2'
     step2_data = load_prompt_files(prompt_dir)
@@ -366,82 +1211,191 @@ def step2_generate_quiz(selected_articles, retry_count=0, max_retries=2):
 위 스크리닝 결과에서 추천된 기사들을 사용하여 총 6개 문제를 제작하세요.
 (블랙스완 2개, 죄수의 딜레마 2개, 시그널 디코딩 2개)
 """
+    if EDITION_INSTRUCTIONS.get(edition):
+        user_prompt += f"\n난이도 지침: {EDITION_INSTRUCTIONS[edition]}\n"
+    if output_format == 'tool':
+        user_prompt += (f"\n출력 형식: 위 텍스트 형식 대신 {QUIZ_TOOL['name']} 도구로 제출하세요. "
+                        "선택지에는 번호 기호(①②③④)를 붙이지 말고, correctAnswer는 0~3 인덱스, "
+                        "articleTitle은 스크리닝 결과의 기사 제목을 그대로 쓰세요.\n")
+    return system_prompt, user_prompt
+
+
+EXPLAINER_SYSTEM_PROMPT = """당신은 서울경제 뉴스 퀴즈의 해설 담당 경제 전문가입니다.
+플레이어가 챗봇에 자주 묻는 후속 질문에 대한 답변을 미리 작성합니다.
+
+원칙:
+1. 문제, 선택지, 해설, 관련 기사 요약에 근거해 답변
+2. 각 답변은 150-250자 내외의 자연스러운 한국어
+3. 반드시 JSON만 출력 (설명 문장, 코드 블록 표시 없이)"""
+
+
+def step3_generate_explainers(quiz_data):
+    """
+    Step 3 (선택): 챗봇 후속 질문 답변 사전 생성
+    게임별로 한 번씩 Claude를 호출하여 문제마다 정답 이유 / 오답별 이유 / 배경 용어 설명 생성
+    결과는 각 문제의 'explainers' 필드에 저장 (실패해도 퀴즈 저장은 진행)
+    """
+    log.info("Step 3 챗봇 해설 답변 사전 생성 시작")
     
-    # Claude 호출
-    response = call_claude(system_prompt, user_prompt, max_tokens=8000)
+    for game_type, questions in quiz_data.items():
+        if not questions:
+            continue
+        
+        questions_text = ""
+        for i, q in enumerate(questions, 1):
+            options = q.get('options', [])
+            correct = q.get('correctAnswer', 0)
+            questions_text += f"\n[문제 {i}]\n{q.get('question', '')}\n"
+            for j, option in enumerate(options):
+                questions_text += f"{['①', '②', '③', '④'][j]} {option}\n"
+            questions_text += f"정답: {['①', '②', '③', '④'][correct]}\n"
+            questions_text += f"해설: {q.get('explanation', '')}\n"
+            questions_text += f"관련 기사: {q.get('relatedArticle', {}).get('title', '')} - {q.get('relatedArticle', {}).get('excerpt', '')}\n"
+        
+        user_prompt = f"""다음 {len(questions)}개 문제 각각에 대해 아래 JSON 형식으로 답변을 작성하세요.
+
+{questions_text}
+
+출력 형식:
+{{"questions": [
+  {{"whyCorrect": "왜 정답이 맞는지",
+    "whyWrong": ["①이 오답인 이유", "②이 오답인 이유", "③이 오답인 이유", "④이 오답인 이유"],
+    "background": "문제를 이해하는 데 필요한 배경 지식과 핵심 용어 설명"}}
+]}}
+
+whyWrong에서 정답 번호 위치는 빈 문자열로 두세요. questions 배열 순서는 문제 순서와 같아야 합니다."""
+        
+        try:
+            response = call_claude(EXPLAINER_SYSTEM_PROMPT, user_prompt, max_tokens=4000)
+            explainers = parse_explainers(response, len(questions))
+        except Exception as e:
+            log.warning("해설 답변 생성 실패", gameType=game_type, error=str(e))
+            continue
+        
+        for q, explainer in zip(questions, explainers):
+            q['explainers'] = explainer
+        log.info("해설 답변 생성 완료", gameType=game_type, count=len(explainers))
+
+
+def parse_explainers(response_text, expected_count):
+    """Step 3 JSON 응답 파싱 및 필드 정리"""
+    match = re.search(r'\{.*\}', response_text, re.DOTALL)
+    if not match:
+        raise ValueError("JSON 응답을 찾을 수 없습니다")
     
-    print("✅ Step 2 완료: 6개 문제 생성")
-    return response
+    items = json.loads(match.group(0)).get('questions', [])
+    if len(items) != expected_count:
+        raise ValueError(f"문제 수 불일치: {len(items)}개 (기대 {expected_count}개)")
+    
+    explainers = []
+    for item in items:
+        why_wrong = [clean_text(str(text)) for text in item.get('whyWrong', [])][:4]
+        why_wrong += [''] * (4 - len(why_wrong))
+        explainers.append({
+            'whyCorrect': clean_text(str(item.get('whyCorrect', ''))),
+            'whyWrong': why_wrong,
+            'background': clean_text(str(item.get('background', '')))
+        })
+    return explainers
 
 
 def clean_text(text):
     """텍스트에서 이미지와 URL 제거"""
-    import re
-    
-    # 이미지 관련 패턴 제거
-    text = re.sub(r'!\[.*?\]\(.*?\)', '', text)  # Markdown 이미지
-    text = re.sub(r'<img[^>]*>', '', text)  # HTML 이미지
-    text = re.sub(r'\[이미지.*?\]', '', text)  # [이미지] 텍스트
-    text = re.sub(r'\(사진.*?\)', '', text)  # (사진...) 텍스트
-    
-    # URL 제거 (https://www.sedaily.com 등)
-    text = re.sub(r'https?://[^\s]+', '', text)
+    for pattern in _CLEAN_PATTERNS:
+        text = pattern.sub('', text)
     
     # 연속된 공백 정리
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE.sub(' ', text)
     
     return text.strip()
 
 
-def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
-    """퀴즈 출력 텍스트 파싱 (텍스트 형식)"""
-    print("\n🔄 퀴즈 데이터 파싱 중...")
+def find_article_url(article_title, article_url_map, article_url_map_normalized):
+    """기사 제목으로 URL 찾기 (정규화 매칭 포함)"""
+    article_title_clean = clean_text(article_title.strip())
     
-    import re
+    # 1차: 정확한 제목 매칭
+    if article_title_clean in article_url_map:
+        return article_url_map[article_title_clean]
     
-    def find_article_url(article_title):
-        """기사 제목으로 URL 찾기 (정규화 매칭 포함)"""
-        article_title_clean = clean_text(article_title.strip())
-        
-        # 1차: 정확한 제목 매칭
-        if article_title_clean in article_url_map:
-            return article_url_map[article_title_clean]
-        
-        # 2차: 정규화된 제목 매칭
-        normalized = normalize_title(article_title_clean)
-        if normalized in article_url_map_normalized:
-            return article_url_map_normalized[normalized]
-        
-        # 3차: 부분 매칭 (제목의 앞부분이 일치하는 경우)
-        for original_title, article_data in article_url_map.items():
-            if article_title_clean[:30] in original_title or original_title[:30] in article_title_clean:
-                print(f"   ⚠️ 부분 매칭: '{article_title_clean[:40]}...' ≈ '{original_title[:40]}...'")
-                return article_data
-        
-        # 4차: 더 짧은 부분 매칭 (15자)
-        for original_title, article_data in article_url_map.items():
-            if len(article_title_clean) >= 15 and len(original_title) >= 15:
-                if article_title_clean[:15] in original_title or original_title[:15] in article_title_clean:
-                    print(f"   ⚠️ 짧은 부분 매칭: '{article_title_clean[:40]}...' ≈ '{original_title[:40]}...'")
-                    return article_data
-        
-        # 5차: 키워드 매칭 (공백으로 분리된 단어 중 3개 이상 일치)
-        article_words = set(article_title_clean.split())
-        for original_title, article_data in article_url_map.items():
-            original_words = set(original_title.split())
-            common_words = article_words & original_words
-            if len(common_words) >= 3:
-                print(f"   ⚠️ 키워드 매칭 ({len(common_words)}개): '{article_title_clean[:40]}...' ≈ '{original_title[:40]}...'")
+    # 2차: 정규화된 제목 매칭
+    normalized = normalize_title(article_title_clean)
+    if normalized in article_url_map_normalized:
+        return article_url_map_normalized[normalized]
+    
+    # 3차: 부분 매칭 (제목의 앞부분이 일치하는 경우)
+    for original_title, article_data in article_url_map.items():
+        if article_title_clean[:30] in original_title or original_title[:30] in article_title_clean:
+            log.debug("기사 URL 부분 매칭", title=article_title_clean[:40], matched=original_title[:40])
+            return article_data
+    
+    # 4차: 더 짧은 부분 매칭 (15자)
+    for original_title, article_data in article_url_map.items():
+        if len(article_title_clean) >= 15 and len(original_title) >= 15:
+            if article_title_clean[:15] in original_title or original_title[:15] in article_title_clean:
+                log.debug("기사 URL 짧은 부분 매칭", title=article_title_clean[:40], matched=original_title[:40])
                 return article_data
-        
-        print(f"   ❌ URL 못 찾음: '{article_title_clean[:50]}...'")
-        print(f"      사용 가능한 기사 제목들:")
-        for i, title in enumerate(list(article_url_map.keys())[:3], 1):
-            print(f"      {i}. {title[:60]}...")
-        
-        return {}
     
-    import re
+    # 5차: 키워드 매칭 (공백으로 분리된 단어 중 3개 이상 일치)
+    article_words = set(article_title_clean.split())
+    for original_title, article_data in article_url_map.items():
+        original_words = set(original_title.split())
+        common_words = article_words & original_words
+        if len(common_words) >= 3:
+            log.debug("기사 URL 키워드 매칭", commonWords=len(common_words),
+                      title=article_title_clean[:40], matched=original_title[:40])
+            return article_data
+    
+    # 후보 제목 목록은 DEBUG에서만 (운영 로그 크기 절감)
+    log.warning("기사 URL 못 찾음", title=article_title_clean[:50])
+    if log.is_debug():
+        log.debug("기사 URL 후보 제목", candidates=[title[:60] for title in list(article_url_map.keys())[:3]])
+    
+    return {}
+
+
+def parse_step2_output(output, article_url_map, article_url_map_normalized):
+    """Step 2 출력 → quiz_data (도구 입력 dict는 스키마 검사 후 변환, 텍스트는 parse_quiz_output)"""
+    if isinstance(output, dict):
+        return parse_structured_quiz(output, article_url_map, article_url_map_normalized)
+    return parse_quiz_output(output, article_url_map, article_url_map_normalized)
+
+
+def parse_structured_quiz(tool_input, article_url_map, article_url_map_normalized):
+    """submit_quiz 도구 입력 → quiz_data (스키마 오류 문항은 제외, 품질 검증에서 문항 수로 판정)"""
+    errors = check_schema(tool_input, QUIZ_TOOL['input_schema'])
+    if errors:
+        log.warning("구조화 출력 스키마 오류", errors=errors[:10], errorCount=len(errors))
+    
+    quiz_data = {game: [] for game in GAME_TYPES}
+    for game in GAME_TYPES:
+        questions = tool_input.get(game) if isinstance(tool_input.get(game), list) else []
+        for idx, item in enumerate(questions):
+            if check_schema(item, QUESTION_SCHEMA):
+                continue
+            article_info = find_article_url(item['articleTitle'], article_url_map, article_url_map_normalized)
+            url = article_info.get('url', '')
+            if not url:
+                log.warning("문제 관련 기사 URL 없음", gameType=game, index=idx + 1, title=item['articleTitle'][:50])
+            quiz_data[game].append({
+                'question': clean_text(item['question'].strip()),
+                'options': [clean_text(option.strip()) for option in item['options']],
+                'correctAnswer': item['correctAnswer'],
+                'explanation': clean_text(item['explanation'].strip()),
+                'newsLink': url,
+                'relatedArticle': {
+                    'title': article_info.get('originalTitle', clean_text(item['articleTitle'].strip())),
+                    'excerpt': clean_text(item.get('articleExcerpt', '').strip())
+                }
+            })
+    
+    log.info("퀴즈 데이터 파싱 완료", questions={game: len(quiz_data[game]) for game in quiz_data}, structured=True)
+    return quiz_data
+
+
+def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
+    """퀴즈 출력 텍스트 파싱 (텍스트 형식)"""
+    log.debug("퀴즈 데이터 파싱 시작", chars=len(quiz_text))
     
     try:
         quiz_data = {
@@ -494,14 +1448,14 @@ def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
         bs_problems = re.findall(r'🌊 블랙스완.*?\n\n(.*?)\n\n①\s*(.*?)\n②\s*(.*?)\n③\s*(.*?)\n④\s*(.*?)\n\n📰 관련 기사:\s*(.*?)\n📝\s*"(.*?)"', quiz_text, re.DOTALL)
         for idx, (question, opt1, opt2, opt3, opt4, article_title, article_summary) in enumerate(bs_problems):
             if idx < len(answers_explanations['BlackSwan']):
-                article_info = find_article_url(article_title)
+                article_info = find_article_url(article_title, article_url_map, article_url_map_normalized)
                 article_title_clean = article_info.get('originalTitle', clean_text(article_title.strip()))
                 url = article_info.get('url', '')
                 
                 if not url:
-                    print(f"   ⚠️ 블랙스완 문제 {idx+1} URL 못 찾음: {article_title[:50]}...")
+                    log.warning("문제 관련 기사 URL 없음", gameType='BlackSwan', index=idx + 1, title=article_title[:50])
                 else:
-                    print(f"   ✅ 블랙스완 문제 {idx+1} URL: {url}")
+                    log.debug("문제 관련 기사 URL", gameType='BlackSwan', index=idx + 1, url=url)
                 
                 quiz_data['BlackSwan'].append({
                     'question': clean_text(question.strip()),
@@ -519,14 +1473,14 @@ def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
         pd_problems = re.findall(r'⚖️ 죄수의 딜레마.*?\n\n(.*?)\n\n①\s*(.*?)\n②\s*(.*?)\n③\s*(.*?)\n④\s*(.*?)\n\n📰 관련 기사:\s*(.*?)\n📝\s*"(.*?)"', quiz_text, re.DOTALL)
         for idx, (question, opt1, opt2, opt3, opt4, article_title, article_summary) in enumerate(pd_problems):
             if idx < len(answers_explanations['PrisonersDilemma']):
-                article_info = find_article_url(article_title)
+                article_info = find_article_url(article_title, article_url_map, article_url_map_normalized)
                 article_title_clean = article_info.get('originalTitle', clean_text(article_title.strip()))
                 url = article_info.get('url', '')
                 
                 if not url:
-                    print(f"   ⚠️ 죄수의 딜레마 문제 {idx+1} URL 못 찾음: {article_title[:50]}...")
+                    log.warning("문제 관련 기사 URL 없음", gameType='PrisonersDilemma', index=idx + 1, title=article_title[:50])
                 else:
-                    print(f"   ✅ 죄수의 딜레마 문제 {idx+1} URL: {url}")
+                    log.debug("문제 관련 기사 URL", gameType='PrisonersDilemma', index=idx + 1, url=url)
                 
                 quiz_data['PrisonersDilemma'].append({
                     'question': clean_text(question.strip()),
@@ -544,14 +1498,14 @@ def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
         sd_problems = re.findall(r'🔍 시그널 디코딩.*?\n\n(.*?)\n\n①\s*(.*?)\n②\s*(.*?)\n③\s*(.*?)\n④\s*(.*?)\n\n📰 관련 기사:\s*(.*?)\n📝\s*"(.*?)"', quiz_text, re.DOTALL)
         for idx, (question, opt1, opt2, opt3, opt4, article_title, article_summary) in enumerate(sd_problems):
             if idx < len(answers_explanations['SignalDecoding']):
-                article_info = find_article_url(article_title)
+                article_info = find_article_url(article_title, article_url_map, article_url_map_normalized)
                 article_title_clean = article_info.get('originalTitle', clean_text(article_title.strip()))
                 url = article_info.get('url', '')
                 
                 if not url:
-                    print(f"   ⚠️ 시그널 디코딩 문제 {idx+1} URL 못 찾음: {article_title[:50]}...")
+                    log.warning("문제 관련 기사 URL 없음", gameType='SignalDecoding', index=idx + 1, title=article_title[:50])
                 else:
-                    print(f"   ✅ 시그널 디코딩 문제 {idx+1} URL: {url}")
+                    log.debug("문제 관련 기사 URL", gameType='SignalDecoding', index=idx + 1, url=url)
                 
                 quiz_data['SignalDecoding'].append({
                     'question': clean_text(question.strip()),
@@ -565,19 +1519,12 @@ def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
                     }
                 })
         
-        total_questions = sum(len(quiz_data.get(game, [])) for game in ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding'])
-        print(f"✅ 파싱 완료 (총 {total_questions}개 문제)")
-        
-        for game in ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']:
-            count = len(quiz_data.get(game, []))
-            print(f"   - {game}: {count}개")
+        log.info("퀴즈 데이터 파싱 완료", questions={game: len(quiz_data.get(game, [])) for game in quiz_data})
         
         return quiz_data
         
     except Exception as e:
-        print(f"⚠️ 파싱 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("퀴즈 데이터 파싱 오류", error=str(e))
         return {
             'BlackSwan': [],
             'PrisonersDilemma': [],
@@ -586,75 +1533,59 @@ def parse_quiz_output(quiz_text, article_url_map, article_url_map_normalized):
 
 
 def validate_quiz(quiz_data):
-    """생성된 퀴즈 품질 검증"""
-    print("\n🔍 품질 검증 중...")
+    """생성된 퀴즈 품질 검증 → (통과 여부, 오류 목록)"""
+    report = check_quiz(quiz_data)
+    return report['valid'], report['errors']
+
+
+def check_quiz(quiz_data):
+    """규칙 엔진 품질 검증 (quiz_rules) → {'valid', 'score', 'errors', 'warnings', 'diagnostics'}"""
+    report = evaluate_quiz(quiz_data)
     
-    errors = []
-    warnings = []
-    
-    # 1. 문제 수 확인 (완화: 최소 1개 이상)
-    for game in ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']:
-        count = len(quiz_data.get(game, []))
-        if count == 0:
-            errors.append(f"{game}: 문제 없음 (최소 1개 필요)")
-        elif count != 2:
-            warnings.append(f"{game}: {count}개 문제 (2개 권장)")
-    
-    # 2. 필수 필드 확인 (필수)
-    required_fields = ['question', 'options', 'correctAnswer']
-    for game, questions in quiz_data.items():
-        for i, q in enumerate(questions):
-            for field in required_fields:
-                if field not in q:
-                    errors.append(f"{game} 문제{i+1}: {field} 필드 누락")
-            # 선택지 개수 확인
-            if 'options' in q and len(q['options']) != 4:
-                errors.append(f"{game} 문제{i+1}: 선택지 {len(q['options'])}개 (4개 필요)")
-    
-    # 3. 정답 번호 확인 (경고만)
-    for game, questions in quiz_data.items():
-        if len(questions) >= 2:
-            answers = [q.get('correctAnswer') for q in questions]
-            if len(set(answers)) < 2:
-                warnings.append(f"{game}: 정답 번호 중복 ({answers}) - 권장하지 않지만 진행")
-    
-    is_valid = len(errors) == 0
-    
-    if is_valid:
-        print("✅ 품질 검증 통과")
-        if warnings:
-            print("⚠️ 경고사항:")
-            for warning in warnings:
-                print(f"   - {warning}")
+    if report['valid']:
+        if report['warnings']:
+            log.warning("품질 검증 경고", score=report['score'], warnings=report['warnings'])
     else:
-        print(f"❌ 품질 검증 실패:")
-        for error in errors:
-            print(f"   - {error}")
+        log.warning("품질 검증 오류", errors=report['errors'])
     
-    return is_valid, errors
+    return report
+
+
+def build_quiz_items(quiz_data, date, edition=DEFAULT_EDITION):
+    """게임별 DynamoDB 아이템 (standard 외 에디션은 PK = QUIZ#{gameType}#{edition})"""
+    now = datetime.now().isoformat()
+    return [
+        Quiz(game_type, date, [Question.from_dict(q) for q in quiz_data.get(game_type, [])],
+             edition=edition, created_at=now, updated_at=now).to_item()
+        for game_type in GAME_TYPES
+    ]
 
 
-def save_to_dynamodb(quiz_data, date):
+def save_to_dynamodb(quiz_data, date, edition=DEFAULT_EDITION):
     """DynamoDB에 퀴즈 저장"""
-    print("\n💾 DynamoDB에 저장 중...")
     
-    table = dynamodb.Table(DYNAMODB_TABLE)
+    table = _get_dynamodb().Table(DYNAMODB_TABLE)
     
     # 게임별로 저장
-    for game_type in ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']:
-        questions = quiz_data.get(game_type, [])
-        
-        item = {
-            'PK': f'QUIZ#{game_type}',
-            'SK': f'DATE#{date}',
-            'gameType': game_type,
-            'date': date,  # 기존 필드명 유지
-            'questions': questions,
-            'createdAt': datetime.now().isoformat(),
-            'updatedAt': datetime.now().isoformat()
-        }
-        
+    for item in build_quiz_items(quiz_data, date, edition):
         table.put_item(Item=item)
-        print(f"  ✅ {game_type} 저장 완료 ({len(questions)}개 문제)")
+        log.debug("DynamoDB 저장", gameType=item['gameType'], date=date, count=len(item['questions']))
     
-    print("✅ DynamoDB 저장 완료")
+    log.info("DynamoDB 저장 완료", date=date)
+
+
+def save_quizzes_batch(results):
+    """배치 생성 결과 일괄 저장 (batch_writer: 25개 단위 BatchWriteItem + 미처리 항목 자동 재시도)"""
+    table = _get_dynamodb().Table(DYNAMODB_TABLE)
+    count = 0
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as writer:
+        for result in results:
+            for item in build_quiz_items(result['quizData'], result['date'], result['edition']):
+                writer.put_item(Item=item)
+                count += 1
+    
+    log.info("DynamoDB 일괄 저장 완료", items=count)
+
+
+# init 단계 워밍 (Lambda에서만, SnapStart 런타임이면 스냅샷 전에 실행)
+PRIME_MODE = register_priming(prime)
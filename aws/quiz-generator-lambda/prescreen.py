@@ -0,0 +1,162 @@
+"""
+Step 1 사전 랭킹 (로컬, 결정적)
+후보 기사를 게임별로 점수화해 상위 k개씩만 Step 1 모델 호출에 보냄 → 후보 풀을 100개 이상으로 넓혀도 프롬프트 크기 유지
+
+점수 (게임별):
+- 패턴: game_matching_logic_v2.txt의 게임별 패턴 키워드 (주 키워드 + 보조 키워드 동시 출현 시 score_boost 전체, 주 키워드만 절반)
+- 특성: 인과(블랙스완) / 대립(딜레마) 표현 빈도, 수치 문장 밀도(시그널)
+- 용어: economic_terms.txt 용어 + 패턴 주 키워드 출현 수 (시그널 가중)
+- 리드: 제목/hilight에 나온 키워드 가산
+- 최신성: 반감기 RECENCY_HALF_LIFE_HOURS
+- 길이: 본문이 MIN_CONTENT_CHARS 미만이면 감점 (문제 3개를 만들 정보 부족)
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# 상수 정의
+RECENCY_HALF_LIFE_HOURS = 48
+RECENCY_WEIGHT = 10.0
+MIN_CONTENT_CHARS = 400
+SHORT_CONTENT_PENALTY = 20.0
+LENGTH_WEIGHT = 5.0
+LENGTH_SATURATION_CHARS = 1500
+TERM_WEIGHT = {'BlackSwan': 1.0, 'PrisonersDilemma': 0.5, 'SignalDecoding': 2.0}
+TERM_HIT_CAP = 10
+LEAD_BONUS = 0.5  # 제목/hilight에 주 키워드가 있는 패턴의 가산 비율
+FEATURE_WEIGHT = 15.0
+
+# game_matching_logic_v2.txt 패턴 블록 → 게임 타입
+PATTERN_SECTIONS = {
+    'BlackSwan': 'black_swan_patterns',
+    'PrisonersDilemma': 'dilemma_patterns',
+    'SignalDecoding': 'signal_patterns'
+}
+
+# 특성 지표 (game_matching_logic_v2.txt F1~F3)
+CAUSAL_MARKERS = ['때문에', '따라서', '결과적으로', '이로 인해', '영향으로', '여파로']
+CONTRAST_MARKERS = ['반면', '하지만', 'vs', '대비', '한편', '그러나']
+NUMERIC_SENTENCE = re.compile(r'\d[\d,.]*\s*(%|원|배|포인트|조|억|달러|bp)')
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+Pattern = Tuple[List[str], List[str], int]  # (주 키워드, 보조 키워드, score_boost)
+
+
+def _split_keywords(text: str) -> List[str]:
+    return [k.strip() for k in text.split(',') if k.strip()]
+
+
+def parse_patterns(game_matching_logic: str) -> Dict[str, List[Pattern]]:
+    """게임별 패턴 키워드/가산점 추출"""
+    patterns = {}
+    for game, section in PATTERN_SECTIONS.items():
+        block = re.search(rf'<{section}>(.*?)</{section}>', game_matching_logic, re.DOTALL)
+        patterns[game] = []
+        if not block:
+            continue
+        for body in re.findall(r'<pattern\b[^>]*>(.*?)</pattern>', block.group(1), re.DOTALL):
+            primary = re.search(r'<primary>(.*?)</primary>', body)
+            secondary = re.search(r'<secondary>(.*?)</secondary>', body)
+            boost = re.search(r'<score_boost>\+?(\d+)</score_boost>', body)
+            if primary:
+                patterns[game].append((
+                    _split_keywords(primary.group(1)),
+                    _split_keywords(secondary.group(1)) if secondary else [],
+                    int(boost.group(1)) if boost else 10
+                ))
+    return patterns
+
+
+def parse_terms(economic_terms: str) -> List[str]:
+    """경제 용어 사전의 용어명/약어"""
+    terms = re.findall(r'<(?:name|abbr)>([^<]+)</(?:name|abbr)>', economic_terms)
+    return sorted({t.strip() for t in terms if t.strip()})
+
+
+class ArticleRanker:
+    """게임별 기사 점수 계산 및 상위 k개 선정"""
+
+    def __init__(self, patterns: Dict[str, List[Pattern]], terms: List[str]):
+        self.patterns = patterns
+        primary = {k for game_patterns in patterns.values() for p in game_patterns for k in p[0]}
+        self.terms = sorted(set(terms) | primary)
+
+    @classmethod
+    def from_reference_files(cls, reference_files: Dict[str, str]) -> 'ArticleRanker':
+        """Step 1 참조 파일(load_prompt_files 결과)에서 생성"""
+        return cls(
+            parse_patterns(reference_files.get('game_matching_logic_v2.txt', '')),
+            parse_terms(reference_files.get('economic_terms.txt', ''))
+        )
+
+    def score(self, article: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, float]:
+        """기사 1건의 게임별 점수"""
+        title = article.get('title', '')
+        content = article.get('content', '')
+        lead = f"{title} {article.get('hilight', '')}"
+        text = f'{title} {content}'
+
+        # 공통 특성
+        term_hits = min(sum(1 for t in self.terms if t in text), TERM_HIT_CAP)
+        sentences = [s for s in SENTENCE_SPLIT.split(content) if s.strip()] or ['']
+        causal = sum(text.count(m) for m in CAUSAL_MARKERS) / len(sentences)
+        contrast = sum(text.count(m) for m in CONTRAST_MARKERS) / len(sentences)
+        numeric = sum(1 for s in sentences if NUMERIC_SENTENCE.search(s)) / len(sentences)
+        features = {'BlackSwan': causal, 'PrisonersDilemma': contrast, 'SignalDecoding': numeric}
+
+        common = self._recency(article.get('published_at', ''), now)
+        if len(content) < MIN_CONTENT_CHARS:
+            common -= SHORT_CONTENT_PENALTY
+        common += LENGTH_WEIGHT * min(len(content) / LENGTH_SATURATION_CHARS, 1.0)
+
+        scores = {}
+        for game, game_patterns in self.patterns.items():
+            pattern_score = 0.0
+            for primary, secondary, boost in game_patterns:
+                if not any(k in text for k in primary):
+                    continue
+                weight = 1.0 if any(k in text for k in secondary) else 0.5
+                if any(k in lead for k in primary):
+                    weight += LEAD_BONUS
+                pattern_score += boost * weight
+            scores[game] = round(pattern_score
+                                 + FEATURE_WEIGHT * min(features[game], 1.0)
+                                 + TERM_WEIGHT.get(game, 1.0) * term_hits
+                                 + common, 3)
+        return scores
+
+    @staticmethod
+    def _recency(published_at: str, now: Optional[datetime]) -> float:
+        try:
+            published = datetime.fromisoformat(published_at[:19])
+        except ValueError:
+            return 0.0
+        age_hours = max(((now or datetime.now()) - published).total_seconds() / 3600, 0.0)
+        return RECENCY_WEIGHT * 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+
+    def shortlist(self, articles: List[Dict[str, Any]], top_k: int,
+                  now: Optional[datetime] = None) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
+        """
+        게임별 상위 top_k개 (게임 간 중복 없이 번갈아 선정) → (선정 기사, 게임별 원본 인덱스)
+        동점은 원본 순서(최신순) 우선
+        """
+        scored = [self.score(article, now) for article in articles]
+        rankings = {
+            game: sorted(range(len(articles)), key=lambda i: (-scored[i][game], i))
+            for game in self.patterns
+        }
+        picked: Dict[str, List[int]] = {game: [] for game in self.patterns}
+        taken = set()
+        cursors = {game: 0 for game in self.patterns}
+        for _ in range(top_k):
+            for game, ranking in rankings.items():
+                while cursors[game] < len(ranking) and ranking[cursors[game]] in taken:
+                    cursors[game] += 1
+                if cursors[game] < len(ranking):
+                    index = ranking[cursors[game]]
+                    picked[game].append(index)
+                    taken.add(index)
+        order = [i for round_ in zip(*picked.values()) for i in round_]
+        order += [i for indices in picked.values() for i in indices if i not in order]
+        return [articles[i] for i in order], picked
@@ -0,0 +1,82 @@
+"""
+Step 2 구조화 출력 스키마 (Claude tool use)
+모델이 submit_quiz 도구 입력으로 퀴즈를 제출하면 이모지 텍스트 파싱 없이 바로 문항 dict로 변환
+check_schema는 이 스키마에 쓰는 JSON Schema 부분집합만 지원하는 경량 검사기 (jsonschema 의존성 없음)
+"""
+
+from typing import Any, Dict, List
+
+GAME_TYPES = ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']
+
+QUESTION_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'question': {'type': 'string', 'minLength': 1, 'description': '문제 본문'},
+        'options': {'type': 'array', 'items': {'type': 'string', 'minLength': 1}, 'minItems': 4, 'maxItems': 4,
+                    'description': '선택지 4개 (번호 기호 없이)'},
+        'correctAnswer': {'type': 'integer', 'minimum': 0, 'maximum': 3, 'description': '정답 선택지 인덱스 (0~3)'},
+        'explanation': {'type': 'string', 'minLength': 1, 'description': '정답 해설'},
+        'articleTitle': {'type': 'string', 'minLength': 1, 'description': '관련 기사 제목 (제공된 기사 제목 그대로)'},
+        'articleExcerpt': {'type': 'string', 'description': '관련 기사 핵심 인용문'}
+    },
+    'required': ['question', 'options', 'correctAnswer', 'explanation', 'articleTitle']
+}
+
+QUIZ_TOOL = {
+    'name': 'submit_quiz',
+    'description': '완성된 게임별 퀴즈 문항을 제출합니다. 게임별 2문항씩 작성합니다.',
+    'input_schema': {
+        'type': 'object',
+        'properties': {
+            game: {'type': 'array', 'items': QUESTION_SCHEMA, 'minItems': 1, 'maxItems': 2}
+            for game in GAME_TYPES
+        },
+        'required': GAME_TYPES
+    }
+}
+
+_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'integer': int,
+    'number': (int, float),
+    'boolean': bool
+}
+
+
+def check_schema(value: Any, schema: Dict[str, Any], path: str = '$') -> List[str]:
+    """JSON Schema 부분집합 검사 (type, properties, required, items, min/maxItems, minLength, minimum/maximum, enum) → 오류 목록"""
+    expected = schema.get('type')
+    if expected:
+        python_type = _TYPES[expected]
+        # bool은 int의 하위 타입이므로 integer/number에서 제외
+        if not isinstance(value, python_type) or (expected in ('integer', 'number') and isinstance(value, bool)):
+            return [f"{path}: {expected} 필요 ({type(value).__name__})"]
+
+    errors = []
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append(f"{path}: 허용되지 않은 값 ({value!r})")
+    if expected == 'string' and len(value.strip()) < schema.get('minLength', 0):
+        errors.append(f"{path}: 빈 문자열")
+    if expected in ('integer', 'number'):
+        if 'minimum' in schema and value < schema['minimum']:
+            errors.append(f"{path}: {schema['minimum']} 이상 필요 ({value})")
+        if 'maximum' in schema and value > schema['maximum']:
+            errors.append(f"{path}: {schema['maximum']} 이하 필요 ({value})")
+    if expected == 'array':
+        if len(value) < schema.get('minItems', 0):
+            errors.append(f"{path}: 항목 {schema['minItems']}개 이상 필요 ({len(value)}개)")
+        if 'maxItems' in schema and len(value) > schema['maxItems']:
+            errors.append(f"{path}: 항목 {schema['maxItems']}개 이하 필요 ({len(value)}개)")
+        if 'items' in schema:
+            for i, item in enumerate(value):
+                errors.extend(check_schema(item, schema['items'], f'{path}[{i}]'))
+    if expected == 'object':
+        for key in schema.get('required', []):
+            if key not in value:
+                errors.append(f"{path}.{key}: 필수 필드 누락")
+        for key, sub_schema in schema.get('properties', {}).items():
+            if key in value:
+                errors.extend(check_schema(value[key], sub_schema, f'{path}.{key}'))
+    return errors
@@ -0,0 +1,136 @@
+"""
+퀴즈 생성 파이프라인 녹화/재생 (record/replay)
+외부 I/O 함수(BigKinds, Bedrock, URL 스크래핑, DynamoDB 조회/저장)를 가로채
+실제 실행 결과를 픽스처 파일로 저장하고, 네트워크/AWS 없이 결정적으로 재생
+"""
+
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import lambda_function
+
+FIXTURE_VERSION = 1
+
+# 가로챌 외부 I/O 함수 (lambda_function 모듈 전역 이름)
+PATCHED_FUNCTIONS = [
+    'fetch_bigkinds_news',
+    'fetch_bigkinds_range',
+    'call_claude',
+    'convert_newsid_to_sedaily_url',
+    'query_recent_quizzes',
+    'save_to_dynamodb',
+    'save_quizzes_batch'
+]
+
+
+def call_key(name, args, kwargs):
+    """함수 이름 + 인자 해시 (재생 시 호출 매칭용)"""
+    payload = json.dumps([name, args, kwargs], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class ReplayMiss(Exception):
+    """재생 모드에서 픽스처에 없는 호출"""
+
+
+class Recorder:
+    """
+    mode='record': 실제 함수를 호출하고 결과/소요 시간을 기록
+    mode='replay': 픽스처에서 결과를 꺼내고 녹화된 소요 시간 × latency_scale 만큼 대기
+    """
+
+    def __init__(self, mode, fixture_path, latency_scale=1.0, strict=False):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.mode = mode
+        self.fixture_path = Path(fixture_path)
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.calls = []
+        self.saved = []  # 재생 모드에서 save_to_dynamodb로 전달된 데이터
+        self._originals = {}
+        self._lock = threading.Lock()
+        self._by_key = {}
+        self._by_order = {}
+
+        if mode == 'replay':
+            fixture = json.loads(self.fixture_path.read_text(encoding='utf-8'))
+            if fixture.get('version') != FIXTURE_VERSION:
+                raise ValueError(f"Unsupported fixture version: {fixture.get('version')}")
+            for record in fixture['calls']:
+                self._by_key.setdefault(record['key'], []).append(record)
+                self._by_order.setdefault(record['fn'], []).append(record)
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.uninstall()
+        if self.mode == 'record':
+            self.save()
+        return False
+
+    def install(self):
+        for name in PATCHED_FUNCTIONS:
+            self._originals[name] = getattr(lambda_function, name)
+            setattr(lambda_function, name, self._wrap(name))
+
+    def uninstall(self):
+        for name, original in self._originals.items():
+            setattr(lambda_function, name, original)
+        self._originals = {}
+
+    def _wrap(self, name):
+        def wrapper(*args, **kwargs):
+            if self.mode == 'record':
+                return self._record(name, args, kwargs)
+            return self._replay(name, args, kwargs)
+        wrapper.__name__ = name
+        return wrapper
+
+    def _record(self, name, args, kwargs):
+        start = time.perf_counter()
+        result = self._originals[name](*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.calls.append({
+                'fn': name,
+                'key': call_key(name, args, kwargs),
+                'result': result,
+                'elapsed': round(elapsed, 4)
+            })
+        return result
+
+    def _replay(self, name, args, kwargs):
+        key = call_key(name, args, kwargs)
+        with self._lock:
+            matches = self._by_key.get(key)
+            if matches:
+                record = matches.pop(0)
+                self._by_order[name].remove(record)
+            elif self.strict or not self._by_order.get(name):
+                raise ReplayMiss(f"{name} 호출이 픽스처에 없습니다 (key={key})")
+            else:
+                # 프롬프트 파일 변경 등으로 인자가 달라진 경우 녹화 순서대로 재생
+                record = self._by_order[name].pop(0)
+                self._by_key[record['key']].remove(record)
+            if name in ('save_to_dynamodb', 'save_quizzes_batch'):
+                self.saved.append({'args': args, 'kwargs': kwargs})
+
+        if self.latency_scale:
+            time.sleep(record['elapsed'] * self.latency_scale)
+        return record['result']
+
+    def save(self):
+        self.fixture_path.parent.mkdir(parents=True, exist_ok=True)
+        fixture = {
+            'version': FIXTURE_VERSION,
+            'recordedAt': datetime.now().isoformat(),
+            'calls': self.calls
+        }
+        self.fixture_path.write_text(json.dumps(fixture, ensure_ascii=False, indent=2), encoding='utf-8')
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+퀴즈 생성 파이프라인 오프라인 재생/프로파일링 스크립트
+
+사용법:
+    # 실제 실행 녹화 (BIGKINDS_API_KEY, AWS 자격증명 필요, 테스트 테이블에 저장)
+    python replay_local.py record fixtures/2026-02-06.json
+
+    # 녹화 재생 (네트워크/AWS 불필요), 녹화 지연 시간 0배로 CPU 구간만 측정
+    python replay_local.py replay fixtures/2026-02-06.json --latency-scale 0 --repeat 5
+
+    # cProfile로 전체 lambda_handler 프로파일링
+    python replay_local.py replay fixtures/2026-02-06.json --latency-scale 0 --profile
+
+    # 녹화 없이 합성 픽스처 생성
+    python replay_local.py synth fixtures/synthetic.json
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+# 환경 변수 설정 (테스트용)
+os.environ.setdefault('AWS_REGION', 'us-east-1')
+os.environ.setdefault('AWS_DEFAULT_REGION', os.environ['AWS_REGION'])
+os.environ.setdefault('DYNAMODB_TABLE', 'sedaily-quiz-data-test')
+
+CLOUDWATCH_EVENT_OVERHEAD_BYTES = 26  # CloudWatch Logs 수집 과금 시 이벤트당 추가 바이트
+
+GAMES = [
+    ('BlackSwan', '🌊 블랙스완 - 연쇄반응 분석', '블랙스완'),
+    ('PrisonersDilemma', '⚖️ 죄수의 딜레마 - 균형적 판단', '죄수의 딜레마'),
+    ('SignalDecoding', '🔍 시그널 디코딩 - 데이터 해석', '시그널 디코딩')
+]
+TOPICS = ['기준금리', '반도체 수출', '원·달러 환율', '가계부채', '부동산 PF', '국채 금리',
+          '소비자물가', '경상수지', '유가', '전기요금', '2차전지', '공매도']
+
+
+def make_articles(count=12, seed=0):
+    """합성 BigKinds 기사 목록"""
+    articles = []
+    base = datetime(2026, 2, 6, 9, 0)
+    for i in range(count):
+        topic = TOPICS[(i + seed) % len(TOPICS)]
+        articles.append({
+            'news_id': f'02100311.2026020{i % 9 + 1}{i:06d}',
+            'title': f'{topic} 변동에 시장 촉각…정부 "{i + 1}단계 대응 검토"',
+            'content': (f'{topic}이(가) 크게 움직이면서 금융시장과 실물경제에 미칠 파장이 커지고 있다. ' * 20),
+            'hilight': f'<b>{topic}</b> 변동 확대',
+            'published_at': (base - timedelta(hours=i * 5)).isoformat(),
+            'provider': '서울경제',
+            'category': ['경제>금융_재테크'],
+            'provider_link_page': f'https://www.sedaily.com/NewsView/2K{i:08d}?ref=kpf'
+        })
+    return articles
+
+
+def make_step2_output(articles, sets=2):
+    """parse_quiz_output 형식을 따르는 합성 Step 2 출력 (sets세트 × 3게임, 기사는 sets × 3개 이상)"""
+    problems = []
+    answers = []
+    symbols = ['①', '②', '③', '④']
+    for set_no in range(sets):
+        problems.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━\n【{set_no + 1}세트】\n")
+        answers.append(f"【{set_no + 1}세트】")
+        for game_idx, (_, header, label) in enumerate(GAMES):
+            article = articles[set_no * 3 + game_idx]
+            correct = (set_no + game_idx + 1) % 4
+            problems.append(
+                f"{header}\n\n"
+                f"{article['title'][:12]} 이후 시장 반응이 엇갈렸다. 가장 적절한 해석은?\n\n"
+                f"① 단기 유동성이 확대되기 때문이다\n"
+                f"② 수출 기업의 채산성이 개선된다\n"
+                f"③ 가계의 이자 부담이 줄어든다\n"
+                f"④ 외국인 자금이 유출될 수 있다\n\n"
+                f"📰 관련 기사: {article['title']}\n"
+                f"📝 \"{article['content'][:60]} 향후 정책 대응이 주목된다.\"\n"
+            )
+            answers.append(
+                f"**{label}: {symbols[correct]}**\n"
+                f"정답은 {symbols[correct]}이다. 기사에 따르면 시장 변화의 직접적인 원인은 정책 변화다. "
+                f"경제 원리상 가격 변화는 기대를 통해 전달된다. 향후 추가 대응이 예상된다.\n"
+            )
+    return "서울경제 AI GAMES\n경제 뉴스로 배우는 논리적 사고\n\n" + "\n".join(problems) + \
+        "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━\n📋 정답 및 해설\n\n" + "\n".join(answers)
+
+
+def make_tool_output(articles, sets=1):
+    """submit_quiz 도구 입력 형식의 합성 Step 2 출력 (STEP2_OUTPUT_FORMAT=tool, 게임별 sets × 2문항)"""
+    output = {}
+    for game_idx, (game, _, _) in enumerate(GAMES):
+        output[game] = []
+        for n in range(sets * 2):
+            article = articles[(n * 3 + game_idx) % len(articles)]
+            output[game].append({
+                'question': f"{article['title'][:12]} 이후 시장 반응이 엇갈렸다. 가장 적절한 해석은?",
+                'options': ['단기 유동성이 확대되기 때문이다', '수출 기업의 채산성이 개선된다',
+                            '가계의 이자 부담이 줄어든다', '외국인 자금이 유출될 수 있다'],
+                'correctAnswer': (n + game_idx + 1) % 4,
+                'explanation': '기사에 따르면 시장 변화의 직접적인 원인은 정책 변화다. 경제 원리상 가격 변화는 기대를 통해 전달된다.',
+                'articleTitle': article['title'],
+                'articleExcerpt': f"{article['content'][:60]} 향후 정책 대응이 주목된다."
+            })
+    return output
+
+
+def build_synthetic_fixture(path, unknown_titles=False, structured=False):
+    """녹화 없이 재생 가능한 합성 픽스처 생성 (호출 순서 기반 재생)"""
+    from replay import FIXTURE_VERSION
+
+    articles = make_articles()
+    # unknown_titles: Step 2가 BigKinds 목록에 없는 제목을 쓴 경우 (URL 매칭 fallback 경로)
+    quiz_articles = make_articles(seed=5) if unknown_titles else articles
+    calls = [
+        {'fn': 'fetch_bigkinds_news', 'key': 'synthetic', 'result': articles, 'elapsed': 1.2},
+        {'fn': 'query_recent_quizzes', 'key': 'synthetic', 'result': [], 'elapsed': 0.05},
+        {'fn': 'call_claude', 'key': 'synthetic', 'result': '(합성) Step 1 스크리닝 결과', 'elapsed': 25.0},
+        {'fn': 'call_claude', 'key': 'synthetic',
+         'result': make_tool_output(quiz_articles) if structured else make_step2_output(quiz_articles), 'elapsed': 60.0},
+        {'fn': 'save_to_dynamodb', 'key': 'synthetic', 'result': None, 'elapsed': 0.3}
+    ]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps({
+        'version': FIXTURE_VERSION,
+        'recordedAt': datetime.now().isoformat(),
+        'calls': calls
+    }, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"✅ 합성 픽스처 생성: {path}")
+
+
+def load_env_file():
+    """.env 파일에서 BIGKINDS_API_KEY 로드 (test_local.py와 동일)"""
+    env_file = Path(__file__).parent.parent.parent / '.env'
+    if env_file.exists():
+        for line in env_file.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                if key == 'BIGKINDS_API_KEY':
+                    os.environ['BIGKINDS_API_KEY'] = value.strip()
+
+
+def run_record(fixture):
+    load_env_file()
+    import lambda_function
+    from replay import Recorder
+
+    with Recorder('record', fixture):
+        result = lambda_function.lambda_handler({}, None)
+    print(f"\n📼 녹화 완료: {fixture} (statusCode={result['statusCode']})")
+
+
+class LogVolume(io.TextIOBase):
+    """stdout 대체 스트림: 출력 바이트/줄 수만 집계 (CloudWatch Logs 수집량 추정용)"""
+
+    def __init__(self):
+        self.bytes = 0
+        self.lines = 0
+
+    def write(self, text):
+        self.bytes += len(text.encode('utf-8'))
+        self.lines += text.count('\n')
+        return len(text)
+
+
+def run_replay(fixture, latency_scale, repeat, profile, strict, log_stats=False):
+    import lambda_function
+    from replay import Recorder
+
+    timings = []
+    volume = LogVolume()
+    profiler = cProfile.Profile() if profile else None
+    for i in range(repeat):
+        with Recorder('replay', fixture, latency_scale=latency_scale, strict=strict) as recorder:
+            output = contextlib.redirect_stdout(volume) if log_stats else contextlib.nullcontext()
+            start = time.perf_counter()
+            if profiler:
+                profiler.enable()
+            with output:
+                result = lambda_function.lambda_handler({}, None)
+            if profiler:
+                profiler.disable()
+            timings.append(time.perf_counter() - start)
+        if result['statusCode'] != 200:
+            print(f"❌ 재생 {i + 1}: statusCode={result['statusCode']} {result['body']}")
+            sys.exit(1)
+
+    print("\n" + "=" * 60)
+    print(f"⏱️  재생 {repeat}회 (latency_scale={latency_scale})")
+    print(f"   min {min(timings) * 1000:.1f}ms / median {statistics.median(timings) * 1000:.1f}ms "
+          f"/ max {max(timings) * 1000:.1f}ms")
+    print(f"   저장 호출: {len(recorder.saved)}회")
+    if log_stats:
+        ingested = volume.bytes + volume.lines * CLOUDWATCH_EVENT_OVERHEAD_BYTES
+        print(f"   로그 출력: 실행당 {volume.lines / repeat:.0f}줄, {volume.bytes / repeat / 1024:.1f}KiB "
+              f"(CloudWatch 수집 추정 {ingested / repeat / 1024:.1f}KiB)")
+
+    if profiler:
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(25)
+        print(output.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='퀴즈 생성 파이프라인 녹화/재생')
+    parser.add_argument('mode', choices=['record', 'replay', 'synth'])
+    parser.add_argument('fixture', help='픽스처 파일 경로')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='녹화된 지연 시간 배율 (0이면 대기 없음)')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--profile', action='store_true', help='cProfile 결과 출력')
+    parser.add_argument('--strict', action='store_true', help='인자 해시가 다른 호출은 실패 처리')
+    parser.add_argument('--log-stats', action='store_true', help='실행 로그를 화면 대신 집계 (줄 수, 바이트)')
+    parser.add_argument('--unknown-titles', action='store_true', help='synth: 기사 제목이 매핑과 모두 어긋난 출력 생성')
+    parser.add_argument('--structured', action='store_true', help='synth: Step 2 출력을 submit_quiz 도구 입력으로 생성')
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        run_record(args.fixture)
+    elif args.mode == 'replay':
+        run_replay(args.fixture, args.latency_scale, args.repeat, args.profile, args.strict, args.log_stats)
+    else:
+        build_synthetic_fixture(args.fixture, args.unknown_titles, args.structured)
+
+
+if __name__ == '__main__':
+    main()
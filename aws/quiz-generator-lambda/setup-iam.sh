@@ -9,6 +9,12 @@ FUNCTION_NAME="sedaily-quiz-generator"
 REGION="us-east-1"
 ACCOUNT_ID=$(aws sts get-caller-identity --query Account --output text)
 
+# Bedrock 배치 추론 백엔드 (선택): 설정 시 작업 제출(iam:PassRole)과 배치 버킷 입출력 권한 추가
+BEDROCK_BATCH_S3_URI="${BEDROCK_BATCH_S3_URI:-}"
+BEDROCK_BATCH_ROLE_ARN="${BEDROCK_BATCH_ROLE_ARN:-}"
+BATCH_BUCKET="${BEDROCK_BATCH_S3_URI#s3://}"
+BATCH_BUCKET="${BATCH_BUCKET%%/*}"
+
 echo "=================================="
 echo "IAM 역할 및 Lambda 함수 설정"
 echo "=================================="
@@ -17,6 +23,40 @@ echo "Role Name: $ROLE_NAME"
 echo "Function Name: $FUNCTION_NAME"
 echo ""
 
+# 고객 관리형 정책 생성 또는 갱신 후 역할에 연결
+# 이미 있으면 새 기본 버전으로 교체 (기존 계정에도 추가된 권한 반영, 정책 버전은 최대 5개라 가장 오래된 비기본 버전 삭제)
+upsert_policy() {
+    local name=$1 document=$2 description=$3
+    local arn="arn:aws:iam::${ACCOUNT_ID}:policy/${name}"
+
+    if aws iam get-policy --policy-arn $arn > /dev/null 2>&1; then
+        local versions=$(aws iam list-policy-versions --policy-arn $arn \
+            --query 'Versions[?!IsDefaultVersion].VersionId' --output text)
+        if [ $(echo $versions | wc -w) -ge 4 ]; then
+            aws iam delete-policy-version --policy-arn $arn \
+                --version-id $(echo $versions | tr ' \t' '\n' | sort -V | head -1)
+        fi
+        aws iam create-policy-version \
+            --policy-arn $arn \
+            --policy-document file://$document \
+            --set-as-default \
+            --no-cli-pager > /dev/null
+        echo "   정책 갱신 완료 (새 기본 버전)"
+    else
+        aws iam create-policy \
+            --policy-name $name \
+            --policy-document file://$document \
+            --description "$description" \
+            --no-cli-pager
+        echo "   정책 생성 완료"
+    fi
+
+    aws iam attach-role-policy \
+        --role-name $ROLE_NAME \
+        --policy-arn $arn \
+        --no-cli-pager 2>/dev/null || echo "   (이미 추가됨)"
+}
+
 # 1. IAM 역할 생성
 echo "📝 1. IAM 역할 생성 중..."
 
@@ -58,6 +98,40 @@ aws iam attach-role-policy \
 echo ""
 echo "🤖 3. Bedrock 권한 추가 중..."
 
+BATCH_STATEMENTS=""
+if [ -n "$BEDROCK_BATCH_S3_URI" ] && [ -n "$BEDROCK_BATCH_ROLE_ARN" ]; then
+    echo "   배치 추론 권한 포함: $BEDROCK_BATCH_S3_URI, $BEDROCK_BATCH_ROLE_ARN"
+    BATCH_STATEMENTS=$(cat <<EOF
+,
+    {
+      "Effect": "Allow",
+      "Action": "iam:PassRole",
+      "Resource": "${BEDROCK_BATCH_ROLE_ARN}",
+      "Condition": {
+        "StringEquals": {
+          "iam:PassedToService": "bedrock.amazonaws.com"
+        }
+      }
+    },
+    {
+      "Effect": "Allow",
+      "Action": [
+        "s3:GetObject",
+        "s3:PutObject"
+      ],
+      "Resource": "arn:aws:s3:::${BATCH_BUCKET}/*"
+    },
+    {
+      "Effect": "Allow",
+      "Action": "s3:ListBucket",
+      "Resource": "arn:aws:s3:::${BATCH_BUCKET}"
+    }
+EOF
+)
+else
+    echo "   (BEDROCK_BATCH_S3_URI/BEDROCK_BATCH_ROLE_ARN 미설정 → 배치 추론 권한 제외)"
+fi
+
 cat > bedrock-policy.json <<EOF
 {
   "Version": "2012-10-17",
@@ -68,28 +142,20 @@ cat > bedrock-policy.json <<EOF
         "bedrock:InvokeModel"
       ],
       "Resource": "arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-3-sonnet-20240229-v1:0"
-    }
+    },
+    {
+      "Effect": "Allow",
+      "Action": [
+        "bedrock:CreateModelInvocationJob",
+        "bedrock:GetModelInvocationJob"
+      ],
+      "Resource": "*"
+    }${BATCH_STATEMENTS}
   ]
 }
 EOF
 
-BEDROCK_POLICY_NAME="lambda-quiz-generator-bedrock-policy"
-
-if aws iam get-policy --policy-arn arn:aws:iam::${ACCOUNT_ID}:policy/${BEDROCK_POLICY_NAME} 2>/dev/null; then
-    echo "   정책이 이미 존재합니다"
-else
-    aws iam create-policy \
-        --policy-name $BEDROCK_POLICY_NAME \
-        --policy-document file://bedrock-policy.json \
-        --description "Bedrock Claude invocation permission" \
-        --no-cli-pager
-    echo "   정책 생성 완료"
-fi
-
-aws iam attach-role-policy \
-    --role-name $ROLE_NAME \
-    --policy-arn arn:aws:iam::${ACCOUNT_ID}:policy/${BEDROCK_POLICY_NAME} \
-    --no-cli-pager 2>/dev/null || echo "   (이미 추가됨)"
+upsert_policy lambda-quiz-generator-bedrock-policy bedrock-policy.json "Bedrock Claude invocation permission"
 
 echo "✅ Bedrock 권한 추가 완료"
 
@@ -105,6 +171,7 @@ cat > dynamodb-policy.json <<EOF
       "Effect": "Allow",
       "Action": [
         "dynamodb:PutItem",
+        "dynamodb:BatchWriteItem",
         "dynamodb:GetItem",
         "dynamodb:Query"
       ],
@@ -114,23 +181,7 @@ cat > dynamodb-policy.json <<EOF
 }
 EOF
 
-DYNAMODB_POLICY_NAME="lambda-quiz-generator-dynamodb-policy"
-
-if aws iam get-policy --policy-arn arn:aws:iam::${ACCOUNT_ID}:policy/${DYNAMODB_POLICY_NAME} 2>/dev/null; then
-    echo "   정책이 이미 존재합니다"
-else
-    aws iam create-policy \
-        --policy-name $DYNAMODB_POLICY_NAME \
-        --policy-document file://dynamodb-policy.json \
-        --description "DynamoDB quiz data write permission" \
-        --no-cli-pager
-    echo "   정책 생성 완료"
-fi
-
-aws iam attach-role-policy \
-    --role-name $ROLE_NAME \
-    --policy-arn arn:aws:iam::${ACCOUNT_ID}:policy/${DYNAMODB_POLICY_NAME} \
-    --no-cli-pager 2>/dev/null || echo "   (이미 추가됨)"
+upsert_policy lambda-quiz-generator-dynamodb-policy dynamodb-policy.json "DynamoDB quiz data write permission"
 
 echo "✅ DynamoDB 권한 추가 완료"
 
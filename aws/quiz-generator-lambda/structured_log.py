@@ -0,0 +1,111 @@
+"""
+퀴즈 생성 Lambda 구조화 로깅
+레벨이 있는 JSON 로그 한 줄(레코드)마다 실행 단위 상관관계 ID(runId)를 붙여 출력
+운영에서는 LOG_LEVEL=INFO로 DEBUG 레코드를 포맷 전에 버리고, 일부 실행만 DEBUG로 샘플링 가능
+"""
+
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+# 상수 정의
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+DEBUG_SAMPLE_RATE = float(os.environ.get('LOG_DEBUG_SAMPLE_RATE', '0'))  # DEBUG로 남길 실행 비율 (0~1)
+
+
+class JsonFormatter(logging.Formatter):
+    """LogRecord → JSON 한 줄 (CloudWatch Logs Insights에서 필드 단위 조회)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f'.{int(record.msecs):03d}Z',
+            'level': record.levelname,
+            'runId': getattr(record, 'run_id', None),
+            'msg': record.getMessage()
+        }
+        document.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            document['exc'] = self.formatException(record.exc_info)
+        return json.dumps(document, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+class _StdoutHandler(logging.Handler):
+    """호출 시점의 sys.stdout에 기록 (print와 같은 동작, 로컬 리다이렉트/캡처 지원)"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            sys.stdout.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+
+
+class StructuredLogger:
+    """
+    필드를 키워드 인자로 받는 로거
+    레벨이 꺼져 있으면 LogRecord 생성/JSON 직렬화 없이 바로 반환
+    """
+
+    def __init__(self, name: str, level: str = LOG_LEVEL, debug_sample_rate: float = DEBUG_SAMPLE_RATE):
+        self._logger = logging.getLogger(name)
+        self._logger.propagate = False  # Lambda 런타임 루트 핸들러로 중복 출력 방지
+        if not self._logger.handlers:
+            handler = _StdoutHandler()
+            handler.setFormatter(JsonFormatter())
+            self._logger.addHandler(handler)
+        self._base_level = getattr(logging, level, logging.INFO)
+        self._debug_sample_rate = debug_sample_rate
+        self._logger.setLevel(self._base_level)
+        self.run_id: Optional[str] = None
+        self._local = threading.local()
+
+    def start_run(self, run_id: Optional[str] = None) -> str:
+        """새 실행 시작: 상관관계 ID 지정(없으면 생성) 및 실행 단위 DEBUG 샘플링 결정"""
+        self.run_id = run_id or uuid.uuid4().hex
+        sampled = self._debug_sample_rate > 0 and random.random() < self._debug_sample_rate
+        self._logger.setLevel(logging.DEBUG if sampled else self._base_level)
+        return self.run_id
+
+    def bind(self, fn: Callable) -> Callable:
+        """fn을 현재 실행에 묶음 (다른 스레드에서 실행이 끝난 뒤 남긴 로그도 원래 runId로 기록)"""
+        run_id = self.run_id
+
+        @functools.wraps(fn)
+        def bound(*args, **kwargs):
+            self._local.run_id = run_id
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.run_id = None
+        return bound
+
+    def is_debug(self) -> bool:
+        return self._logger.isEnabledFor(logging.DEBUG)
+
+    def _log(self, level: int, msg: str, fields: Any, exc_info: bool = False) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
+        run_id = getattr(self._local, 'run_id', None) or self.run_id
+        self._logger.log(level, msg, exc_info=exc_info, extra={'run_id': run_id, 'fields': fields})
+
+    def debug(self, msg: str, **fields) -> None:
+        self._log(logging.DEBUG, msg, fields)
+
+    def info(self, msg: str, **fields) -> None:
+        self._log(logging.INFO, msg, fields)
+
+    def warning(self, msg: str, **fields) -> None:
+        self._log(logging.WARNING, msg, fields)
+
+    def error(self, msg: str, **fields) -> None:
+        self._log(logging.ERROR, msg, fields)
+
+    def exception(self, msg: str, **fields) -> None:
+        """ERROR 레벨 + 현재 예외의 traceback"""
+        self._log(logging.ERROR, msg, fields, exc_info=True)
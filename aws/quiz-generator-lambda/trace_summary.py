@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+퀴즈 생성 트레이스 요약 스크립트
+트레이스 폴더(TRACE_OUTPUT=<dir> 로컬 출력 또는 CloudWatch Logs 내보내기)를 읽어 단계별 지연 시간 분석
+
+사용법:
+    python trace_summary.py traces/
+    python trace_summary.py traces/ --slowest 5    # 가장 느린 실행 5건의 단계 분해도 출력
+
+입력 파일: *.json (트레이스 1건) 또는 *.log / *.jsonl (한 줄에 트레이스 1건, 다른 로그 줄은 무시)
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+def load_traces(folder):
+    """폴더 내 모든 OTLP JSON 트레이스 → span 목록의 리스트"""
+    traces = []
+    for path in sorted(Path(folder).rglob('*')):
+        if not path.is_file() or path.suffix not in ('.json', '.jsonl', '.log'):
+            continue
+        for line in path.read_text(encoding='utf-8').splitlines():
+            if '"resourceSpans"' not in line:
+                continue
+            try:
+                document = json.loads(line[line.index('{'):])
+            except ValueError:
+                continue
+            spans = [span
+                     for resource in document.get('resourceSpans', [])
+                     for scope in resource.get('scopeSpans', [])
+                     for span in scope.get('spans', [])]
+            if spans:
+                traces.append(spans)
+    return traces
+
+
+def attribute(span, key):
+    for item in span.get('attributes', []):
+        if item['key'] == key:
+            value = item['value']
+            raw = next(iter(value.values()))
+            return int(raw) if 'intValue' in value else raw
+    return None
+
+
+def duration_ms(span):
+    return (int(span['endTimeUnixNano']) - int(span['startTimeUnixNano'])) / 1e6
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[int(pct * (len(ordered) - 1))]
+
+
+def summarize(traces):
+    """span 이름별 지연 시간 통계 + 전체 실행 시간 대비 비중"""
+    by_name = defaultdict(list)
+    tokens = defaultdict(lambda: [0, 0])
+    errors = defaultdict(int)
+    total_root_ms = 0.0
+
+    for spans in traces:
+        for span in spans:
+            elapsed = duration_ms(span)
+            by_name[span['name']].append(elapsed)
+            if not span.get('parentSpanId'):
+                total_root_ms += elapsed
+            if span.get('status', {}).get('code') == 2:
+                errors[span['name']] += 1
+            tokens[span['name']][0] += attribute(span, 'gen_ai.usage.input_tokens') or 0
+            tokens[span['name']][1] += attribute(span, 'gen_ai.usage.output_tokens') or 0
+
+    rows = []
+    for name, values in by_name.items():
+        rows.append({
+            'name': name,
+            'count': len(values),
+            'total': sum(values),
+            'mean': statistics.mean(values),
+            'p50': percentile(values, 0.5),
+            'p95': percentile(values, 0.95),
+            'max': max(values),
+            'share': sum(values) / total_root_ms if total_root_ms else 0.0,
+            'errors': errors[name],
+            'tokens': tokens[name]
+        })
+    return sorted(rows, key=lambda r: -r['total'])
+
+
+def print_breakdown(spans):
+    """실행 1건의 span 트리"""
+    children = defaultdict(list)
+    for span in spans:
+        children[span.get('parentSpanId') or None].append(span)
+
+    def walk(parent_id, depth):
+        for span in sorted(children[parent_id], key=lambda s: int(s['startTimeUnixNano'])):
+            extra = []
+            for key in ('attempt', 'gen_ai.usage.input_tokens', 'gen_ai.usage.output_tokens'):
+                value = attribute(span, key)
+                if value is not None:
+                    extra.append(f"{key.split('.')[-1]}={value}")
+            status = ' ❌' if span.get('status', {}).get('code') == 2 else ''
+            print(f"   {'  ' * depth}{span['name']:<{40 - 2 * depth}} {duration_ms(span):10.1f}ms {' '.join(extra)}{status}")
+            walk(span['spanId'], depth + 1)
+
+    walk(None, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='퀴즈 생성 트레이스 요약')
+    parser.add_argument('folder')
+    parser.add_argument('--slowest', type=int, default=0, help='가장 느린 실행 N건의 span 트리 출력')
+    args = parser.parse_args()
+
+    traces = load_traces(args.folder)
+    if not traces:
+        print(f"❌ 트레이스를 찾지 못했습니다: {args.folder}")
+        sys.exit(1)
+
+    rows = summarize(traces)
+    print("=" * 100)
+    print(f"📊 트레이스 {len(traces)}건 단계별 지연 시간 (ms)")
+    print("=" * 100)
+    print(f"{'span':28} {'count':>6} {'mean':>9} {'p50':>9} {'p95':>9} {'max':>9} {'share':>7} {'err':>4} {'tokens in/out':>16}")
+    for r in rows:
+        token_text = f"{r['tokens'][0]}/{r['tokens'][1]}" if any(r['tokens']) else ''
+        print(f"{r['name']:28} {r['count']:6} {r['mean']:9.1f} {r['p50']:9.1f} {r['p95']:9.1f} "
+              f"{r['max']:9.1f} {r['share'] * 100:6.1f}% {r['errors']:4} {token_text:>16}")
+
+    if args.slowest:
+        roots = sorted(traces, key=lambda spans: -max(duration_ms(s) for s in spans if not s.get('parentSpanId')))
+        for spans in roots[:args.slowest]:
+            print("\n" + "-" * 100)
+            print(f"🐢 traceId={spans[0]['traceId']}")
+            print_breakdown(spans)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""
+퀴즈 생성 파이프라인 경량 트레이싱
+컨텍스트 매니저 span으로 단계별 소요 시간(단조 시계), 중첩, 토큰 수, 재시도 횟수를 기록하고
+실행당 하나의 OTLP(OpenTelemetry) JSON 호환 트레이스를 출력
+"""
+
+import functools
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 출력 대상: stdout(CloudWatch Logs 한 줄) | off | 디렉토리 경로(로컬, 실행별 파일)
+TRACE_OUTPUT = os.environ.get('TRACE_OUTPUT', 'stdout')
+SCOPE_NAME = 'g2.quiz-generator'
+
+
+class Span:
+    """단일 구간 (시작/종료는 perf_counter_ns, 출력 시 Unix 시각으로 환산)"""
+
+    __slots__ = ('name', 'span_id', 'parent_id', 'start_ns', 'end_ns', 'attributes', 'events', 'status', 'message')
+
+    def __init__(self, name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes)
+        self.events: List[Dict[str, Any]] = []
+        self.status = 'OK'
+        self.message = ''
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes) -> None:
+        self.events.append({'name': name, 'time_ns': time.perf_counter_ns(), 'attributes': attributes})
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    if isinstance(value, (list, tuple)):
+        return {'arrayValue': {'values': [_otlp_value(v) for v in value]}}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class Tracer:
+    """
+    실행(run) 단위 트레이서
+    start_trace()로 루트 span을 열고 finish()에서 트레이스 한 건을 출력
+    span 중첩은 스레드별 스택으로 추적하며, 스택이 빈 작업 스레드의 span은 루트 아래에 붙음
+    bind()로 실행에 묶은 작업 스레드는 그 실행이 끝나고 다음 트레이스가 시작되면 기록하지 않음
+    """
+
+    def __init__(self, service: str, output: str = TRACE_OUTPUT, stream=None):
+        self.service = service
+        self.output = output
+        self.stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.root: Optional[Span] = None
+        # 단조 시계 → Unix 시각 환산 기준점
+        self._epoch_ns = time.time_ns() - time.perf_counter_ns()
+
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def start_trace(self, name: str, **attributes) -> Span:
+        """새 실행 시작: 이전 트레이스를 버리고 루트 span 생성"""
+        self._reset()
+        self._local.stack = []
+        self.root = Span(name, None, attributes)
+        self.spans.append(self.root)
+        self._stack().append(self.root)
+        return self.root
+
+    def bind(self, fn: Callable) -> Callable:
+        """fn을 현재 트레이스에 묶음 (다른 스레드에서 실행, 그 사이 새 트레이스가 시작되면 span 기록 안 함)"""
+        trace_id = self.trace_id
+
+        @functools.wraps(fn)
+        def bound(*args, **kwargs):
+            self._local.trace_id = trace_id
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.trace_id = None
+        return bound
+
+    def _stale(self) -> bool:
+        trace_id = getattr(self._local, 'trace_id', None)
+        return trace_id is not None and trace_id != self.trace_id
+
+    def current_span(self) -> Optional[Span]:
+        stack = self._stack()
+        if stack:
+            return stack[-1]
+        return None if self._stale() else self.root
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """하위 구간 기록, 예외 발생 시 status=ERROR로 표시 후 예외 전파"""
+        if self._stale():
+            yield Span(name, None, attributes)  # 끝난 실행의 작업 스레드: 기록하지 않는 span
+            return
+        parent = self.current_span()
+        span = Span(name, parent.span_id if parent else None, attributes)
+        with self._lock:
+            self.spans.append(span)
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.status = 'ERROR'
+            span.message = str(e)[:500]
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            stack.pop()
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON (ExportTraceServiceRequest) 형태로 변환"""
+        def unix_ns(ns):
+            return str(self._epoch_ns + ns)
+
+        spans = []
+        for span in self.spans:
+            end_ns = span.end_ns if span.end_ns is not None else time.perf_counter_ns()
+            spans.append({
+                'traceId': self.trace_id,
+                'spanId': span.span_id,
+                'parentSpanId': span.parent_id or '',
+                'name': span.name,
+                'kind': 1,  # SPAN_KIND_INTERNAL
+                'startTimeUnixNano': unix_ns(span.start_ns),
+                'endTimeUnixNano': unix_ns(end_ns),
+                'attributes': _otlp_attributes(span.attributes),
+                'events': [{
+                    'name': event['name'],
+                    'timeUnixNano': unix_ns(event['time_ns']),
+                    'attributes': _otlp_attributes(event['attributes'])
+                } for event in span.events],
+                'status': {'code': 2 if span.status == 'ERROR' else 1, 'message': span.message}
+            })
+
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': _otlp_attributes({'service.name': self.service})},
+                'scopeSpans': [{'scope': {'name': SCOPE_NAME}, 'spans': spans}]
+            }]
+        }
+
+    def finish(self, error: Optional[str] = None) -> Dict[str, Any]:
+        """루트 span 종료 후 트레이스 출력, OTLP 딕셔너리 반환"""
+        if self.root and self.root.end_ns is None:
+            self.root.end_ns = time.perf_counter_ns()
+            if error:
+                self.root.status = 'ERROR'
+                self.root.message = error[:500]
+        self._local.stack = []
+
+        trace = self.to_otlp()
+        if self.output == 'off':
+            return trace
+        line = json.dumps(trace, ensure_ascii=False, separators=(',', ':'))
+        if self.output == 'stdout':
+            stream = self.stream or sys.stdout
+            stream.write(line + '\n')
+            stream.flush()
+        else:
+            directory = Path(self.output)
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / f'{self.trace_id}.json').write_text(line, encoding='utf-8')
+        return trace
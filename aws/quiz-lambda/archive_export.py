@@ -0,0 +1,336 @@
+"""
+퀴즈 아카이브 내보내기 (조회 API Lambda의 export 모드)
+/dates → 날짜별 GET을 반복하지 않고 테이블 전체를 병렬 세그먼트 Scan으로 읽어 gzip NDJSON 청크로 저장
+- 세그먼트(Segment/TotalSegments)마다 작업 스레드 1개, 스레드별 테이블 리소스 (boto3 리소스는 스레드 공유 불가)
+- 청크 = 객체 1개 (아이템 EXPORT_CHUNK_ITEMS개마다 교체), 압축 버퍼가 EXPORT_PART_BYTES를 넘을 때마다 멀티파트 업로드
+- manifest.json: 청크 목록(아이템 수, 바이트, sha256)과 세그먼트별 커서(LastEvaluatedKey)
+  커서는 청크가 완료된 뒤에만 전진 → Lambda 시간이 부족하면 페이지 경계에서 멈추고 이어서 실행 (status: partial)
+- 대상: S3Target(멀티파트) / LocalTarget(파일 시스템, 로컬 검증용) — export_local.py 참고
+
+Scan 세그먼트는 파티션 키 해시로 나뉘므로 유효 병렬도는 파티션 키 수(게임 × 에디션)를 넘지 않음
+
+호출: {"mode": "export", "bucket"?, "prefix"?, "segments"?, "resume"?: exportId}
+"""
+
+import gzip
+import hashlib
+import io
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from quiz_model import dumps, loads
+
+# 상수 정의
+EXPORT_BUCKET = os.environ.get('EXPORT_BUCKET', '')
+EXPORT_PREFIX = os.environ.get('EXPORT_PREFIX', 'exports/quiz')
+EXPORT_SEGMENTS = int(os.environ.get('EXPORT_SEGMENTS', '4'))
+EXPORT_PAGE_LIMIT = int(os.environ.get('EXPORT_PAGE_LIMIT', '0'))  # 0: DynamoDB 기본 페이지 (1MB)
+EXPORT_CHUNK_ITEMS = int(os.environ.get('EXPORT_CHUNK_ITEMS', '5000'))
+EXPORT_PART_BYTES = int(os.environ.get('EXPORT_PART_BYTES', str(8 * 1024 * 1024)))  # S3 최소 part 5MiB (마지막 제외)
+EXPORT_TIME_MARGIN_SECONDS = 30  # 남은 실행 시간이 이보다 적으면 현재 페이지 후 멈춤
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+EXPORT_FORMAT = 'ndjson.gz'
+
+
+# ===== 대상 =====
+
+class _LocalUpload:
+    """임시 파일에 이어 쓴 뒤 완료 시 이름 변경 (S3 멀티파트와 같은 원자성)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.partial = path.with_name(path.name + '.partial')
+        self.partial.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.partial, 'wb')
+
+    def upload_part(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def complete(self) -> None:
+        self.file.close()
+        self.partial.replace(self.path)
+
+    def abort(self) -> None:
+        self.file.close()
+        self.partial.unlink(missing_ok=True)
+
+
+class LocalTarget:
+    """파일 시스템 대상 (키 = root 아래 상대 경로)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def begin(self, key: str) -> _LocalUpload:
+        return _LocalUpload(self.root / key)
+
+    def put(self, key: str, data: bytes) -> None:
+        upload = self.begin(key)
+        upload.upload_part(data)
+        upload.complete()
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.root / key
+        return path.read_bytes() if path.exists() else None
+
+    def url(self, key: str) -> str:
+        return str(self.root / key)
+
+
+class _S3Upload:
+    """S3 멀티파트 업로드 1개"""
+
+    def __init__(self, client, bucket: str, key: str):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.upload_id = client.create_multipart_upload(Bucket=bucket, Key=key,
+                                                        ContentType='application/x-ndjson',
+                                                        ContentEncoding='gzip')['UploadId']
+        self.parts: List[Dict[str, Any]] = []
+
+    def upload_part(self, data: bytes) -> None:
+        number = len(self.parts) + 1
+        response = self.client.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+                                           PartNumber=number, Body=data)
+        self.parts.append({'PartNumber': number, 'ETag': response['ETag']})
+
+    def complete(self) -> None:
+        self.client.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id,
+                                              MultipartUpload={'Parts': self.parts})
+
+    def abort(self) -> None:
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+
+
+class S3Target:
+    """S3 대상 (키 = prefix 아래 상대 경로, 클라이언트는 스레드 간 공유 가능)"""
+
+    def __init__(self, bucket: str, prefix: str = EXPORT_PREFIX, client=None):
+        if client is None:
+            import boto3
+            client = boto3.client('s3')
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix.strip('/')
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def begin(self, key: str) -> _S3Upload:
+        return _S3Upload(self.client, self.bucket, self._key(key))
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data, ContentType='application/json')
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=self._key(key))['Body'].read()
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+    def url(self, key: str) -> str:
+        return f"s3://{self.bucket}/{self._key(key)}"
+
+
+# ===== 청크 =====
+
+class ChunkWriter:
+    """gzip NDJSON 청크 1개 (압축 결과를 part 크기 단위로 업로드)"""
+
+    def __init__(self, target, key: str, part_bytes: int = EXPORT_PART_BYTES):
+        self.key = key
+        self.part_bytes = part_bytes
+        self.upload = target.begin(key)
+        self.buffer = io.BytesIO()
+        self.gzip = gzip.GzipFile(fileobj=self.buffer, mode='wb', mtime=0)
+        self.sha256 = hashlib.sha256()
+        self.items = 0
+        self.bytes = 0
+        self.parts = 0
+
+    def write(self, line: bytes) -> None:
+        self.gzip.write(line)
+        self.gzip.write(b'\n')
+        self.items += 1
+        if self.buffer.tell() >= self.part_bytes:
+            self._flush_part()
+
+    def _flush_part(self) -> None:
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.sha256.update(data)
+        self.bytes += len(data)
+        self.parts += 1
+        self.upload.upload_part(data)
+
+    def close(self) -> Dict[str, Any]:
+        """마지막 part 업로드 + 완료 → manifest 청크 항목"""
+        self.gzip.close()
+        self._flush_part()
+        self.upload.complete()
+        return {'key': self.key, 'items': self.items, 'bytes': self.bytes, 'parts': self.parts,
+                'sha256': self.sha256.hexdigest()}
+
+    def abort(self) -> None:
+        self.upload.abort()
+
+
+# ===== 세그먼트 Scan =====
+
+def export_segment(table, state: Dict[str, Any], total: int, target, export_id: str,
+                   deadline: Optional[float] = None, chunk_items: int = EXPORT_CHUNK_ITEMS,
+                   part_bytes: int = EXPORT_PART_BYTES) -> Dict[str, Any]:
+    """
+    세그먼트 1개 Scan → 청크 (state: manifest의 세그먼트 항목, 제자리 갱신)
+    state['cursor']는 완료된 청크까지의 위치 → 중간에 멈추거나 실패해도 그 지점부터 다시 실행 가능
+    """
+    segment = state['segment']
+    kwargs = {'Segment': segment, 'TotalSegments': total}
+    if EXPORT_PAGE_LIMIT:
+        kwargs['Limit'] = EXPORT_PAGE_LIMIT
+    cursor = state['cursor']
+    writer = None
+    try:
+        while True:
+            if cursor:
+                kwargs['ExclusiveStartKey'] = cursor
+            page = table.scan(**kwargs)
+            for item in page.get('Items', []):
+                if writer is None:
+                    key = f"{export_id}/part-{segment:03d}-{len(state['chunks']):05d}.{EXPORT_FORMAT}"
+                    writer = ChunkWriter(target, key, part_bytes)
+                writer.write(dumps(item).encode('utf-8'))
+            cursor = page.get('LastEvaluatedKey')
+            stopping = deadline is not None and time.monotonic() >= deadline
+            if cursor is None or stopping or (writer and writer.items >= chunk_items):
+                if writer:
+                    chunk = writer.close()
+                    writer = None
+                    state['chunks'].append(chunk)
+                    state['items'] += chunk['items']
+                state['cursor'] = cursor
+            if cursor is None:
+                state['done'] = True
+                return state
+            if stopping:
+                return state
+    except Exception as e:
+        if writer:
+            writer.abort()
+        state['error'] = str(e)
+        print(f"Export segment {segment} error: {str(e)}")
+        return state
+
+
+def new_manifest(export_id: str, segments: int) -> Dict[str, Any]:
+    return {
+        'version': MANIFEST_VERSION,
+        'exportId': export_id,
+        'format': EXPORT_FORMAT,
+        'status': 'running',
+        'startedAt': datetime.now().isoformat(),
+        'totalSegments': segments,
+        'segments': [{'segment': i, 'cursor': None, 'done': False, 'items': 0, 'chunks': []}
+                     for i in range(segments)]
+    }
+
+
+def export_archive(table_factory: Callable[[], Any], target, segments: int = EXPORT_SEGMENTS,
+                   manifest: Optional[Dict[str, Any]] = None, deadline: Optional[float] = None,
+                   chunk_items: int = EXPORT_CHUNK_ITEMS, part_bytes: int = EXPORT_PART_BYTES) -> Dict[str, Any]:
+    """
+    병렬 세그먼트 Scan 내보내기 → manifest (대상에 {exportId}/manifest.json으로도 저장)
+    table_factory: 작업 스레드마다 호출 (스레드별 테이블 객체)
+    manifest: 이어서 실행할 기존 manifest (세그먼트 수는 기존 값 유지, 커서가 세그먼트별이므로)
+    deadline: time.monotonic() 기준 멈출 시각 (None이면 끝까지)
+    """
+    if manifest is None:
+        manifest = new_manifest(uuid.uuid4().hex[:12], segments)
+    total = manifest['totalSegments']
+    pending = [s for s in manifest['segments'] if not s['done']]
+    for state in pending:
+        state.pop('error', None)
+
+    start = time.perf_counter()
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            list(pool.map(lambda state: export_segment(table_factory(), state, total, target, manifest['exportId'],
+                                                       deadline, chunk_items, part_bytes), pending))
+
+    states = manifest['segments']
+    manifest['items'] = sum(s['items'] for s in states)
+    manifest['chunks'] = sum(len(s['chunks']) for s in states)
+    manifest['bytes'] = sum(c['bytes'] for s in states for c in s['chunks'])
+    if all(s['done'] for s in states):
+        manifest['status'] = 'complete'
+        manifest['completedAt'] = datetime.now().isoformat()
+    else:
+        manifest['status'] = 'failed' if any('error' in s for s in states) else 'partial'
+    manifest['updatedAt'] = datetime.now().isoformat()
+    manifest['lastRunSeconds'] = round(time.perf_counter() - start, 3)
+    target.put(f"{manifest['exportId']}/{MANIFEST_NAME}", dumps(manifest).encode('utf-8'))
+    return manifest
+
+
+def load_manifest(target, export_id: str) -> Optional[Dict[str, Any]]:
+    data = target.get(f"{export_id}/{MANIFEST_NAME}")
+    return loads(data) if data is not None else None
+
+
+def dynamodb_table_factory(table_name: str) -> Callable[[], Any]:
+    """스레드별 boto3 세션으로 테이블 리소스 생성"""
+    def create():
+        import boto3
+        return boto3.session.Session().resource('dynamodb').Table(table_name)
+    return create
+
+
+# ===== Lambda export 모드 =====
+
+def handle_export(event: Dict[str, Any], context, table_name: str) -> Dict[str, Any]:
+    """
+    export 모드 호출 처리 → manifest 요약
+    시간이 부족해 partial로 끝나면 같은 함수를 resume으로 비동기 재호출 (autoContinue: false로 끔)
+    """
+    bucket = event.get('bucket') or EXPORT_BUCKET
+    if not bucket:
+        return {'status': 'error', 'error': 'EXPORT_BUCKET not set'}
+    prefix = event.get('prefix') or EXPORT_PREFIX
+    target = S3Target(bucket, prefix)
+
+    manifest = None
+    if event.get('resume'):
+        manifest = load_manifest(target, event['resume'])
+        if manifest is None:
+            return {'status': 'error', 'error': f"Export {event['resume']} not found"}
+
+    deadline = None
+    if context is not None:
+        remaining = context.get_remaining_time_in_millis() / 1000
+        deadline = time.monotonic() + remaining - EXPORT_TIME_MARGIN_SECONDS
+
+    manifest = export_archive(dynamodb_table_factory(table_name), target,
+                              segments=int(event.get('segments') or EXPORT_SEGMENTS),
+                              manifest=manifest, deadline=deadline)
+    print(f"Export {manifest['exportId']} {manifest['status']}: {manifest['items']} items, "
+          f"{manifest['chunks']} chunks, {manifest['lastRunSeconds']}s")
+
+    if manifest['status'] == 'partial' and context is not None and event.get('autoContinue', True):
+        import boto3
+        boto3.client('lambda').invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType='Event',
+            Payload=dumps(dict(event, resume=manifest['exportId'], bucket=bucket, prefix=prefix)).encode('utf-8')
+        )
+
+    summary = {key: manifest.get(key) for key in ('exportId', 'status', 'items', 'chunks', 'bytes', 'lastRunSeconds')}
+    summary['manifest'] = target.url(f"{manifest['exportId']}/{MANIFEST_NAME}")
+    return summary
@@ -0,0 +1,162 @@
+"""
+퀴즈 일괄 가져오기 (POST /quiz/bulk)
+NDJSON 본문 한 줄 = 게임 1개 × 날짜 1개: {"gameType", "date"(또는 quizDate), "questions"(또는 data.questions), "edition"?}
+- 검증: 생성기와 같은 품질 규칙(quiz_rules), 게임 단위 규칙(game_missing)만 제외 → error가 있는 줄은 저장하지 않음
+- 저장: BatchWriteItem 25개 단위 청크를 동시에 쓰고 UnprocessedItems는 지수 백오프로 재시도
+- 결과: 줄별 상태(written | invalid | failed)로 부분 실패 보고, 저장된 줄은 변경 이벤트 하나로 알림
+"""
+
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from quiz_model import DEFAULT_EDITION, Question, Quiz
+from quiz_rules import GAME_TYPES, RULES, evaluate_quiz
+
+import change_events
+
+# 상수 정의
+BULK_MAX_LINES = 1000
+BATCH_WRITE_SIZE = 25  # BatchWriteItem 요청당 최대 아이템 수
+BATCH_WRITE_RETRIES = 6
+BATCH_WRITE_BACKOFF_SECONDS = 0.05
+BULK_WRITE_CONCURRENCY = 4
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# 한 줄 = 게임 하나이므로 '게임별 문제 존재' 규칙은 제외
+ITEM_RULES = [rule for rule in RULES if rule[0] != 'game_missing']
+
+
+def parse_lines(body: str) -> List[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """NDJSON → [(줄 번호, 레코드 또는 None, 파싱 오류)] (빈 줄 무시, 실수는 Decimal로)"""
+    records = []
+    for number, line in enumerate(body.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line, parse_float=Decimal)
+        except json.JSONDecodeError as e:
+            records.append((number, None, f"JSON 파싱 오류: {e.msg} (열 {e.colno})"))
+            continue
+        if not isinstance(record, dict):
+            records.append((number, None, "JSON 객체가 아님"))
+            continue
+        records.append((number, record, None))
+    return records
+
+
+def build_item(number: int, record: Dict[str, Any], now: str, marker: Dict[str, str]) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+    """레코드 검증 → (DynamoDB 아이템 또는 None, 줄 결과)"""
+    game_type = record.get('gameType') or ''
+    date = record.get('quizDate') or record.get('date') or ''
+    edition = record.get('edition') or DEFAULT_EDITION
+    data = record.get('data')
+    questions = data.get('questions') if isinstance(data, dict) and 'questions' in data else record.get('questions')
+    result = {'line': number, 'gameType': game_type, 'date': date}
+    if edition != DEFAULT_EDITION:
+        result['edition'] = edition
+
+    errors = []
+    if game_type not in GAME_TYPES:
+        errors.append(f"gameType 오류 ({game_type!r}, {' | '.join(GAME_TYPES)})")
+    if not DATE_PATTERN.match(str(date)):
+        errors.append(f"date 형식 오류 ({date!r}, YYYY-MM-DD)")
+    if not isinstance(questions, list) or not questions:
+        errors.append('questions 필요 (1개 이상)')
+    elif not all(isinstance(q, dict) for q in questions):
+        errors.append('questions 항목은 객체여야 함')
+    if errors:
+        return None, dict(result, status='invalid', errors=errors)
+
+    report = evaluate_quiz({game_type: questions}, rules=ITEM_RULES)
+    result.update(score=report['score'], warnings=report['warnings'])
+    if not report['valid']:
+        return None, dict(result, status='invalid', errors=report['errors'])
+
+    quiz = Quiz(game_type, date, [Question.from_dict(q) for q in questions], edition=edition,
+                created_at=now, updated_at=now, extra=dict(marker))
+    return quiz.to_item(), result
+
+
+def write_chunk(client, table_name: str, items: List[Dict[str, Any]]) -> Dict[Tuple[str, str], str]:
+    """BatchWriteItem 1청크 (미처리 항목 재시도) → 끝내 실패한 (PK, SK) → 오류 메시지"""
+    pending = [{'PutRequest': {'Item': item}} for item in items]
+    try:
+        for attempt in range(BATCH_WRITE_RETRIES):
+            response = client.batch_write_item(RequestItems={table_name: pending})
+            pending = response.get('UnprocessedItems', {}).get(table_name, [])
+            if not pending:
+                return {}
+            time.sleep(BATCH_WRITE_BACKOFF_SECONDS * 2 ** attempt)
+        message = f"처리되지 않음 (재시도 {BATCH_WRITE_RETRIES}회 후)"
+    except Exception as e:
+        message = str(e)
+    return {(r['PutRequest']['Item']['PK'], r['PutRequest']['Item']['SK']): message for r in pending}
+
+
+def bulk_import(body: str, table, dry_run: bool = False) -> Tuple[int, Dict[str, Any]]:
+    """NDJSON 일괄 가져오기 → (HTTP 상태 코드, 응답 본문)"""
+    records = parse_lines(body)
+    if not records:
+        return 400, {'error': 'NDJSON 본문이 비어 있음'}
+    if len(records) > BULK_MAX_LINES:
+        return 413, {'error': f"최대 {BULK_MAX_LINES}줄 ({len(records)}줄)"}
+
+    change_id = change_events.new_change_id()
+    marker = change_events.change_marker('bulk', change_id)
+    now = datetime.now().isoformat()
+    results = []
+    items = []  # (결과 인덱스, 아이템)
+    seen = {}  # (PK, SK) → 줄 번호 (같은 청크에 중복 키가 있으면 BatchWriteItem 전체가 실패)
+    for number, record, error in records:
+        if error:
+            results.append({'line': number, 'status': 'invalid', 'errors': [error]})
+            continue
+        item, result = build_item(number, record, now, marker)
+        if item is not None:
+            key = (item['PK'], item['SK'])
+            if key in seen:
+                item, result = None, dict(result, status='invalid', errors=[f"{seen[key]}번째 줄과 같은 게임/날짜"])
+            else:
+                seen[key] = number
+                items.append((len(results), item))
+        results.append(result)
+
+    failed_keys: Dict[Tuple[str, str], str] = {}
+    if items and not dry_run:
+        client = table.meta.client
+        chunks = [[item for _, item in items[i:i + BATCH_WRITE_SIZE]] for i in range(0, len(items), BATCH_WRITE_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(BULK_WRITE_CONCURRENCY, len(chunks))) as pool:
+            for failures in pool.map(lambda chunk: write_chunk(client, table.name, chunk), chunks):
+                failed_keys.update(failures)
+
+    written = []
+    for index, item in items:
+        error = failed_keys.get((item['PK'], item['SK']))
+        if dry_run:
+            results[index]['status'] = 'valid'
+        elif error:
+            results[index].update(status='failed', errors=[error])
+        else:
+            results[index]['status'] = 'written'
+            written.append({'gameType': item['gameType'], 'date': item['date'],
+                            'edition': item.get('edition', DEFAULT_EDITION)})
+
+    counts = {status: sum(1 for r in results if r['status'] == status)
+              for status in ('written', 'valid', 'invalid', 'failed')}
+    response = {
+        'importId': change_id,
+        'dryRun': dry_run,
+        'total': len(results),
+        **counts,
+        'notified': bool(written) and change_events.notify_change('bulk', change_id, written) is not None,
+        'results': results
+    }
+    problems = counts['invalid'] + counts['failed']
+    if not problems:
+        return 200, response
+    return (207 if counts['written'] or counts['valid'] else 422), response
@@ -0,0 +1,54 @@
+"""
+퀴즈 변경 이벤트 (조회 API → 배포 트리거 Lambda)
+DynamoDB Streams는 아이템마다 레코드를 만들기 때문에 일괄 가져오기/부분 수정은 API가 직접 이벤트 하나로 알림
+- 이벤트: {'source': 'quiz-api', 'changeType': 'bulk' | 'patch', 'changeId', 'changes': [{'gameType', 'date', ...}]}
+- 알림을 보내는 쓰기는 아이템에 changeSource/changeId를 기록 → auto-deploy-trigger가 해당 스트림 레코드를 건너뜀
+- DEPLOY_TRIGGER_FUNCTION이 비어 있으면 알림 없이 기존 스트림 경로로 처리 (changeSource도 기록하지 않음)
+"""
+
+import json
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+# 상수 정의
+DEPLOY_TRIGGER_FUNCTION = os.environ.get('DEPLOY_TRIGGER_FUNCTION', '')
+EVENT_SOURCE = 'quiz-api'
+
+_lambda_client = None
+
+
+def _get_lambda():
+    global _lambda_client
+    if _lambda_client is None:
+        import boto3
+        _lambda_client = boto3.client('lambda')
+    return _lambda_client
+
+
+def enabled() -> bool:
+    return bool(DEPLOY_TRIGGER_FUNCTION)
+
+
+def new_change_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def change_marker(change_type: str, change_id: str) -> Dict[str, str]:
+    """쓰기 아이템에 넣을 표시 필드 (알림이 꺼져 있으면 빈 dict → 스트림 경로 유지)"""
+    if not enabled():
+        return {}
+    return {'changeSource': change_type, 'changeId': change_id}
+
+
+def notify_change(change_type: str, change_id: str, changes: List[Dict[str, Any]]) -> Optional[str]:
+    """변경 목록을 이벤트 하나로 배포 트리거에 비동기 전달 → 전달한 changeId (꺼져 있거나 변경 없음이면 None)"""
+    if not enabled() or not changes:
+        return None
+    payload = {'source': EVENT_SOURCE, 'changeType': change_type, 'changeId': change_id, 'changes': changes}
+    _get_lambda().invoke(
+        FunctionName=DEPLOY_TRIGGER_FUNCTION,
+        InvocationType='Event',
+        Payload=json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    )
+    return change_id
@@ -1,10 +1,15 @@
 #!/bin/bash
 
+set -e
+
 FUNCTION_NAME="sedaily-quiz-api"
 REGION="us-east-1"
 
 echo "📦 Creating deployment package..."
-zip -j function.zip handler.py
+rm -f function.zip
+# quiz-common 레이어 소스(quiz_model, quiz_rules, lambda_init)도 함께 포함 → 레이어 없이도 import 가능
+zip -j function.zip handler.py bulk_import.py question_patch.py change_events.py archive_export.py \
+  ../layers/quiz-common/python/*.py
 
 echo "🚀 Deploying to Lambda..."
 aws lambda update-function-code \
@@ -12,5 +17,17 @@ aws lambda update-function-code \
   --zip-file fileb://function.zip \
   --region $REGION
 
+# quiz-common 레이어는 orjson 제공용 (선택, ../layers/quiz-common/build.sh가 출력한 ARN)
+if [ -n "$QUIZ_COMMON_LAYER_ARN" ]; then
+  echo "🧩 Attaching layer: $QUIZ_COMMON_LAYER_ARN"
+  aws lambda wait function-updated --function-name $FUNCTION_NAME --region $REGION
+  aws lambda update-function-configuration \
+    --function-name $FUNCTION_NAME \
+    --layers $QUIZ_COMMON_LAYER_ARN \
+    --region $REGION > /dev/null
+else
+  echo "ℹ️  QUIZ_COMMON_LAYER_ARN not set - layer unchanged (quiz-common modules are bundled in function.zip)"
+fi
+
 echo "✅ Deployment complete!"
 rm function.zip
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+아카이브 내보내기 로컬 실행/검증 스크립트 (archive_export)
+기본: 메모리 DynamoDB 대역(세그먼트 Scan 지원) → 로컬 파일 시스템 대상, 결과 청크를 다시 읽어 검증
+- 검증: manifest의 sha256/바이트/아이템 수, 원본과 (PK, SK) 집합 일치, 중복 없음
+- --resume: 짧은 deadline으로 여러 번 나눠 실행 (Lambda 시간 제한 → partial → 이어서 실행 경로)
+
+사용법:
+    python export_local.py                                   # 합성 아이템 3000개, 4세그먼트
+    python export_local.py --items 20000 --segments 8 --page-latency 0.02
+    python export_local.py --resume --page-latency 0.01
+    python export_local.py --table sedaily-quiz-data --out /tmp/quiz-export   # 실제 테이블 (AWS 자격증명 필요)
+    python export_local.py --table sedaily-quiz-data --bucket my-bucket       # 실제 테이블 → S3
+"""
+
+import argparse
+import copy
+import gzip
+import hashlib
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'layers' / 'quiz-common' / 'python'))
+
+import archive_export
+from archive_export import LocalTarget, S3Target, export_archive
+
+GAMES = ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']
+EDITIONS = ['standard', 'junior', 'weekend']
+
+
+class MemoryTable:
+    """
+    DynamoDB 테이블 대역 (resource Table.scan 호환: Segment/TotalSegments, Limit, ExclusiveStartKey)
+    세그먼트는 실제처럼 파티션 키 해시로 배정 → 같은 PK의 아이템은 한 세그먼트
+    페이지 크기는 Limit 또는 page_items, page_latency로 페이지당 왕복 지연 흉내
+    """
+
+    def __init__(self, items, page_items=100, page_latency=0.0):
+        self.items = sorted(items, key=lambda item: (item['PK'], item['SK']))
+        self.page_items = page_items
+        self.page_latency = page_latency
+        self.scans = 0
+        self._lock = threading.Lock()
+
+    def scan(self, Segment=0, TotalSegments=1, Limit=None, ExclusiveStartKey=None):
+        with self._lock:
+            self.scans += 1
+        if self.page_latency:
+            time.sleep(self.page_latency)
+        rows = [item for item in self.items
+                if zlib.crc32(item['PK'].encode('utf-8')) % TotalSegments == Segment]
+        if ExclusiveStartKey:
+            start = (ExclusiveStartKey['PK'], ExclusiveStartKey['SK'])
+            rows = [item for item in rows if (item['PK'], item['SK']) > start]
+        page = rows[:Limit or self.page_items]
+        response = {'Items': copy.deepcopy(page),
+                    'Count': len(page)}
+        if len(rows) > len(page):
+            response['LastEvaluatedKey'] = {'PK': page[-1]['PK'], 'SK': page[-1]['SK']}
+        return response
+
+
+def make_items(count):
+    """합성 퀴즈 아이템 (게임 × 에디션 파티션, 날짜 SK, 숫자는 Decimal)"""
+    items = []
+    for i in range(count):
+        game = GAMES[i % len(GAMES)]
+        edition = EDITIONS[(i // len(GAMES)) % len(EDITIONS)]
+        day = i // (len(GAMES) * len(EDITIONS))
+        date = f"{2020 + day // 336}-{day // 28 % 12 + 1:02d}-{day % 28 + 1:02d}"
+        item = {
+            'PK': f'QUIZ#{game}' if edition == 'standard' else f'QUIZ#{game}#{edition}',
+            'SK': f'DATE#{date}',
+            'gameType': game,
+            'date': date,
+            'questions': [{
+                'question': f'{date} {game} 문제 {n + 1}: 기준금리 변화가 시장에 미치는 영향은?',
+                'options': ['채권 금리 상승', '환율 하락', '주가 상승', '물가 하락'],
+                'correctAnswer': Decimal(n % 4),
+                'explanation': '기준금리 인상은 차입 비용을 높여 가계와 기업의 이자 부담을 키운다. ' * 3,
+                'newsLink': f'https://www.sedaily.com/NewsView/{i:06d}{n}'
+            } for n in range(2)],
+            'createdAt': f'{date}T06:00:00',
+            'updatedAt': f'{date}T06:00:00'
+        }
+        if edition != 'standard':
+            item['edition'] = edition
+        items.append(item)
+    return items
+
+
+def verify(target, manifest, expected_keys):
+    """청크를 다시 읽어 manifest/원본과 비교 → 오류 목록"""
+    errors = []
+    seen = set()
+    for state in manifest['segments']:
+        for chunk in state['chunks']:
+            data = target.get(chunk['key'])
+            if data is None:
+                errors.append(f"{chunk['key']}: 없음")
+                continue
+            if len(data) != chunk['bytes'] or hashlib.sha256(data).hexdigest() != chunk['sha256']:
+                errors.append(f"{chunk['key']}: 바이트/sha256 불일치")
+            lines = gzip.decompress(data).decode('utf-8').splitlines()
+            if len(lines) != chunk['items']:
+                errors.append(f"{chunk['key']}: 아이템 {len(lines)}개 (manifest {chunk['items']}개)")
+            for line in lines:
+                item = json.loads(line)
+                key = (item['PK'], item['SK'])
+                if key in seen:
+                    errors.append(f"중복 아이템: {key}")
+                seen.add(key)
+    if expected_keys is not None and seen != expected_keys:
+        errors.append(f"아이템 집합 불일치 (누락 {len(expected_keys - seen)}개, 초과 {len(seen - expected_keys)}개)")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='아카이브 내보내기 로컬 실행/검증')
+    parser.add_argument('--items', type=int, default=3000, help='합성 아이템 수 (메모리 대역)')
+    parser.add_argument('--segments', type=int, default=archive_export.EXPORT_SEGMENTS)
+    parser.add_argument('--page-items', type=int, default=100, help='메모리 대역 페이지당 아이템 수')
+    parser.add_argument('--page-latency', type=float, default=0.0, help='메모리 대역 페이지당 지연(초)')
+    parser.add_argument('--chunk-items', type=int, default=500)
+    parser.add_argument('--part-bytes', type=int, default=64 * 1024, help='로컬 검증용 작은 part (S3는 5MiB 이상)')
+    parser.add_argument('--resume', action='store_true', help='짧은 deadline으로 나눠 실행 (partial → 이어서)')
+    parser.add_argument('--table', help='실제 DynamoDB 테이블 (지정 시 메모리 대역 대신)')
+    parser.add_argument('--bucket', help='S3 대상 버킷 (기본: 로컬 파일 시스템)')
+    parser.add_argument('--prefix', default=archive_export.EXPORT_PREFIX)
+    parser.add_argument('--out', help='로컬 대상 디렉토리 (기본: 임시 디렉토리, 검증 후 삭제)')
+    args = parser.parse_args()
+
+    if args.table:
+        table_factory = archive_export.dynamodb_table_factory(args.table)
+        source, expected_keys = None, None
+    else:
+        source = MemoryTable(make_items(args.items), args.page_items, args.page_latency)
+        table_factory = lambda: source
+        expected_keys = {(item['PK'], item['SK']) for item in source.items}
+
+    out = Path(args.out or tempfile.mkdtemp(prefix='quiz-export-'))
+    target = S3Target(args.bucket, args.prefix) if args.bucket else LocalTarget(out)
+    part_bytes = max(args.part_bytes, 5 * 1024 * 1024) if args.bucket else args.part_bytes
+
+    runs = 0
+    manifest = None
+    start = time.perf_counter()
+    while manifest is None or manifest['status'] == 'partial':
+        deadline = time.monotonic() + max(args.page_latency * 3, 0.005) if args.resume else None
+        manifest = export_archive(table_factory, target, segments=args.segments, manifest=manifest,
+                                  deadline=deadline, chunk_items=args.chunk_items, part_bytes=part_bytes)
+        runs += 1
+        if args.resume:
+            print(f"   실행 {runs}: {manifest['status']}, 누적 {manifest['items']}개")
+    elapsed = time.perf_counter() - start
+
+    print("=" * 72)
+    print(f"내보내기 {manifest['exportId']}: {manifest['status']} ({runs}회 실행, {elapsed * 1000:.1f}ms)")
+    print("=" * 72)
+    print(f"아이템 {manifest['items']}개, 청크 {manifest['chunks']}개, 압축 {manifest['bytes'] / 1024:.1f}KiB")
+    if source is not None:
+        print(f"Scan 호출 {source.scans}회 (페이지 {args.page_items}개)")
+    print(f"{'세그먼트':10} {'아이템':>8} {'청크':>6}")
+    for state in manifest['segments']:
+        print(f"{state['segment']:<10} {state['items']:>8} {len(state['chunks']):>6}"
+              + (f"  ❌ {state['error']}" if 'error' in state else ''))
+    print(f"manifest: {target.url(manifest['exportId'] + '/' + archive_export.MANIFEST_NAME)}")
+
+    errors = verify(target, manifest, expected_keys)
+    if not args.out and not args.bucket:
+        shutil.rmtree(out, ignore_errors=True)
+    if errors or manifest['status'] != 'complete':
+        print(f"\n❌ 검증 실패:")
+        for error in errors[:20]:
+            print(f"   - {error}")
+        sys.exit(1)
+    print("\n✅ 검증 통과 (sha256/아이템 수/원본 일치, 중복 없음)")
+
+
+if __name__ == '__main__':
+    main()
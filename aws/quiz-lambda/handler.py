@@ -1,52 +1,60 @@
+import base64
 import json
-import boto3
 import os
+import sys
 from datetime import datetime
-from decimal import Decimal
+from pathlib import Path
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'sedaily-quiz-data'))
+try:
+    from quiz_model import Question, Quiz, dumps
+except ImportError:
+    # 로컬 실행: 레이어 소스 직접 사용 (배포 시 deploy.sh가 패키지에 복사)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'layers' / 'quiz-common' / 'python'))
+    from quiz_model import Question, Quiz, dumps
+try:
+    from lambda_init import register_priming
+except ImportError:
+    # lambda_init 이전 quiz-common 레이어만 있는 경우: init 워밍 없이 동작 (테이블은 첫 요청에서 생성)
+    def register_priming(prime, after_restore=None):
+        return 'off'
+from archive_export import handle_export
+from bulk_import import bulk_import
+from question_patch import handle_patch
 
-def decimal_default(obj):
-    if isinstance(obj, Decimal):
-        return float(obj)
-    raise TypeError
+DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'sedaily-quiz-data')
+
+# DynamoDB 테이블 (Lambda에서는 init 단계 prime()에서 생성, 로컬 import 시에는 boto3를 로드하지 않음)
+table = None
+
+def _get_table():
+    global table
+    if table is None:
+        import boto3
+        table = boto3.resource('dynamodb').Table(DYNAMODB_TABLE)
+    return table
+
+def prime(deep=False):
+    """init 단계 워밍 (boto3 로드 + 테이블 리소스 생성, 네트워크 호출 없음)"""
+    _get_table()
 
 def cors_headers():
     return {
         'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, PATCH, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, If-Match',
+        'Access-Control-Expose-Headers': 'ETag',
         'Content-Type': 'application/json'
     }
 
 def transform_question(q, index):
-    """DynamoDB 퀴즈 데이터를 웹사이트 Question 타입으로 변환"""
-    correct_index = int(q.get('correctAnswer', 0))
-    options = q.get('options', [])
-    
-    # relatedArticle 처리
-    related_article = q.get('relatedArticle', {})
-    if not related_article:
-        # 레거시 필드 지원
-        related_article = {
-            'title': q.get('articleTitle', ''),
-            'excerpt': q.get('articleSummary', '')
-        }
-    
-    return {
-        'id': f"q{index + 1}",
-        'questionType': '객관식',
-        'question': q.get('question', ''),
-        'options': options,
-        'answer': options[correct_index] if correct_index < len(options) else '',
-        'explanation': q.get('explanation', ''),
-        'newsLink': q.get('newsLink', '#'),  # newsLink 필드 사용
-        'tags': '경제·금융',  # 기본 태그
-        'relatedArticle': related_article
-    }
+    """DynamoDB 퀴즈 데이터를 웹사이트 Question 타입으로 변환 (레거시 articleTitle/articleSummary 포함)"""
+    return Question.from_dict(q).to_api(index)
 
 def lambda_handler(event, context):
+    # export 모드 (API Gateway 외 직접 호출/스케줄: {"mode": "export", ...})
+    if event.get('mode') == 'export':
+        return handle_export(event, context, DYNAMODB_TABLE)
+    
     method = event.get('httpMethod')
     path = event.get('path', '').replace('/prod', '')
     
@@ -60,7 +68,7 @@ def lambda_handler(event, context):
             game_type = parts[1] if len(parts) > 1 else None
             if not game_type:
                 return {'statusCode': 400, 'headers': cors_headers(), 'body': json.dumps({'error': 'Invalid path'})}
-            response = table.query(
+            response = _get_table().query(
                 KeyConditionExpression='PK = :pk',
                 ExpressionAttributeValues={':pk': f'QUIZ#{game_type}'},
                 ProjectionExpression='SK, createdAt'
@@ -79,7 +87,7 @@ def lambda_handler(event, context):
                 game_type = parts[1]
                 date = parts[2]
             
-            result = table.get_item(
+            result = _get_table().get_item(
                 Key={'PK': f'QUIZ#{game_type}', 'SK': f'DATE#{date}'}
             )
             
@@ -90,23 +98,23 @@ def lambda_handler(event, context):
                     'body': json.dumps({'error': 'Quiz not found'})
                 }
             
-            # 데이터 변환
-            item = result['Item']
-            raw_questions = item.get('questions', [])
-            transformed_questions = [transform_question(q, i) for i, q in enumerate(raw_questions)]
-            
-            response_data = {
-                'gameType': item.get('gameType'),
-                'date': item.get('date'),
-                'questions': transformed_questions
-            }
-            
+            # 데이터 변환 (Decimal은 모델 생성 시 int로 변환, orjson 직렬화)
+            quiz = Quiz.from_item(result['Item'])
             return {
                 'statusCode': 200,
-                'headers': cors_headers(),
-                'body': json.dumps(response_data, default=decimal_default)
+                'headers': dict(cors_headers(), ETag=f'"{quiz.updated_at}"'),  # PATCH If-Match용
+                'body': quiz.to_api_json()
             }
         
+        # POST /quiz/bulk (NDJSON 일괄 가져오기, ?dryRun=true면 검증만)
+        if method == 'POST' and path.rstrip('/').endswith('/bulk'):
+            body = event.get('body') or ''
+            if event.get('isBase64Encoded'):
+                body = base64.b64decode(body).decode('utf-8')
+            dry_run = ((event.get('queryStringParameters') or {}).get('dryRun', '')).lower() == 'true'
+            status, result = bulk_import(body, _get_table(), dry_run=dry_run)
+            return {'statusCode': status, 'headers': cors_headers(), 'body': dumps(result)}
+        
         # POST /quiz/{gameType}
         if method == 'POST':
             body = json.loads(event.get('body', '{}'))
@@ -134,7 +142,7 @@ def lambda_handler(event, context):
                 'updatedAt': datetime.now().isoformat()
             }
             
-            table.put_item(Item=item)
+            _get_table().put_item(Item=item)
             
             return {
                 'statusCode': 201,
@@ -142,6 +150,12 @@ def lambda_handler(event, context):
                 'body': json.dumps({'message': 'Quiz created', 'date': date})
             }
         
+        # PATCH /quiz/{gameType}/{date}/{questionIndex} (문항 필드 부분 수정, If-Match: updatedAt)
+        if method == 'PATCH':
+            parts = [p for p in path.split('/') if p]
+            status, result, headers = handle_patch(event, _get_table(), parts)
+            return {'statusCode': status, 'headers': dict(cors_headers(), **headers), 'body': dumps(result)}
+        
         # DELETE /quiz/{gameType}/{date}
         if method == 'DELETE':
             parts = [p for p in path.split('/') if p]
@@ -149,7 +163,7 @@ def lambda_handler(event, context):
                 game_type = parts[1]
                 date = parts[2]
             
-            table.delete_item(
+            _get_table().delete_item(
                 Key={'PK': f'QUIZ#{game_type}', 'SK': f'DATE#{date}'}
             )
             
@@ -172,3 +186,6 @@ def lambda_handler(event, context):
             'headers': cors_headers(),
             'body': json.dumps({'error': str(e)})
         }
+
+# init 단계 워밍 (Lambda에서만, SnapStart 런타임이면 스냅샷 전에 실행)
+PRIME_MODE = register_priming(prime)
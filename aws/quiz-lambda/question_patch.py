@@ -0,0 +1,149 @@
+"""
+문항 부분 수정 (PATCH /quiz/{gameType}/{date}/{questionIndex})
+퀴즈 전체를 다시 쓰지 않고 UpdateItem `SET questions[i].field`로 바뀐 필드만 기록 (createdAt 유지)
+- 낙관적 동시성: updatedAt이 기대값과 같을 때만 쓰기 (If-Match 헤더 또는 본문 expectedUpdatedAt, 없으면 방금 읽은 값)
+  → 다른 수정이 먼저 반영됐으면 409 (다시 조회 후 재시도)
+- 검증: 수정 후 문항에 생성기와 같은 품질 규칙 적용, 해당 문항의 error만 거부 (다른 문항의 기존 문제는 경고로만)
+- 알림: 변경 이벤트에 게임/날짜/문항/필드를 담아 배포 트리거가 해당 게임 경로만 무효화
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from quiz_model import Question
+from quiz_rules import evaluate_quiz
+
+import change_events
+from bulk_import import ITEM_RULES
+
+# 상수 정의
+# 수정 가능한 필드 → 값 검사
+PATCHABLE_FIELDS = {
+    'question': lambda v: isinstance(v, str),
+    'options': lambda v: isinstance(v, list) and all(isinstance(o, str) for o in v),
+    'correctAnswer': lambda v: isinstance(v, (int, Decimal)) and not isinstance(v, bool) and v == int(v),
+    'explanation': lambda v: isinstance(v, str),
+    'newsLink': lambda v: isinstance(v, str),
+    'relatedArticle': lambda v: isinstance(v, dict) and set(v) <= {'title', 'excerpt'}
+                                and all(isinstance(t, str) for t in v.values())
+}
+EXPECTED_FIELD = 'expectedUpdatedAt'
+
+
+def _header(event: Dict[str, Any], name: str) -> Optional[str]:
+    """대소문자 무시 헤더 조회"""
+    for key, value in (event.get('headers') or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def expected_version(event: Dict[str, Any], body: Dict[str, Any]) -> Optional[str]:
+    """If-Match(ETag = updatedAt) 또는 본문 expectedUpdatedAt"""
+    value = _header(event, 'If-Match')
+    if value and value != '*':
+        return value.strip().removeprefix('W/').strip('"')
+    return body.get(EXPECTED_FIELD)
+
+
+def parse_changes(body: Dict[str, Any]) -> Tuple[Dict[str, Any], list]:
+    """본문 → (필드 → 값, 오류 목록)"""
+    changes = {k: v for k, v in body.items() if k != EXPECTED_FIELD}
+    errors = [f"수정할 수 없는 필드: {k}" for k in changes if k not in PATCHABLE_FIELDS]
+    errors += [f"{k} 값 형식 오류" for k, v in changes.items() if k in PATCHABLE_FIELDS and not PATCHABLE_FIELDS[k](v)]
+    if not changes:
+        errors.append(f"수정할 필드 필요 ({', '.join(PATCHABLE_FIELDS)})")
+    if 'correctAnswer' in changes and not errors:
+        changes['correctAnswer'] = int(changes['correctAnswer'])
+    return changes, errors
+
+
+def patch_question(table, game_type: str, date: str, index: int, changes: Dict[str, Any],
+                   expected: Optional[str]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+    """문항 1개 부분 수정 → (HTTP 상태 코드, 응답 본문, 추가 헤더)"""
+    key = {'PK': f'QUIZ#{game_type}', 'SK': f'DATE#{date}'}
+    item = table.get_item(Key=key, ConsistentRead=True).get('Item')
+    if not item:
+        return 404, {'error': 'Quiz not found'}, {}
+    questions = item.get('questions') or []
+    if not 0 <= index < len(questions):
+        return 404, {'error': f"Question {index} not found ({len(questions)} questions)"}, {}
+
+    current = item.get('updatedAt')
+    if expected is not None and expected != current:
+        return 409, {'error': 'Quiz was modified', 'updatedAt': current}, {'ETag': f'"{current}"'}
+
+    # 수정 후 문항 검증 (게임 전체로 평가해야 정답 위치 중복 등 게임 단위 경고도 포함)
+    merged = list(questions)
+    merged[index] = dict(questions[index], **changes)
+    report = evaluate_quiz({game_type: merged}, rules=ITEM_RULES)
+    errors = [d['message'] for d in report['diagnostics']
+              if d['severity'] == 'error' and d['questionIndex'] == index]
+    if errors:
+        return 422, {'error': 'Validation failed', 'errors': errors, 'warnings': report['warnings']}, {}
+
+    # SET questions[i].#f0 = :v0, ... (리스트 인덱스는 플레이스홀더 불가 → 정수 검증 후 리터럴)
+    now = datetime.now().isoformat()
+    change_id = change_events.new_change_id()
+    names = {'#q': 'questions', '#u': 'updatedAt'}
+    values = {':now': now}
+    assignments = []
+    for i, (field, value) in enumerate(changes.items()):
+        names[f'#f{i}'] = field
+        values[f':v{i}'] = value
+        assignments.append(f'#q[{index}].#f{i} = :v{i}')
+    assignments.append('#u = :now')
+    for field, value in change_events.change_marker('patch', change_id).items():
+        names[f'#{field}'] = field
+        values[f':{field}'] = value
+        assignments.append(f'#{field} = :{field}')
+    if current is None:
+        condition = 'attribute_exists(PK) AND attribute_not_exists(#u)'
+    else:
+        condition = '#u = :expected'
+        values[':expected'] = current
+
+    from botocore.exceptions import ClientError
+    try:
+        table.update_item(
+            Key=key,
+            UpdateExpression='SET ' + ', '.join(assignments),
+            ConditionExpression=condition,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
+        )
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ConditionalCheckFailedException':
+            raise
+        return 409, {'error': 'Quiz was modified'}, {}
+
+    change = {'gameType': game_type, 'date': date, 'questionIndex': index, 'fields': sorted(changes)}
+    notified = change_events.notify_change('patch', change_id, [change]) is not None
+    return 200, {
+        'message': 'Question updated',
+        'changeId': change_id,
+        'updatedAt': now,
+        'fields': change['fields'],
+        'score': report['score'],
+        'warnings': report['warnings'],
+        'notified': notified,
+        'question': Question.from_dict(merged[index]).to_api(index)
+    }, {'ETag': f'"{now}"'}
+
+
+def handle_patch(event: Dict[str, Any], table, parts) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+    """PATCH 요청 (parts = ['quiz', gameType, date, questionIndex]) → patch_question 결과"""
+    if len(parts) < 4 or not parts[3].isdigit():
+        return 400, {'error': 'Invalid path (/quiz/{gameType}/{date}/{questionIndex})'}, {}
+    try:
+        body = json.loads(event.get('body') or '{}', parse_float=Decimal)
+    except json.JSONDecodeError:
+        return 400, {'error': 'Invalid JSON body'}, {}
+    if not isinstance(body, dict):
+        return 400, {'error': 'Invalid JSON body'}, {}
+    changes, errors = parse_changes(body)
+    if errors:
+        return 400, {'error': 'Invalid patch', 'errors': errors}, {}
+    return patch_question(table, parts[1], parts[2], int(parts[3]), changes, expected_version(event, body))
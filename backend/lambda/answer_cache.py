@@ -0,0 +1,182 @@
+"""
+챗봇 답변 캐시
+키: 게임 유형 + 정규화된 질문 + 퀴즈 컨텍스트 해시 + 프롬프트 버전
+1단계: 정확 일치 (컨테이너 메모리 → DynamoDB)
+2단계(선택, 기본 꺼짐): 같은 퀴즈 컨텍스트의 최근 질문과 문자 bigram 유사도 기반 근사 일치
+  bigram은 '정답/오답', '인상/인하'처럼 한 글자 차이로 뜻이 뒤집히는 질문을 구분하지 못하므로
+  의미 신호(선택지 번호, 이유/정답/오답/배경 표현, 부정어, 방향어)가 모두 같은 후보만 비교
+TTL은 퀴즈 날짜 기준으로 만료
+"""
+
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import boto3
+
+from quiz_explainers import question_signals
+
+# 상수 정의
+AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+ANSWER_CACHE_TABLE = os.environ.get('ANSWER_CACHE_TABLE', '')
+ANSWER_CACHE_TTL_DAYS = int(os.environ.get('ANSWER_CACHE_TTL_DAYS', '2'))
+NEAR_DUP_ENABLED = os.environ.get('ANSWER_CACHE_NEAR_DUP', 'false').lower() == 'true'
+NEAR_DUP_THRESHOLD = float(os.environ.get('ANSWER_CACHE_SIMILARITY', '0.85'))
+NEAR_DUP_SCAN_LIMIT = 50
+RECENT_INDEX = os.environ.get('ANSWER_CACHE_RECENT_INDEX', 'RecentIndex')  # PK + createdAt GSI
+MEMORY_CACHE_SIZE = 512
+SHINGLE_SIZE = 2
+KST = timezone(timedelta(hours=9))
+
+_NON_WORD = re.compile(r'[^\w]+')
+_DIGITS = re.compile(r'\d+')
+# 있고 없음으로 뜻이 뒤집히는 표현 (정규화된 질문 기준, 공백 없음)
+_NEGATION = re.compile(r'않|못|없|아니|아닌|안되|안돼|안맞')
+# 방향/평가어: 짝 중 어느 쪽이 쓰였는지가 같아야 같은 질문
+_POLARITY = re.compile(r'인상|인하|상승|하락|증가|감소|확대|축소|강세|약세|흑자|적자|호재|악재|'
+                       r'긍정|부정|장점|단점|유리|불리|높|낮|오르|올라|내리|내려|늘|줄')
+
+# 컨테이너 메모리 캐시: (pk, sk) → item
+_memory_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+_table = None
+
+
+def _get_table():
+    global _table
+    if _table is None and ANSWER_CACHE_TABLE:
+        _table = boto3.resource('dynamodb', region_name=AWS_REGION).Table(ANSWER_CACHE_TABLE)
+    return _table
+
+
+def normalize_question(text: str) -> str:
+    """NFKC 정규화(②→2) 후 소문자, 공백/문장부호 제거"""
+    return _NON_WORD.sub('', unicodedata.normalize('NFKC', text).lower())
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _shingles(text: str) -> set:
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def _meaning(text: str) -> tuple:
+    """bigram 유사도로 구분되지 않는 의미 신호"""
+    return (_DIGITS.findall(text), question_signals(text), bool(_NEGATION.search(text)),
+            sorted(set(_POLARITY.findall(text))))
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    정규화된 질문 간 문자 bigram Dice 계수
+    숫자(선택지 번호 등), 질문 의도 표현, 부정어, 방향어가 다르면 다른 질문으로 취급
+    """
+    if _meaning(a) != _meaning(b):
+        return 0.0
+    shingles_a, shingles_b = _shingles(a), _shingles(b)
+    return 2 * len(shingles_a & shingles_b) / (len(shingles_a) + len(shingles_b))
+
+
+def build_cache_key(game_type: str, user_question: str, question_text: str, quiz_article_url: str,
+                    prompt_version: str) -> Dict[str, str]:
+    """캐시 키 생성 (PK: 게임/퀴즈 컨텍스트/프롬프트 버전, SK: 정규화 질문 해시)"""
+    normalized = normalize_question(user_question)
+    context_hash = _hash(f"{question_text.strip()}\n{quiz_article_url.strip()}")
+    return {
+        'PK': f"ANSWER#{game_type or 'NONE'}#{context_hash}#{prompt_version}",
+        'SK': f"Q#{_hash(normalized)}",
+        'normalized': normalized
+    }
+
+
+def _expires_at(quiz_date: Optional[str]) -> int:
+    """퀴즈 날짜(KST) 00시 + TTL 일수 → epoch 초"""
+    try:
+        base = datetime.strptime(quiz_date, '%Y-%m-%d').replace(tzinfo=KST)
+    except (TypeError, ValueError):
+        base = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+    return int((base + timedelta(days=ANSWER_CACHE_TTL_DAYS)).timestamp())
+
+
+def _remember(item: Dict[str, Any]) -> None:
+    key = (item['PK'], item['SK'])
+    _memory_cache[key] = item
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _is_live(item: Dict[str, Any]) -> bool:
+    return int(item.get('expiresAt', 0)) > time.time()
+
+
+def lookup(cache_key: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    캐시 조회, 결과 아이템에 tier('memory' | 'exact' | 'near')를 붙여 반환
+    없으면 None
+    """
+    pk, sk = cache_key['PK'], cache_key['SK']
+
+    item = _memory_cache.get((pk, sk))
+    if item and _is_live(item):
+        return dict(item, tier='memory')
+
+    table = _get_table()
+    if not table:
+        return None
+
+    item = table.get_item(Key={'PK': pk, 'SK': sk}).get('Item')
+    if item and _is_live(item):
+        _remember(item)
+        return dict(item, tier='exact')
+
+    if not NEAR_DUP_ENABLED:
+        return None
+
+    # 같은 퀴즈 컨텍스트의 최근 질문들과 유사도 비교 (기본 테이블은 SK=질문 해시 순서라 최신순 GSI 사용)
+    candidates = table.query(
+        IndexName=RECENT_INDEX,
+        KeyConditionExpression='PK = :pk',
+        ExpressionAttributeValues={':pk': pk},
+        ScanIndexForward=False,
+        Limit=NEAR_DUP_SCAN_LIMIT
+    ).get('Items', [])
+
+    best, best_score = None, 0.0
+    for candidate in candidates:
+        if not _is_live(candidate):
+            continue
+        score = similarity(cache_key['normalized'], candidate.get('normalized', ''))
+        if score > best_score:
+            best, best_score = candidate, score
+
+    if best and best_score >= NEAR_DUP_THRESHOLD:
+        return dict(best, tier='near', similarity=round(best_score, 3))
+    return None
+
+
+def store(cache_key: Dict[str, str], response: str, knowledge_sources: int,
+          quiz_date: Optional[str] = None) -> None:
+    """답변 저장 (메모리 + DynamoDB)"""
+    item = {
+        'PK': cache_key['PK'],
+        'SK': cache_key['SK'],
+        'normalized': cache_key['normalized'],
+        'response': response,
+        'knowledgeSources': knowledge_sources,
+        'createdAt': datetime.now().isoformat(),
+        'expiresAt': _expires_at(quiz_date)
+    }
+    _remember(item)
+
+    table = _get_table()
+    if table:
+        table.put_item(Item=item)
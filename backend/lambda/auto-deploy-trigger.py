@@ -1,6 +1,9 @@
 """
 DynamoDB Streams 트리거 Lambda
 새 퀴즈 업로드 시 자동으로 프론트엔드 배포
+- 스트림 레코드: 아이템마다 1건 (단건 POST/생성기)
+- 변경 이벤트: 조회 API의 일괄 가져오기/부분 수정이 직접 호출 (여러 아이템 → 무효화 1회)
+  해당 쓰기의 스트림 레코드는 changeSource 표시로 건너뜀
 """
 
 import json
@@ -16,20 +19,51 @@ S3_BUCKET = os.environ.get('S3_BUCKET', 'g2-frontend-ver2')
 CLOUDFRONT_ID = os.environ.get('CLOUDFRONT_ID', 'E8HKFQFSQLNHZ')
 SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN', '')
 
+# 게임별 프론트엔드 경로 (변경 이벤트는 해당 게임 경로만 무효화)
+GAME_PATHS = {
+    'BlackSwan': '/games/g1/*',
+    'PrisonersDilemma': '/games/g2/*',
+    'SignalDecoding': '/games/g3/*'
+}
+# 조회 API가 변경 이벤트로 직접 알리는 쓰기 (스트림 레코드 중복 처리 방지)
+EVENT_CHANGE_SOURCES = {'bulk', 'patch'}
+
+def invalidation_paths(game_types):
+    """변경된 게임 → 무효화 경로 (알 수 없는 게임이 있으면 전체)"""
+    if not game_types or any(g not in GAME_PATHS for g in game_types):
+        return ['/*']
+    return sorted({GAME_PATHS[g] for g in game_types})
+
+def describe_change(change):
+    label = f"{change.get('gameType')} - {change.get('date')}"
+    if 'questionIndex' in change:
+        label += f" 문제{change['questionIndex'] + 1} ({', '.join(change.get('fields', []))})"
+    return label
+
 def lambda_handler(event, context):
     """
-    DynamoDB Streams 이벤트 처리
+    DynamoDB Streams 이벤트 또는 조회 API 변경 이벤트 처리
     """
-    print(f"Received {len(event['Records'])} records")
-    
     new_quizzes = []
+    paths = ['/*']
+    
+    if 'changes' in event:
+        # 변경 이벤트: {'source': 'quiz-api', 'changeType', 'changeId', 'changes': [...]}
+        changes = event['changes']
+        print(f"Received {event.get('changeType')} change {event.get('changeId')} with {len(changes)} changes")
+        new_quizzes = [describe_change(c) for c in changes]
+        paths = invalidation_paths({c.get('gameType') for c in changes})
+    else:
+        print(f"Received {len(event['Records'])} records")
     
-    for record in event['Records']:
+    for record in event.get('Records', []):
         if record['eventName'] in ['INSERT', 'MODIFY']:
             # 새 퀴즈 감지
             new_image = record['dynamodb'].get('NewImage', {})
+            if new_image.get('changeSource', {}).get('S') in EVENT_CHANGE_SOURCES:
+                continue  # 변경 이벤트로 따로 처리됨
             game_type = new_image.get('gameType', {}).get('S', '')
-            quiz_date = new_image.get('quizDate', {}).get('S', '')
+            quiz_date = new_image.get('quizDate', {}).get('S', '') or new_image.get('date', {}).get('S', '')
             
             if game_type and quiz_date:
                 new_quizzes.append(f"{game_type} - {quiz_date}")
@@ -46,15 +80,15 @@ def lambda_handler(event, context):
             DistributionId=CLOUDFRONT_ID,
             InvalidationBatch={
                 'Paths': {
-                    'Quantity': 1,
-                    'Items': ['/*']
+                    'Quantity': len(paths),
+                    'Items': paths
                 },
                 'CallerReference': f'auto-deploy-{datetime.now().timestamp()}'
             }
         )
         
         invalidation_id = invalidation['Invalidation']['Id']
-        print(f"CloudFront invalidation created: {invalidation_id}")
+        print(f"CloudFront invalidation created: {invalidation_id} ({', '.join(paths)})")
         
         # SNS 알림
         if SNS_TOPIC_ARN:
@@ -64,7 +98,7 @@ def lambda_handler(event, context):
 새 퀴즈:
 {chr(10).join(f'- {q}' for q in new_quizzes)}
 
-CloudFront 무효화 ID: {invalidation_id}
+CloudFront 무효화 ID: {invalidation_id} ({', '.join(paths)})
 시간: {datetime.now().isoformat()}
 
 5-10분 후 반영됩니다.
@@ -82,6 +116,7 @@ CloudFront 무효화 ID: {invalidation_id}
             'body': json.dumps({
                 'message': 'Auto-deploy triggered',
                 'quizzes': new_quizzes,
+                'paths': paths,
                 'invalidation_id': invalidation_id
             })
         }
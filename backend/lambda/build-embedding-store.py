@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+퀴즈 테이블 → 챗봇 임베딩 저장소 오프라인 빌드 스크립트
+
+사용법:
+    python build-embedding-store.py --output s3://g2-chatbot-news-index/quiz_embeddings.npz
+    python build-embedding-store.py --output ./quiz_embeddings.npz --quantize --days 90
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+import boto3
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from embedding_store import EmbeddingStore, build_quiz_records, embed_text, save_store
+
+GAME_TYPES = ['BlackSwan', 'PrisonersDilemma', 'SignalDecoding']
+
+
+def scan_quiz_items(table_name, days=None):
+    """게임별 퀴즈 아이템 조회 (days가 주어지면 최근 N일만)"""
+    table = boto3.resource('dynamodb', region_name=os.environ.get('AWS_REGION', 'us-east-1')).Table(table_name)
+    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d') if days else '0000-00-00'
+
+    for game_type in GAME_TYPES:
+        kwargs = {
+            'KeyConditionExpression': 'PK = :pk AND SK >= :since',
+            'ExpressionAttributeValues': {':pk': f'QUIZ#{game_type}', ':since': f'DATE#{since}'}
+        }
+        while True:
+            response = table.query(**kwargs)
+            yield from response.get('Items', [])
+            if 'LastEvaluatedKey' not in response:
+                break
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='퀴즈 임베딩 저장소 빌드')
+    parser.add_argument('--output', required=True, help='저장 경로 (로컬 또는 s3://bucket/key)')
+    parser.add_argument('--table', default=os.environ.get('DYNAMODB_TABLE', 'sedaily-quiz-data'))
+    parser.add_argument('--days', type=int, default=None, help='최근 N일만 포함')
+    parser.add_argument('--quantize', action='store_true', help='int8 양자화 포맷으로 저장')
+    args = parser.parse_args()
+
+    records = []
+    for item in scan_quiz_items(args.table, args.days):
+        records.extend(build_quiz_records(item))
+    print(f"📋 임베딩 대상 레코드: {len(records)}개")
+
+    vectors = []
+    for i, record in enumerate(records, 1):
+        vectors.append(embed_text(record['text']))
+        if i % 50 == 0:
+            print(f"   {i}/{len(records)} 임베딩 완료")
+
+    store = EmbeddingStore.from_vectors(vectors, records, quantize=args.quantize)
+    size = save_store(store, args.output)
+    print(f"✅ 저장 완료: {args.output} ({len(store)}개, {size} bytes, int8={store.quantized})")
+
+
+if __name__ == '__main__':
+    main()
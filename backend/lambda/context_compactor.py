@@ -0,0 +1,92 @@
+"""
+RAG 컨텍스트 압축
+여러 소스(퀴즈 문제, 퀴즈 기사, BigKinds 뉴스)에 걸친 중복 문장을 문자 shingle 유사도로 제거하고,
+질문과의 겹침 정도로 문장을 순위화하여 토큰 예산 안에 맞춤
+"""
+
+import os
+import re
+from typing import Any, Dict, List
+
+# 상수 정의
+CONTEXT_TOKEN_BUDGET = int(os.environ.get('RAG_CONTEXT_TOKEN_BUDGET', '600'))
+CHARS_PER_TOKEN = 2.0  # 한국어 기준 대략치
+SHINGLE_SIZE = 4
+DEDUP_THRESHOLD = 0.6
+MIN_SENTENCE_CHARS = 8
+
+# 중복 제거 시 먼저 남길 소스 순서 (뒤 소스의 중복 문장이 제거됨)
+SOURCE_PRIORITY = {'quiz_context': 0, 'quiz_article': 1, 'quiz_knowledge': 2, 'news_search': 3}
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?。])\s+|(?<=다\.)|\n+')
+_NON_WORD = re.compile(r'[^\w]+')
+
+
+def estimate_tokens(text: str) -> int:
+    return int(len(text) / CHARS_PER_TOKEN) + 1
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text) if s and s.strip()]
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    normalized = _NON_WORD.sub('', text.lower())
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def compact_sources(sources: List[Dict[str, Any]], user_question: str,
+                    token_budget: int = CONTEXT_TOKEN_BUDGET) -> List[Dict[str, Any]]:
+    """
+    소스 목록 압축 → 같은 구조의 새 소스 목록 (content만 압축, 빈 소스는 제외)
+    퀴즈 문제(quiz_context)는 예산과 무관하게 항상 유지
+    """
+    order = sorted(range(len(sources)), key=lambda i: SOURCE_PRIORITY.get(sources[i].get('type'), 9))
+    question_shingles = _shingles(user_question, 2)
+
+    # 1. 소스 우선순위대로 문장을 모으며 중복 제거
+    kept = []  # (source_idx, sentence_idx, sentence, shingles, relevance)
+    for source_idx in order:
+        for sentence_idx, sentence in enumerate(split_sentences(sources[source_idx].get('content', ''))):
+            shingles = _shingles(sentence)
+            if len(sentence) < MIN_SENTENCE_CHARS and sources[source_idx].get('type') != 'quiz_context':
+                continue
+            if any(_jaccard(shingles, other[3]) >= DEDUP_THRESHOLD for other in kept):
+                continue
+            sentence_bigrams = _shingles(sentence, 2)
+            relevance = len(sentence_bigrams & question_shingles) / (len(question_shingles) or 1)
+            kept.append((source_idx, sentence_idx, sentence, shingles, relevance))
+
+    # 2. 질문 관련도 순으로 예산 안에서 선택 (quiz_context는 무조건 포함)
+    selected = []
+    remaining = token_budget
+    candidates = []
+    for item in kept:
+        if sources[item[0]].get('type') == 'quiz_context':
+            selected.append(item)
+            remaining -= estimate_tokens(item[2])
+        else:
+            candidates.append(item)
+
+    for item in sorted(candidates, key=lambda k: (-k[4], order.index(k[0]), k[1])):
+        cost = estimate_tokens(item[2])
+        if cost <= remaining:
+            selected.append(item)
+            remaining -= cost
+
+    # 3. 소스별로 원래 문장 순서대로 재조립
+    compacted = []
+    for source_idx, source in enumerate(sources):
+        sentences = sorted((k for k in selected if k[0] == source_idx), key=lambda k: k[1])
+        if not sentences:
+            continue
+        compacted.append(dict(source, content='\n'.join(k[2] for k in sentences)))
+    return compacted
@@ -0,0 +1,197 @@
+"""
+챗봇 RAG 임베딩 저장소
+퀴즈 문제/해설/관련 기사 발췌를 Titan 임베딩으로 변환한 NumPy 행렬과
+코사인 top-k 검색 (선택적으로 int8 양자화 포맷)
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+from news_index import read_index_file, write_index_file
+
+try:
+    from quiz_model import Quiz
+except ImportError:
+    # 로컬 실행: quiz-common 레이어 소스 사용 (배포 시 serverless.yml의 quizCommon 레이어)
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'aws' / 'layers' / 'quiz-common' / 'python'))
+    from quiz_model import Quiz
+
+# 상수 정의
+AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+EMBEDDING_MODEL_ID = 'amazon.titan-embed-text-v2:0'
+EMBEDDING_DIMENSIONS = 512
+EMBEDDING_TEXT_LIMIT = 2000
+DEFAULT_STORE_PATH = '/opt/embedding-store/quiz_embeddings.npz'
+STORE_REFRESH_SECONDS = 3600
+INT8_MAX = 127
+
+_bedrock = None
+_store_cache: Dict[str, Any] = {'store': None, 'path': None, 'loaded_at': 0.0}
+
+
+def _get_bedrock():
+    global _bedrock
+    if _bedrock is None:
+        _bedrock = boto3.client('bedrock-runtime', region_name=AWS_REGION)
+    return _bedrock
+
+
+def embed_text(text: str) -> List[float]:
+    """Titan 임베딩 호출 (정규화된 벡터 반환)"""
+    response = _get_bedrock().invoke_model(
+        modelId=EMBEDDING_MODEL_ID,
+        body=json.dumps({
+            'inputText': text[:EMBEDDING_TEXT_LIMIT],
+            'dimensions': EMBEDDING_DIMENSIONS,
+            'normalize': True
+        })
+    )
+    return json.loads(response['body'].read())['embedding']
+
+
+class EmbeddingStore:
+    """
+    임베딩 행렬 + 레코드 메타데이터
+    quantized=True이면 행렬은 int8, 행별 scale로 복원
+    """
+
+    def __init__(self, matrix, records: List[Dict[str, Any]], scales=None):
+        self.matrix = matrix
+        self.records = records
+        self.scales = scales
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def quantized(self) -> bool:
+        return self.scales is not None
+
+    @classmethod
+    def from_vectors(cls, vectors: List[List[float]], records: List[Dict[str, Any]],
+                     quantize: bool = False) -> 'EmbeddingStore':
+        """임베딩 목록으로 저장소 생성 (행 단위 L2 정규화)"""
+        import numpy as np
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.maximum(norms, 1e-12)
+
+        if not quantize:
+            return cls(matrix, records)
+
+        scales = np.abs(matrix).max(axis=1) / INT8_MAX
+        scales = np.maximum(scales, 1e-12).astype(np.float32)
+        quantized = np.round(matrix / scales[:, None]).astype(np.int8)
+        return cls(quantized, records, scales)
+
+    def search(self, query_vector: List[float], top_k: int = 4, game_type: Optional[str] = None,
+               min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """코사인 유사도 top-k (game_type이 주어지면 해당 게임 레코드만)"""
+        import numpy as np
+
+        if not self.records:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        if self.quantized:
+            scores = (self.matrix @ query) * self.scales
+        else:
+            scores = self.matrix @ query
+
+        if game_type:
+            mask = np.fromiter((r.get('gameType') == game_type for r in self.records), dtype=bool,
+                               count=len(self.records))
+            scores = np.where(mask, scores, -1.0)
+
+        top_k = min(top_k, len(self.records))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        ranked = candidates[np.argsort(-scores[candidates])]
+
+        return [
+            dict(self.records[i], score=round(float(scores[i]), 4))
+            for i in ranked
+            if scores[i] >= min_score
+        ]
+
+    def to_bytes(self) -> bytes:
+        """npz 직렬화"""
+        import numpy as np
+
+        buffer = io.BytesIO()
+        arrays = {
+            'matrix': self.matrix,
+            'records': np.array(json.dumps(self.records, ensure_ascii=False))
+        }
+        if self.quantized:
+            arrays['scales'] = self.scales
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'EmbeddingStore':
+        import numpy as np
+
+        with np.load(io.BytesIO(data), allow_pickle=False) as npz:
+            records = json.loads(str(npz['records']))
+            scales = npz['scales'] if 'scales' in npz.files else None
+            return cls(npz['matrix'], records, scales)
+
+
+def save_store(store: EmbeddingStore, path: str) -> int:
+    """저장소를 S3 또는 로컬 경로에 저장, 바이트 수 반환"""
+    data = store.to_bytes()
+    write_index_file(path, data)
+    return len(data)
+
+
+def load_store(path: Optional[str] = None, force: bool = False) -> Optional[EmbeddingStore]:
+    """저장소 로드 (컨테이너 단위 캐시), 파일이 없거나 읽을 수 없으면 None (실패 상태도 캐시)"""
+    path = path or os.environ.get('EMBEDDING_STORE_PATH', DEFAULT_STORE_PATH)
+    now = time.time()
+    if (not force
+            and _store_cache['path'] == path
+            and now - _store_cache['loaded_at'] < STORE_REFRESH_SECONDS):
+        return _store_cache['store']
+
+    try:
+        data = read_index_file(path)
+    except (ClientError, BotoCoreError) as e:
+        print(f"Embedding store unavailable ({path}): {e}")
+        data = None
+    store = EmbeddingStore.from_bytes(data) if data else None
+    _store_cache.update({'store': store, 'path': path, 'loaded_at': now})
+    return store
+
+
+def build_quiz_records(item: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    퀴즈 테이블 아이템 하나를 임베딩 레코드로 분해
+    문제(+선택지), 해설, 관련 기사 발췌를 각각 별도 레코드로
+    """
+    records = []
+    quiz = Quiz.from_item(item)
+
+    for i, q in enumerate(quiz.questions):
+        base = {'gameType': quiz.game_type, 'date': quiz.date, 'questionIndex': i}
+        if q.question:
+            records.append(dict(base, kind='question', text=f"{q.question}\n선택지: {' / '.join(q.options)}"))
+
+        if q.explanation:
+            records.append(dict(base, kind='explanation', text=f"[해설] {q.question}\n{q.explanation}"))
+
+        if q.article_title or q.article_excerpt:
+            records.append(dict(base, kind='article', text=f"[기사] {q.article_title}\n{q.article_excerpt}",
+                                url=q.news_link))
+
+    return records
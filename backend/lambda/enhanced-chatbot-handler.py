@@ -2,20 +2,39 @@ import json
 import boto3
 import requests
 import os
+import sys
 from datetime import datetime, timedelta
 import logging
-import backoff
 from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
 import re
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from news_index import load_index
+from embedding_store import embed_text, load_store
+try:
+    from lambda_init import register_priming  # quiz-common 레이어 (embedding_store가 로컬 경로 추가)
+except ImportError:
+    # lambda_init 이전 quiz-common 레이어/빌드: init 워밍 없이 동작 (클라이언트는 첫 사용 시 생성)
+    def register_priming(prime, after_restore=None):
+        return 'off'
+from metrics import MetricsLogger
+import answer_cache
+from quiz_explainers import find_pregenerated_answer
+import model_router
+from context_compactor import compact_sources
 
 # 로깅 설정
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# 호출 단위 EMF 메트릭 (요청 종료 시 로그 한 줄로 출력)
+metrics = MetricsLogger('G2/Chatbot')
+
 # 상수 정의
 AWS_REGION = 'us-east-1'
-BEDROCK_MODEL_ID = 'anthropic.claude-3-sonnet-20240229-v1:0'
 BIGKINDS_API_URL = 'https://www.bigkinds.or.kr/api/news/search.do'
 BIGKINDS_TIMEOUT = 10
 ARTICLE_FETCH_TIMEOUT = 10
@@ -26,9 +45,44 @@ NEWS_RESULT_LIMIT = 3
 ARTICLE_CONTENT_LIMIT = 500
 NEWS_SNIPPET_LIMIT = 200
 MAX_KEYWORDS = 5
-CLAUDE_MAX_TOKENS = 1000
 CLAUDE_TEMPERATURE = 0.7
 CLAUDE_TOP_P = 0.9
+PROMPT_VERSION = 'rag-v2'  # 시스템/사용자 프롬프트 변경 시 올려서 답변 캐시 무효화
+NEWS_INDEX_MIN_SCORE = float(os.environ.get('NEWS_INDEX_MIN_SCORE', '3.0'))
+RAG_RETRIEVAL_MODE = os.environ.get('RAG_RETRIEVAL_MODE', 'bigkinds')  # bigkinds | embedding
+EMBEDDING_TOP_K = 4
+EMBEDDING_MIN_SCORE = 0.3
+EMBEDDING_SNIPPET_LIMIT = 300
+SSE_HEADERS = {
+    'Content-Type': 'text/event-stream; charset=utf-8',
+    'Cache-Control': 'no-cache',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+
+# Bedrock 클라이언트 (컨테이너 재사용, init 단계 prime()에서 생성)
+_bedrock = None
+_bedrock_lock = threading.Lock()
+_bigkinds_with_retry = None
+
+def _get_bedrock():
+    global _bedrock
+    with _bedrock_lock:
+        if _bedrock is None:
+            _bedrock = boto3.client(service_name='bedrock-runtime', region_name=AWS_REGION)
+    return _bedrock
+
+def prime(deep=False):
+    """
+    init 단계 워밍 (lambda_init.register_priming, 네트워크 호출 없음)
+    deep: SnapStart 스냅샷 전 → 선택 경로 의존성(bs4: 퀴즈 기사 본문, backoff: BigKinds 재시도)까지 로드
+    """
+    _get_bedrock()
+    answer_cache._get_table()
+    if deep:
+        from bs4 import BeautifulSoup  # noqa: F401
+        _get_bigkinds_with_retry()
 
 def lambda_handler(event, context):
     """
@@ -52,6 +106,9 @@ def lambda_handler(event, context):
             'body': ''
         }
     
+    metrics.reset(GameType='Unknown')
+    request_start = time.perf_counter()
+    
     try:
         # 요청 데이터 파싱
         body = json.loads(event['body'])
@@ -59,6 +116,8 @@ def lambda_handler(event, context):
         game_type = body.get('gameType', '')
         question_text = body.get('questionText', '')
         quiz_article_url = body.get('quizArticleUrl', '')
+        quiz_date = body.get('quizDate')
+        metrics.set_dimensions(GameType=game_type)
         
         if not user_question:
             return {
@@ -73,6 +132,28 @@ def lambda_handler(event, context):
         masked_question = mask_sensitive_data(user_question)
         logger.info(f"RAG Query: {masked_question[:50]}... (Game: {game_type})")
         
+        # 사전 생성 해설 답변 / 답변 캐시 (Bedrock 호출 없이 응답)
+        cache_key = answer_cache.build_cache_key(
+            game_type,
+            user_question,
+            question_text,
+            quiz_article_url,
+            PROMPT_VERSION
+        )
+        instant = find_instant_answer(game_type, question_text, user_question, cache_key)
+        if instant:
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': json.dumps({
+                    'response': instant['response'],
+                    'knowledge_sources': instant['knowledge_sources'],
+                    'timestamp': datetime.now().isoformat(),
+                    'cached': True,
+                    'success': True
+                })
+            }
+        
         # RAG 지식 베이스 수집
         knowledge_base = build_rag_knowledge_base(
             user_question, 
@@ -82,12 +163,16 @@ def lambda_handler(event, context):
         )
         
         # Claude 순수 응답 생성 (RAG 컨텍스트 포함)
-        claude_response = generate_claude_rag_response(
+        claude_response, is_fallback = generate_claude_rag_response(
             user_question,
             knowledge_base,
             game_type
         )
         
+        # 대체 응답이 아닌 경우에만 캐시 저장
+        if not is_fallback:
+            store_cached_answer(cache_key, claude_response, len(knowledge_base.get('sources', [])), quiz_date)
+        
         return {
             'statusCode': 200,
             'headers': headers,
@@ -95,6 +180,7 @@ def lambda_handler(event, context):
                 'response': claude_response,
                 'knowledge_sources': len(knowledge_base.get('sources', [])),
                 'timestamp': datetime.now().isoformat(),
+                'cached': False,
                 'success': True
             })
         }
@@ -109,6 +195,172 @@ def lambda_handler(event, context):
                 'success': False
             })
         }
+    
+    finally:
+        metrics.put_metric('TotalLatency', round((time.perf_counter() - request_start) * 1000, 2), 'Milliseconds')
+        metrics.flush()
+
+def wsgi_app(environ, start_response):
+    """
+    SSE 스트리밍 챗봇 (enhanced-chatbot-stream 함수 URL, POST)
+    Lambda Web Adapter(AWS_LWA_INVOKE_MODE=response_stream)가 요청을 전달하고 SSE 이벤트를 생성 즉시 클라이언트로 전송
+    이벤트 순서: meta(RAG 소스 정보) → token(텍스트 조각)* → done | error
+    기존 JSON 응답이 필요한 클라이언트는 lambda_handler(POST /chat) 사용
+    """
+    if environ.get('REQUEST_METHOD') == 'OPTIONS':
+        start_response('200 OK', list(SSE_HEADERS.items()))
+        return [b'']
+    
+    if environ.get('REQUEST_METHOD') == 'GET':
+        # 어댑터 준비 상태 확인 (AWS_LWA_READINESS_CHECK_PATH=/health)
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'ok']
+    
+    length = int(environ.get('CONTENT_LENGTH') or 0)
+    body = json.loads(environ['wsgi.input'].read(length) or b'{}')
+    start_response('200 OK', list(SSE_HEADERS.items()))
+    return (chunk.encode('utf-8') for chunk in iter_chat_events(body))
+
+def sse_event(event_name, data):
+    """
+    SSE 이벤트 문자열 생성
+    """
+    return f"event: {event_name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def iter_chat_events(body):
+    """
+    챗봇 요청 1건을 SSE 이벤트 스트림으로 처리
+    """
+    metrics.reset(GameType='Unknown')
+    request_start = time.perf_counter()
+    
+    try:
+        user_question = body.get('question', '')
+        game_type = body.get('gameType', '')
+        question_text = body.get('questionText', '')
+        quiz_article_url = body.get('quizArticleUrl', '')
+        quiz_date = body.get('quizDate')
+        metrics.set_dimensions(GameType=game_type)
+        metrics.set_property('stream', True)
+        
+        if not user_question:
+            yield sse_event('error', {'error': '질문이 필요합니다.', 'success': False})
+            return
+        
+        masked_question = mask_sensitive_data(user_question)
+        logger.info(f"RAG Stream Query: {masked_question[:50]}... (Game: {game_type})")
+        
+        cache_key = answer_cache.build_cache_key(
+            game_type,
+            user_question,
+            question_text,
+            quiz_article_url,
+            PROMPT_VERSION
+        )
+        instant = find_instant_answer(game_type, question_text, user_question, cache_key)
+        if instant:
+            yield sse_event('meta', {'knowledge_sources': instant['knowledge_sources'], 'sources': [], 'cached': True})
+            yield sse_event('token', {'text': instant['response']})
+            yield sse_event('done', {'timestamp': datetime.now().isoformat(), 'success': True})
+            return
+        
+        knowledge_base = build_rag_knowledge_base(
+            user_question,
+            question_text,
+            quiz_article_url,
+            game_type
+        )
+        sources = knowledge_base.get('sources', [])
+        yield sse_event('meta', {
+            'knowledge_sources': len(sources),
+            'sources': [
+                {key: source[key] for key in ('type', 'title', 'url', 'articles_count') if key in source}
+                for source in sources
+            ],
+            'cached': False
+        })
+        
+        chunks = []
+        outcome = {}
+        for text in stream_claude_rag_response(user_question, knowledge_base, game_type, outcome):
+            chunks.append(text)
+            yield sse_event('token', {'text': text})
+        
+        claude_response = ''.join(chunks)
+        # 대체 응답, max_tokens로 잘린 응답은 캐시하지 않음 (비스트리밍 경로는 escalation으로 처리)
+        if outcome.get('stop_reason') == 'max_tokens':
+            logger.warning("Stream response truncated (max_tokens), skipping answer cache")
+        elif claude_response and not outcome.get('fallback'):
+            store_cached_answer(cache_key, claude_response, len(sources), quiz_date)
+        
+        yield sse_event('done', {'timestamp': datetime.now().isoformat(), 'success': True})
+    
+    except Exception as e:
+        logger.error(f"Stream error: {str(e)}")
+        yield sse_event('error', {'error': '서버 오류가 발생했습니다. 잠시 후 다시 시도해 주세요.', 'success': False})
+    
+    finally:
+        metrics.put_metric('TotalLatency', round((time.perf_counter() - request_start) * 1000, 2), 'Milliseconds')
+        metrics.flush()
+
+def find_instant_answer(game_type, question_text, user_question, cache_key):
+    """
+    모델 호출 없이 응답 가능한 답변 조회
+    1. 퀴즈 생성 시 미리 만든 해설 답변 (정답/오답 이유, 배경 용어 질문)
+    2. 답변 캐시 (같은 퀴즈에 대한 반복 질문)
+    """
+    pregenerated = lookup_pregenerated_answer(game_type, question_text, user_question)
+    if pregenerated:
+        return {'response': pregenerated['response'], 'knowledge_sources': 1}
+    
+    cached = lookup_cached_answer(cache_key)
+    if cached:
+        return {'response': cached['response'], 'knowledge_sources': int(cached.get('knowledgeSources', 0))}
+    return None
+
+def lookup_pregenerated_answer(game_type, question_text, user_question):
+    """
+    사전 생성 해설 답변 조회 (조회 실패는 무시하고 일반 경로로 진행)
+    """
+    try:
+        pregenerated = find_pregenerated_answer(game_type, question_text, user_question)
+    except Exception as e:
+        logger.warning(f"Pregenerated answer lookup failed: {str(e)}")
+        return None
+    
+    if pregenerated:
+        metrics.put_metric('PregeneratedHit', 1)
+        metrics.set_property('pregeneratedIntent', pregenerated['intent'])
+        logger.info(f"Pregenerated answer served ({pregenerated['intent']})")
+    return pregenerated
+
+def lookup_cached_answer(cache_key):
+    """
+    답변 캐시 조회 (캐시 장애는 무시하고 일반 경로로 진행)
+    """
+    try:
+        with metrics.timer('AnswerCacheLatency'):
+            cached = answer_cache.lookup(cache_key)
+    except Exception as e:
+        logger.warning(f"Answer cache lookup failed: {str(e)}")
+        return None
+    
+    if cached:
+        metrics.put_metric('AnswerCacheHit', 1)
+        metrics.set_property('answerCacheTier', cached['tier'])
+        logger.info(f"Answer cache hit ({cached['tier']})")
+    else:
+        metrics.put_metric('AnswerCacheMiss', 1)
+    return cached
+
+def store_cached_answer(cache_key, response, knowledge_sources, quiz_date):
+    """
+    답변 캐시 저장 (실패해도 응답에는 영향 없음)
+    """
+    try:
+        answer_cache.store(cache_key, response, knowledge_sources, quiz_date)
+    except Exception as e:
+        logger.warning(f"Answer cache store failed: {str(e)}")
 
 def build_rag_knowledge_base(user_question, question_text, quiz_article_url, game_type):
     """
@@ -122,8 +374,20 @@ def build_rag_knowledge_base(user_question, question_text, quiz_article_url, gam
         'summary': ''
     }
     
+    # 0. 임베딩 검색 모드: 퀴즈 문제/해설/기사 발췌 top-k로 1, 2번 소스 대체
+    embedding_data = None
+    if RAG_RETRIEVAL_MODE == 'embedding':
+        embedding_data = fetch_embedding_knowledge(user_question, question_text, game_type)
+        if embedding_data:
+            knowledge_base['sources'].append({
+                'type': 'quiz_knowledge',
+                'title': '관련 퀴즈 지식',
+                'content': embedding_data['content'],
+                'articles_count': embedding_data['count']
+            })
+    
     # 1. BigKinds API 뉴스 검색
-    bigkinds_data = fetch_bigkinds_knowledge(user_question, game_type)
+    bigkinds_data = None if embedding_data else fetch_bigkinds_knowledge(user_question, game_type)
     if bigkinds_data:
         knowledge_base['sources'].append({
             'type': 'news_search',
@@ -133,8 +397,9 @@ def build_rag_knowledge_base(user_question, question_text, quiz_article_url, gam
         })
     
     # 2. 퀴즈 관련 기사 (URL이 제공된 경우)
-    if quiz_article_url:
-        article_data = fetch_quiz_article_knowledge(quiz_article_url)
+    if quiz_article_url and not embedding_data:
+        with metrics.timer('ArticleFetchLatency'):
+            article_data = fetch_quiz_article_knowledge(quiz_article_url)
         if article_data:
             knowledge_base['sources'].append({
                 'type': 'quiz_article',
@@ -160,8 +425,14 @@ def build_rag_knowledge_base(user_question, question_text, quiz_article_url, gam
 
 def fetch_bigkinds_knowledge(user_question, game_type):
     """
-    BigKinds API에서 관련 뉴스 지식 수집
+    BigKinds 관련 뉴스 지식 수집
+    로컬 뉴스 인덱스를 먼저 조회하고, 결과가 없을 때만 BigKinds API 호출
     """
+    with metrics.timer('NewsIndexLatency'):
+        local_articles = search_local_news_index(user_question)
+    if local_articles:
+        return format_news_knowledge(local_articles)
+    
     try:
         api_key = os.environ.get('BIGKINDS_API_KEY')
         if not api_key:
@@ -173,24 +444,11 @@ def fetch_bigkinds_knowledge(user_question, game_type):
         logger.info(f"BigKinds search keywords: {keywords}")
         
         # API 호출
-        news_data = call_bigkinds_api(keywords, api_key)
+        with metrics.timer('BigKindsLatency'):
+            news_data = call_bigkinds_api(keywords, api_key)
         
         if news_data and news_data.get('return_object', {}).get('documents'):
-            articles = news_data['return_object']['documents'][:3]
-            
-            # 뉴스 내용 통합
-            combined_content = ""
-            for i, article in enumerate(articles, 1):
-                title = article.get('title', '')
-                content = article.get('content', '')[:NEWS_SNIPPET_LIMIT]
-                provider = article.get('provider', '')
-                
-                combined_content += f"[뉴스 {i}] {provider}: {title}\n{content}...\n\n"
-            
-            return {
-                'content': combined_content.strip(),
-                'count': len(articles)
-            }
+            return format_news_knowledge(news_data['return_object']['documents'][:NEWS_RESULT_LIMIT])
     
     except requests.Timeout:
         logger.warning("BigKinds API timeout")
@@ -203,6 +461,72 @@ def fetch_bigkinds_knowledge(user_question, game_type):
     
     return None
 
+def search_local_news_index(user_question):
+    """
+    로컬 뉴스 인덱스(BM25) 검색, 인덱스가 없거나 결과가 없으면 빈 리스트
+    """
+    try:
+        index = load_index()
+        if not index:
+            return []
+        
+        articles = index.search(user_question, limit=NEWS_RESULT_LIMIT, min_score=NEWS_INDEX_MIN_SCORE)
+        logger.info(f"News index hits: {len(articles)} (index size: {len(index)})")
+        return articles
+    
+    except Exception as e:
+        logger.warning(f"News index lookup failed: {str(e)}")
+        return []
+
+def format_news_knowledge(articles):
+    """
+    뉴스 기사 목록을 지식 소스 형식으로 변환
+    """
+    combined_content = ""
+    for i, article in enumerate(articles, 1):
+        title = article.get('title', '')
+        content = article.get('content', '')[:NEWS_SNIPPET_LIMIT]
+        provider = article.get('provider', '')
+        
+        combined_content += f"[뉴스 {i}] {provider}: {title}\n{content}...\n\n"
+    
+    return {
+        'content': combined_content.strip(),
+        'count': len(articles)
+    }
+
+def fetch_embedding_knowledge(user_question, question_text, game_type):
+    """
+    임베딩 저장소에서 질문과 가까운 퀴즈 문제/해설/기사 발췌 top-k 검색
+    저장소가 없거나 유사한 레코드가 없으면 None
+    """
+    try:
+        store = load_store()
+        if not store:
+            return None
+        
+        query = f"{question_text}\n{user_question}" if question_text else user_question
+        with metrics.timer('EmbeddingLatency'):
+            query_vector = embed_text(query)
+        hits = store.search(query_vector, top_k=EMBEDDING_TOP_K, game_type=game_type or None,
+                            min_score=EMBEDDING_MIN_SCORE)
+        logger.info(f"Embedding hits: {len(hits)} (store size: {len(store)})")
+        if not hits:
+            return None
+        
+        content = "\n\n".join(
+            f"[{hit.get('date', '')} {hit.get('kind', '')}] {hit.get('text', '')[:EMBEDDING_SNIPPET_LIMIT]}"
+            for hit in hits
+        )
+        return {
+            'content': content,
+            'count': len(hits)
+        }
+    
+    except Exception as e:
+        logger.warning(f"Embedding retrieval failed: {str(e)}")
+        return None
+
 def fetch_quiz_article_knowledge(article_url):
     """
     퀴즈 관련 기사 내용 추출 (URL에서)
@@ -222,6 +546,8 @@ def fetch_quiz_article_knowledge(article_url):
         if response.status_code != 200:
             return fallback_content
         
+        from bs4 import BeautifulSoup  # 퀴즈 기사 URL이 있는 요청에서만 사용 (첫 사용 시 로드)
+        
         soup = BeautifulSoup(response.text, 'html.parser')
         
         # 기사 본문 추출 (일반적인 뉴스 사이트 패턴)
@@ -275,16 +601,29 @@ def extract_search_keywords(user_question, game_type):
     
     return ' '.join(base_keywords[:MAX_KEYWORDS])
 
-@backoff.on_exception(
-    backoff.expo,
-    (requests.RequestException, requests.Timeout),
-    max_tries=BIGKINDS_MAX_RETRIES,
-    max_time=BIGKINDS_MAX_TIME
-)
+def _get_bigkinds_with_retry():
+    """backoff 재시도를 적용한 BigKinds 호출 함수 (backoff는 첫 호출 시 로드)"""
+    global _bigkinds_with_retry
+    if _bigkinds_with_retry is None:
+        import backoff
+        _bigkinds_with_retry = backoff.on_exception(
+            backoff.expo,
+            (requests.RequestException, requests.Timeout),
+            max_tries=BIGKINDS_MAX_RETRIES,
+            max_time=BIGKINDS_MAX_TIME
+        )(_call_bigkinds_api_once)
+    return _bigkinds_with_retry
+
 def call_bigkinds_api(keywords: str, api_key: str) -> Optional[Dict[str, Any]]:
     """
     BigKinds API 호출 (재시도 로직 포함)
     """
+    return _get_bigkinds_with_retry()(keywords, api_key)
+
+def _call_bigkinds_api_once(keywords: str, api_key: str) -> Optional[Dict[str, Any]]:
+    """
+    BigKinds API 1회 호출 (실패 시 예외 → backoff 재시도)
+    """
     end_date = datetime.now()
     start_date = end_date - timedelta(days=NEWS_SEARCH_DAYS)
     
@@ -315,8 +654,8 @@ def call_bigkinds_api(keywords: str, api_key: str) -> Optional[Dict[str, Any]]:
         }
     }
     
-    # 커스텀 메트릭 전송
-    send_cloudwatch_metric('BigKindsAPIAttempt', 1)
+    # 커스텀 메트릭 기록 (EMF 버퍼, 요청 종료 시 일괄 출력)
+    metrics.put_metric('BigKindsAPIAttempt', 1)
     
     headers = {
         'Content-Type': 'application/json',
@@ -329,34 +668,74 @@ def call_bigkinds_api(keywords: str, api_key: str) -> Optional[Dict[str, Any]]:
         data = response.json()
         # API 응답 구조 확인
         if data.get('return_object'):
-            send_cloudwatch_metric('BigKindsAPISuccess', 1)
+            metrics.put_metric('BigKindsAPISuccess', 1)
             logger.info(f"BigKinds API success: {len(data.get('return_object', {}).get('documents', []))} articles")
             return data
     
-    send_cloudwatch_metric('BigKindsAPIError', 1)
+    metrics.put_metric('BigKindsAPIError', 1)
     logger.warning(f"BigKinds API error: {response.status_code}")
     raise requests.RequestException(f"API returned {response.status_code}")
 
 def generate_claude_rag_response(user_question, knowledge_base, game_type):
     """
-    RAG 기반 Claude 순수 응답 생성
+    RAG 기반 Claude 순수 응답 생성, (응답 텍스트, 대체 응답 여부) 반환
     """
     try:
-        # Bedrock 클라이언트 초기화
-        bedrock = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=AWS_REGION
-        )
+        bedrock = _get_bedrock()
         
         # 외부 지식이 있는지 확인
         has_external_knowledge = knowledge_base.get('sources') and len(knowledge_base['sources']) > 0
+        system_prompt, user_prompt = build_claude_prompts(user_question, knowledge_base, game_type)
+        
+        # 모델 라우팅 (쉬운 질문 → fast, 복잡한 질문 → strong)
+        sources = knowledge_base.get('sources', [])
+        route = model_router.classify(
+            user_question,
+            any(source.get('type') == 'quiz_context' for source in sources),
+            len(sources)
+        )
+        claude_response, stop_reason = invoke_routed_model(bedrock, route, system_prompt, user_prompt)
         
-        if has_external_knowledge:
-            # RAG 컨텍스트 구성
-            rag_context = build_rag_context(knowledge_base)
+        # fast 응답 신뢰도가 낮으면 strong 모델로 재시도
+        if route['route'] == 'fast':
+            escalation_reason = model_router.needs_escalation(claude_response, stop_reason)
+            if escalation_reason:
+                logger.info(f"Escalating to strong model: {escalation_reason}")
+                metrics.put_metric('RouteEscalation', 1)
+                metrics.set_property('escalationReason', escalation_reason)
+                route = model_router.escalate(route, escalation_reason)
+                claude_response, stop_reason = invoke_routed_model(bedrock, route, system_prompt, user_prompt)
+        
+        if claude_response:
+            knowledge_status = "RAG" if has_external_knowledge else "Pure Claude"
+            logger.info(f"Claude {knowledge_status} response generated successfully (route: {route['route']})")
+            return claude_response, False
+        else:
+            logger.error("Empty response from Claude")
+            return generate_fallback_response(user_question, game_type), True
             
-            # 게임별 전문 시스템 프롬프트 (RAG 버전)
-            system_prompt = f"""당신은 경제 전문 AI 어시스턴트입니다.
+    except boto3.exceptions.Boto3Error as e:
+        logger.error(f"Bedrock API error: {str(e)}")
+        return generate_fallback_response(user_question, game_type), True
+    except json.JSONDecodeError as e:
+        logger.error(f"Claude response parsing error: {str(e)}")
+        return generate_fallback_response(user_question, game_type), True
+    except Exception as e:
+        logger.error(f"Claude unexpected error: {str(e)}")
+        return generate_fallback_response(user_question, game_type), True
+
+def build_claude_prompts(user_question, knowledge_base, game_type):
+    """
+    Claude 시스템/사용자 프롬프트 구성 (RAG 컨텍스트 유무에 따라 분기)
+    """
+    has_external_knowledge = knowledge_base.get('sources') and len(knowledge_base['sources']) > 0
+    
+    if has_external_knowledge:
+        # RAG 컨텍스트 구성
+        rag_context = build_rag_context(knowledge_base, user_question)
+        
+        # 게임별 전문 시스템 프롬프트 (RAG 버전)
+        system_prompt = f"""당신은 경제 전문 AI 어시스턴트입니다.
 
 게임 컨텍스트: {get_game_description(game_type)}
 
@@ -367,16 +746,16 @@ def generate_claude_rag_response(user_question, knowledge_base, game_type):
 4. 250-350자 내외의 적절한 길이
 5. 한국어로 자연스럽게 작성"""
 
-            # 사용자 프롬프트 (RAG 컨텍스트 포함)
-            user_prompt = f"""질문: {user_question}
+        # 사용자 프롬프트 (RAG 컨텍스트 포함)
+        user_prompt = f"""질문: {user_question}
 
 외부 지식 베이스:
 {rag_context}
 
 위 정보를 바탕으로 질문에 대해 전문적이고 통찰력 있는 답변을 해주세요."""
-        else:
-            # 순수 Claude 응답 (외부 지식 없음)
-            system_prompt = f"""당신은 경제 전문 AI 어시스턴트입니다.
+    else:
+        # 순수 Claude 응답 (외부 지식 없음)
+        system_prompt = f"""당신은 경제 전문 AI 어시스턴트입니다.
 
 게임 컨텍스트: {get_game_description(game_type)}
 
@@ -387,14 +766,38 @@ def generate_claude_rag_response(user_question, knowledge_base, game_type):
 4. 250-350자 내외의 적절한 길이
 5. 한국어로 자연스럽게 작성"""
 
-            user_prompt = f"""질문: {user_question}
+        user_prompt = f"""질문: {user_question}
 
 위 질문에 대해 경제 전문가로서 전문적이고 통찰력 있는 답변을 해주세요."""
+    
+    return system_prompt, user_prompt
 
-        # Claude 모델 호출
+def stream_claude_rag_response(user_question, knowledge_base, game_type, outcome=None):
+    """
+    RAG 기반 Claude 응답을 텍스트 조각 단위로 생성 (invoke_model_with_response_stream)
+    이미 전송한 토큰은 되돌릴 수 없으므로 escalation 없이 라우팅 결과 모델만 사용
+    첫 토큰 전에 실패하면 대체 응답을 한 번에 반환
+    outcome(dict)이 주어지면 종료 시 'fallback'(대체 응답 여부)과 'stop_reason'(message_delta) 기록 (캐시 저장 판단용)
+    """
+    outcome = {} if outcome is None else outcome
+    outcome.update({'fallback': False, 'stop_reason': None})
+    sent_any = False
+    try:
+        bedrock = _get_bedrock()
+        system_prompt, user_prompt = build_claude_prompts(user_question, knowledge_base, game_type)
+        
+        sources = knowledge_base.get('sources', [])
+        route = model_router.classify(
+            user_question,
+            any(source.get('type') == 'quiz_context' for source in sources),
+            len(sources)
+        )
+        metrics.set_property('route', route['route'])
+        metrics.set_property('routeReason', route['reason'])
+        
         request_body = {
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": CLAUDE_MAX_TOKENS,
+            "max_tokens": route['max_tokens'],
             "system": system_prompt,
             "messages": [
                 {
@@ -406,42 +809,102 @@ def generate_claude_rag_response(user_question, knowledge_base, game_type):
             "top_p": CLAUDE_TOP_P
         }
         
-        response = bedrock.invoke_model(
-            modelId=BEDROCK_MODEL_ID,
+        start = time.perf_counter()
+        response = bedrock.invoke_model_with_response_stream(
+            modelId=route['model_id'],
             body=json.dumps(request_body)
         )
         
-        response_body = json.loads(response['body'].read())
+        for stream_event in response['body']:
+            chunk = json.loads(stream_event['chunk']['bytes'])
+            if chunk.get('type') == 'message_delta':
+                outcome['stop_reason'] = chunk.get('delta', {}).get('stop_reason') or outcome['stop_reason']
+                continue
+            if chunk.get('type') != 'content_block_delta':
+                continue
+            text = chunk.get('delta', {}).get('text', '')
+            if not text:
+                continue
+            if not sent_any:
+                metrics.put_metric('TimeToFirstToken', round((time.perf_counter() - start) * 1000, 2), 'Milliseconds')
+                sent_any = True
+            yield text
         
-        if response_body.get('content') and len(response_body['content']) > 0:
-            claude_response = response_body['content'][0]['text']
-            knowledge_status = "RAG" if has_external_knowledge else "Pure Claude"
-            logger.info(f"Claude {knowledge_status} response generated successfully")
-            return claude_response
-        else:
-            logger.error("Empty response from Claude")
-            return generate_fallback_response(user_question, game_type)
-            
-    except boto3.exceptions.Boto3Error as e:
-        logger.error(f"Bedrock API error: {str(e)}")
-        return generate_fallback_response(user_question, game_type)
-    except json.JSONDecodeError as e:
-        logger.error(f"Claude response parsing error: {str(e)}")
-        return generate_fallback_response(user_question, game_type)
+        latency_ms = round((time.perf_counter() - start) * 1000, 2)
+        metrics.put_metric('BedrockLatency', latency_ms, 'Milliseconds')
+        metrics.put_metric(f"{route['route'].capitalize()}RouteLatency", latency_ms, 'Milliseconds')
+        model_router.latency_tracker.record(route['route'], latency_ms)
+    
     except Exception as e:
-        logger.error(f"Claude unexpected error: {str(e)}")
-        return generate_fallback_response(user_question, game_type)
+        logger.error(f"Claude stream error: {str(e)}")
+        if sent_any:
+            raise
+    
+    if not sent_any:
+        outcome['fallback'] = True
+        yield generate_fallback_response(user_question, game_type)
 
-def build_rag_context(knowledge_base):
+def invoke_routed_model(bedrock, route, system_prompt, user_prompt):
+    """
+    라우팅된 모델로 Claude 호출, (응답 텍스트, stop_reason) 반환
+    라우트별 지연 시간을 EMF 메트릭과 컨테이너 p50/p95에 기록
+    """
+    request_body = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": route['max_tokens'],
+        "system": system_prompt,
+        "messages": [
+            {
+                "role": "user",
+                "content": user_prompt
+            }
+        ],
+        "temperature": CLAUDE_TEMPERATURE,
+        "top_p": CLAUDE_TOP_P
+    }
+    
+    start = time.perf_counter()
+    response = bedrock.invoke_model(
+        modelId=route['model_id'],
+        body=json.dumps(request_body)
+    )
+    response_body = json.loads(response['body'].read())
+    latency_ms = round((time.perf_counter() - start) * 1000, 2)
+    
+    metrics.put_metric('BedrockLatency', latency_ms, 'Milliseconds')
+    metrics.put_metric(f"{route['route'].capitalize()}RouteLatency", latency_ms, 'Milliseconds')
+    model_router.latency_tracker.record(route['route'], latency_ms)
+    stats = model_router.latency_tracker.percentiles(route['route'])
+    metrics.set_property('route', route['route'])
+    metrics.set_property('routeReason', route['reason'])
+    logger.info(f"Route {route['route']} ({route['reason']}): {latency_ms}ms "
+                f"(p50 {stats['p50']}ms / p95 {stats['p95']}ms over {stats['count']})")
+    
+    content = response_body.get('content') or []
+    text = content[0].get('text', '') if content else ''
+    return text, response_body.get('stop_reason')
+
+def build_rag_context(knowledge_base, user_question=None):
     """
     RAG 지식 베이스를 Claude 프롬프트용 컨텍스트로 변환
+    user_question이 주어지면 소스 간 중복 문장 제거 + 질문 관련도 기반 토큰 예산 압축
     """
     if not knowledge_base.get('sources'):
         return "외부 지식 정보가 없습니다."
     
+    sources = knowledge_base['sources']
+    if user_question:
+        try:
+            compacted = compact_sources(sources, user_question)
+            metrics.put_metric('ContextCharsBefore', sum(len(source.get('content', '')) for source in sources))
+            metrics.put_metric('ContextCharsAfter', sum(len(source.get('content', '')) for source in compacted))
+            sources = compacted or sources
+        except Exception as e:
+            logger.warning(f"Context compaction failed: {str(e)}")
+    
     context_parts = []
     
-    for i, source in enumerate(knowledge_base['sources'], 1):
+    for i, source in enumerate(sources, 1):
         source_type = source.get('type', 'unknown')
         title = source.get('title', f'소스 {i}')
         content = source.get('content', '')
@@ -450,6 +913,8 @@ def build_rag_context(knowledge_base):
             context_parts.append(f"📰 최신 뉴스 ({source.get('articles_count', 0)}건):\n{content}")
         elif source_type == 'quiz_article':
             context_parts.append(f"📄 퀴즈 관련 기사:\n{content}")
+        elif source_type == 'quiz_knowledge':
+            context_parts.append(f"🔎 관련 퀴즈 지식 ({source.get('articles_count', 0)}건):\n{content}")
         elif source_type == 'quiz_context':
             context_parts.append(f"🎯 퀴즈 문제:\n{content}")
         else:
@@ -485,28 +950,6 @@ def generate_fallback_response(user_question, game_type):
     
     return base_response
 
-def send_cloudwatch_metric(metric_name: str, value: float, unit: str = 'Count') -> None:
-    """
-    CloudWatch 커스텀 메트릭 전송
-    """
-    try:
-        cloudwatch = boto3.client('cloudwatch', region_name=AWS_REGION)
-        cloudwatch.put_metric_data(
-            Namespace='G2/Chatbot',
-            MetricData=[
-                {
-                    'MetricName': metric_name,
-                    'Value': value,
-                    'Unit': unit,
-                    'Timestamp': datetime.now()
-                }
-            ]
-        )
-    except boto3.exceptions.Boto3Error as e:
-        logger.warning(f"Failed to send CloudWatch metric {metric_name}: {str(e)}")
-    except Exception as e:
-        logger.warning(f"Unexpected error sending metric {metric_name}: {str(e)}")
-
 def mask_sensitive_data(text: str) -> str:
     """
     로그에서 민감한 정보 마스킹
@@ -517,4 +960,12 @@ def mask_sensitive_data(text: str) -> str:
     text = re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'****@\2', text)
     # 전화번호 마스킹
     text = re.sub(r'\d{3}-\d{4}-\d{4}', '***-****-****', text)
-    return text
\ No newline at end of file
+    return text
+
+# init 단계 워밍 (Lambda에서만, SnapStart 런타임이면 스냅샷 전에 실행)
+PRIME_MODE = register_priming(prime)
+
+if __name__ == '__main__':
+    # Lambda Web Adapter 실행 진입점 (PORT 환경 변수, 기본 8080)
+    from wsgiref.simple_server import make_server
+    make_server('0.0.0.0', int(os.environ.get('PORT', '8080')), wsgi_app).serve_forever()
@@ -0,0 +1,117 @@
+"""
+CloudWatch Embedded Metric Format(EMF) 메트릭 로거
+호출 단위로 메트릭을 버퍼링했다가 로그 한 줄(JSON)로 출력 → PutMetricData API 호출 없음
+챗봇 Lambda와 퀴즈 생성 Lambda에서 공용으로 사용
+"""
+
+import functools
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List
+
+# EMF 제약: 문서당 메트릭 100개, 메트릭당 값 100개
+EMF_MAX_METRICS = 100
+EMF_MAX_VALUES = 100
+
+
+class MetricsLogger:
+    """
+    호출(invocation) 단위 메트릭 버퍼
+    같은 이름으로 여러 번 기록한 값은 배열로 묶여 CloudWatch에서 분포(p50/p95 등)로 집계됨
+    작업 스레드는 bind()로 호출에 묶어 실행 → 호출이 끝난(reset) 뒤 늦게 기록한 값은 다음 호출에 섞이지 않고 버려짐
+    """
+
+    def __init__(self, namespace: str, stream=None):
+        self.namespace = namespace
+        self.stream = stream
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self, **dimensions) -> None:
+        """새 호출 시작: 버퍼와 차원 초기화"""
+        self._run = object()  # 호출 토큰 (bind한 작업 스레드가 기록할 수 있는 호출)
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._dimensions: Dict[str, str] = {}
+        self._properties: Dict[str, Any] = {}
+        self.set_dimensions(**dimensions)
+
+    def set_dimensions(self, **dimensions) -> None:
+        for key, value in dimensions.items():
+            self._dimensions[key] = str(value) if value else 'Unknown'
+
+    def set_property(self, key: str, value: Any) -> None:
+        """메트릭이 아닌 검색용 필드 (CloudWatch Logs Insights에서 조회 가능)"""
+        self._properties[key] = value
+
+    def bind(self, fn: Callable) -> Callable:
+        """fn을 현재 호출에 묶음 (다른 스레드에서 실행, 그 사이 reset되면 기록 무시)"""
+        run = self._run
+
+        @functools.wraps(fn)
+        def bound(*args, **kwargs):
+            self._local.run = run
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.run = None
+        return bound
+
+    def put_metric(self, name: str, value: float, unit: str = 'Count') -> None:
+        run = getattr(self._local, 'run', None)
+        if run is not None and run is not self._run:
+            return
+        entry = self._metrics.setdefault(name, {'unit': unit, 'values': []})
+        entry['values'].append(value)
+
+    @contextmanager
+    def timer(self, name: str):
+        """블록 실행 시간을 밀리초 단위로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.put_metric(name, round((time.perf_counter() - start) * 1000, 2), 'Milliseconds')
+
+    def serialize(self) -> List[str]:
+        """
+        버퍼를 EMF JSON 로그 라인 목록으로 변환 (제약 초과 시 여러 줄로 분할)
+        메트릭 100개 단위로 나누고, 값이 100개를 넘는 메트릭은 다음 문서들에 나머지 값을 이어서 기록
+        """
+        lines = []
+        items = list(self._metrics.items())
+        for start in range(0, len(items), EMF_MAX_METRICS):
+            chunk = items[start:start + EMF_MAX_METRICS]
+            pages = max(-(-len(entry['values']) // EMF_MAX_VALUES) for _, entry in chunk)
+            for page in range(pages):
+                offset = page * EMF_MAX_VALUES
+                metrics = [(name, entry['unit'], entry['values'][offset:offset + EMF_MAX_VALUES])
+                           for name, entry in chunk if len(entry['values']) > offset]
+                document = {
+                    '_aws': {
+                        'Timestamp': int(time.time() * 1000),
+                        'CloudWatchMetrics': [{
+                            'Namespace': self.namespace,
+                            'Dimensions': [list(self._dimensions.keys())],
+                            'Metrics': [{'Name': name, 'Unit': unit} for name, unit, _ in metrics]
+                        }]
+                    }
+                }
+                document.update(self._properties)
+                document.update(self._dimensions)
+                for name, _, values in metrics:
+                    document[name] = values[0] if len(values) == 1 else values
+                lines.append(json.dumps(document, ensure_ascii=False, separators=(',', ':')))
+        return lines
+
+    def flush(self) -> None:
+        """버퍼를 stdout으로 출력하고 비움 (Lambda 로그 → CloudWatch가 메트릭 추출)"""
+        if not self._metrics:
+            return
+        stream = self.stream or sys.stdout
+        for line in self.serialize():
+            stream.write(line + '\n')
+        stream.flush()
+        self._metrics = {}
@@ -0,0 +1,101 @@
+"""
+챗봇 모델 라우팅
+로컬 특징(질문 길이, 퀴즈 컨텍스트 유무, 복합 질문 키워드)으로 요청을 분류하여
+쉬운 질문은 Haiku(fast), 복잡한 질문은 Sonnet(strong)으로 보내고
+fast 응답의 신뢰도가 낮으면 Sonnet으로 재시도(escalation)
+"""
+
+import os
+import re
+from collections import deque
+from typing import Any, Dict, Optional
+
+# 상수 정의 (환경 변수로 조정 가능)
+FAST_MODEL_ID = os.environ.get('ROUTER_FAST_MODEL_ID', 'anthropic.claude-3-haiku-20240307-v1:0')
+STRONG_MODEL_ID = os.environ.get('ROUTER_STRONG_MODEL_ID', 'anthropic.claude-3-sonnet-20240229-v1:0')
+ROUTER_MODE = os.environ.get('ROUTER_MODE', 'auto')  # auto | fast | strong
+FAST_MAX_QUESTION_CHARS = int(os.environ.get('ROUTER_FAST_MAX_CHARS', '60'))
+FAST_MAX_TOKENS = int(os.environ.get('ROUTER_FAST_MAX_TOKENS', '600'))
+STRONG_MAX_TOKENS = int(os.environ.get('ROUTER_STRONG_MAX_TOKENS', '1000'))
+ESCALATION_MIN_ANSWER_CHARS = int(os.environ.get('ROUTER_MIN_ANSWER_CHARS', '120'))
+LATENCY_WINDOW = 200
+
+_COMPLEX_PATTERN = re.compile(r'비교|전망|시나리오|영향|파급|차이|장단점|정책|구조|메커니즘|어떻게 될|예측|분석')
+_LOW_CONFIDENCE_PATTERN = re.compile(r'잘 모르|확실하지 않|정보가 부족|알 수 없|판단하기 어렵|제공된 정보만으로는')
+
+
+def classify(user_question: str, has_quiz_context: bool, source_count: int) -> Dict[str, Any]:
+    """
+    요청 분류 → {'route': 'fast' | 'strong', 'model_id', 'max_tokens', 'reason', 'features'}
+    """
+    features = {
+        'length': len(user_question),
+        'has_quiz_context': has_quiz_context,
+        'source_count': source_count,
+        'complex_terms': len(_COMPLEX_PATTERN.findall(user_question)),
+        'question_count': max(1, user_question.count('?'))
+    }
+
+    if ROUTER_MODE in ('fast', 'strong'):
+        route, reason = ROUTER_MODE, 'forced'
+    elif features['complex_terms'] > 0:
+        route, reason = 'strong', 'complex_terms'
+    elif features['question_count'] > 1:
+        route, reason = 'strong', 'multi_question'
+    elif features['length'] > FAST_MAX_QUESTION_CHARS:
+        route, reason = 'strong', 'long_question'
+    elif not has_quiz_context and source_count == 0:
+        # 근거 자료 없이 답해야 하는 질문은 strong 모델에 맡김
+        route, reason = 'strong', 'no_grounding'
+    else:
+        route, reason = 'fast', 'simple'
+
+    return {
+        'route': route,
+        'model_id': FAST_MODEL_ID if route == 'fast' else STRONG_MODEL_ID,
+        'max_tokens': FAST_MAX_TOKENS if route == 'fast' else STRONG_MAX_TOKENS,
+        'reason': reason,
+        'features': features
+    }
+
+
+def needs_escalation(answer: Optional[str], stop_reason: Optional[str]) -> Optional[str]:
+    """fast 응답의 신뢰도 점검, escalation이 필요하면 사유 반환"""
+    if not answer:
+        return 'empty'
+    if stop_reason == 'max_tokens':
+        return 'truncated'
+    if len(answer.strip()) < ESCALATION_MIN_ANSWER_CHARS:
+        return 'too_short'
+    if _LOW_CONFIDENCE_PATTERN.search(answer):
+        return 'low_confidence'
+    return None
+
+
+def escalate(route: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    """fast 라우트를 strong 모델로 승격한 라우트 반환"""
+    return dict(route, route='escalated', model_id=STRONG_MODEL_ID, max_tokens=STRONG_MAX_TOKENS, reason=reason)
+
+
+class RouteLatencyTracker:
+    """라우트별 최근 지연 시간(ms) 슬라이딩 윈도우 → p50/p95 (컨테이너 단위)"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: Dict[str, deque] = {}
+        self._window = window
+
+    def record(self, route: str, latency_ms: float) -> None:
+        self._samples.setdefault(route, deque(maxlen=self._window)).append(latency_ms)
+
+    def percentiles(self, route: str) -> Dict[str, float]:
+        samples = sorted(self._samples.get(route, ()))
+        if not samples:
+            return {'count': 0, 'p50': 0.0, 'p95': 0.0}
+        return {
+            'count': len(samples),
+            'p50': samples[int(0.5 * (len(samples) - 1))],
+            'p95': samples[int(0.95 * (len(samples) - 1))]
+        }
+
+
+latency_tracker = RouteLatencyTracker()
@@ -0,0 +1,105 @@
+"""
+뉴스 인덱스 야간 수집 Lambda
+EventBridge 스케줄로 매일 호출되어 서울경제 경제 기사를 로컬 검색 인덱스에 누적
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from news_index import DEFAULT_RETENTION_DAYS, NewsIndex, read_index_file, write_index_file
+
+BIGKINDS_SEARCH_URL = 'https://tools.kinds.or.kr/search/news'
+BIGKINDS_TIMEOUT = 15
+INGEST_LOOKBACK_DAYS = 2
+INGEST_PAGE_SIZE = 100
+INGEST_MAX_PAGES = 10
+
+
+def lambda_handler(event, context):
+    """
+    최근 INGEST_LOOKBACK_DAYS일 기사를 가져와 인덱스에 병합 후 저장
+    event로 lookbackDays, indexPath 덮어쓰기 가능
+    """
+    event = event or {}
+    index_path = event.get('indexPath') or os.environ['NEWS_INDEX_PATH']
+    lookback_days = int(event.get('lookbackDays', INGEST_LOOKBACK_DAYS))
+    retention_days = int(os.environ.get('NEWS_INDEX_RETENTION_DAYS', DEFAULT_RETENTION_DAYS))
+
+    api_key = os.environ.get('BIGKINDS_API_KEY')
+    if not api_key:
+        raise ValueError("BIGKINDS_API_KEY 환경 변수가 설정되지 않았습니다")
+
+    existing = read_index_file(index_path)
+    index = NewsIndex.from_bytes(existing) if existing else NewsIndex()
+    print(f"Loaded news index: {len(index)} documents")
+
+    articles = fetch_recent_articles(api_key, lookback_days)
+    added = index.add_documents(articles)
+    removed = index.prune(retention_days)
+
+    data = index.to_bytes()
+    write_index_file(index_path, data)
+    print(f"News index saved: +{added} / -{removed} → {len(index)} documents ({len(data)} bytes)")
+
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'fetched': len(articles),
+            'added': added,
+            'removed': removed,
+            'documents': len(index),
+            'bytes': len(data)
+        })
+    }
+
+
+def fetch_recent_articles(api_key, lookback_days):
+    """BigKinds에서 서울경제 경제 기사를 페이지 단위로 모두 가져오기"""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=lookback_days)
+
+    articles = []
+    for page in range(INGEST_MAX_PAGES):
+        payload = {
+            'access_key': api_key,
+            'argument': {
+                'query': '',
+                'published_at': {
+                    'from': start_date.strftime('%Y-%m-%d'),
+                    'until': end_date.strftime('%Y-%m-%d')
+                },
+                'provider': ['서울경제'],
+                'category': ['경제'],
+                'sort': {'date': 'desc'},
+                'hilight': 200,
+                'return_from': page * INGEST_PAGE_SIZE,
+                'return_size': INGEST_PAGE_SIZE,
+                'fields': ['title', 'content', 'published_at', 'provider', 'news_id', 'provider_link_page']
+            }
+        }
+
+        response = requests.post(
+            BIGKINDS_SEARCH_URL,
+            json=payload,
+            headers={'Content-Type': 'application/json'},
+            timeout=BIGKINDS_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise Exception(f"BigKinds API 오류: {response.status_code}")
+
+        data = response.json()
+        if data.get('result') != 0:
+            raise Exception(f"BigKinds API returned error result: {data.get('result')}")
+
+        documents = data.get('return_object', {}).get('documents', [])
+        articles.extend(documents)
+        if len(documents) < INGEST_PAGE_SIZE:
+            break
+
+    return articles
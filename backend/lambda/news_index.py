@@ -0,0 +1,221 @@
+"""
+로컬 뉴스 검색 인덱스 (BM25 + 한국어 문자 n-gram)
+야간 수집 Lambda가 BigKinds 기사를 누적하여 gzip JSON 파일로 저장하고,
+챗봇은 이 파일을 로드해 밀리초 단위로 검색한다.
+"""
+
+import gzip
+import json
+import math
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+
+# 상수 정의
+INDEX_FORMAT_VERSION = 1
+NGRAM_SIZE = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+DOC_CONTENT_LIMIT = 1000
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_INDEX_PATH = '/opt/news-index/news_index.json.gz'  # Lambda Layer 경로
+INDEX_REFRESH_SECONDS = 3600
+S3_MISSING_CODES = ('NoSuchKey', 'NoSuchBucket', '404')
+
+_TOKEN_SPLIT = re.compile(r'[^\w가-힣]+')
+
+_s3 = None
+
+# 컨테이너 재사용 시 인덱스 캐시
+_index_cache: Dict[str, Any] = {'index': None, 'path': None, 'loaded_at': 0.0}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    텍스트를 문자 n-gram 토큰으로 분리
+    어절 단위로 자른 뒤 각 어절의 문자 bigram 생성 (1글자 어절은 그대로)
+    """
+    tokens = []
+    for word in _TOKEN_SPLIT.split(text.lower()):
+        if not word:
+            continue
+        if len(word) < NGRAM_SIZE:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1))
+    return tokens
+
+
+class NewsIndex:
+    """BigKinds 기사 BM25 인덱스"""
+
+    def __init__(self, documents: Optional[List[Dict[str, Any]]] = None):
+        self.documents: List[Dict[str, Any]] = []
+        self._ids = set()
+        self._postings: Dict[str, List[tuple]] = {}
+        self._doc_lengths: List[int] = []
+        self._avg_length = 0.0
+        if documents:
+            self.add_documents(documents)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add_documents(self, articles: List[Dict[str, Any]]) -> int:
+        """BigKinds 기사 추가 (news_id 기준 중복 제거), 추가된 개수 반환"""
+        added = 0
+        for article in articles:
+            news_id = article.get('news_id', '')
+            if not news_id or news_id in self._ids:
+                continue
+            self._ids.add(news_id)
+            self.documents.append({
+                'news_id': news_id,
+                'title': article.get('title', ''),
+                'content': (article.get('content') or '')[:DOC_CONTENT_LIMIT],
+                'provider': article.get('provider', ''),
+                'published_at': article.get('published_at', ''),
+                'url': article.get('provider_link_page') or article.get('url', '')
+            })
+            added += 1
+        if added:
+            self._build()
+        return added
+
+    def prune(self, retention_days: int = DEFAULT_RETENTION_DAYS) -> int:
+        """보존 기간이 지난 기사 제거, 제거된 개수 반환"""
+        cutoff = (datetime.now() - timedelta(days=retention_days)).strftime('%Y-%m-%d')
+        kept = [doc for doc in self.documents if doc.get('published_at', '')[:10] >= cutoff]
+        removed = len(self.documents) - len(kept)
+        if removed:
+            self.documents = kept
+            self._ids = {doc['news_id'] for doc in kept}
+            self._build()
+        return removed
+
+    def _build(self):
+        """역색인 재구성 (제목은 가중치 2배)"""
+        postings = defaultdict(list)
+        lengths = []
+        for doc_idx, doc in enumerate(self.documents):
+            tokens = tokenize(doc['title']) * 2 + tokenize(doc['content'])
+            lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                postings[term].append((doc_idx, tf))
+        self._postings = dict(postings)
+        self._doc_lengths = lengths
+        self._avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    def search(self, query: str, limit: int = 3, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """BM25 검색, 점수 내림차순 (동점 시 최신순)"""
+        if not self.documents:
+            return []
+
+        doc_count = len(self.documents)
+        scores = defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_idx, tf in postings:
+                length_norm = 1 - BM25_B + BM25_B * self._doc_lengths[doc_idx] / self._avg_length
+                scores[doc_idx] += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+
+        ranked = sorted(
+            (item for item in scores.items() if item[1] >= min_score),
+            key=lambda item: (item[1], self.documents[item[0]].get('published_at', '')),
+            reverse=True
+        )
+        return [dict(self.documents[doc_idx], score=round(score, 4)) for doc_idx, score in ranked[:limit]]
+
+    def to_bytes(self) -> bytes:
+        """gzip JSON 직렬화 (역색인은 로드 시 재구성)"""
+        payload = {
+            'version': INDEX_FORMAT_VERSION,
+            'updatedAt': datetime.now().isoformat(),
+            'documents': self.documents
+        }
+        return gzip.compress(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'NewsIndex':
+        payload = json.loads(gzip.decompress(data).decode('utf-8'))
+        if payload.get('version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported news index version: {payload.get('version')}")
+        return cls(payload.get('documents', []))
+
+
+def _get_s3():
+    global _s3
+    if _s3 is None:
+        _s3 = boto3.client('s3')
+    return _s3
+
+
+def _split_s3_path(path: str):
+    bucket, _, key = path[len('s3://'):].partition('/')
+    return bucket, key
+
+
+def read_index_file(path: str) -> Optional[bytes]:
+    """
+    S3(s3://bucket/key) 또는 로컬 경로에서 인덱스 파일 읽기, 없으면 None
+    권한/네트워크 오류는 그대로 전파 (수집 Lambda가 기존 인덱스를 빈 것으로 오인해 덮어쓰지 않도록)
+    """
+    if path.startswith('s3://'):
+        bucket, key = _split_s3_path(path)
+        try:
+            return _get_s3().get_object(Bucket=bucket, Key=key)['Body'].read()
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in S3_MISSING_CODES:
+                return None
+            raise
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_index_file(path: str, data: bytes) -> None:
+    """S3 또는 로컬 경로에 인덱스 파일 쓰기"""
+    if path.startswith('s3://'):
+        bucket, key = _split_s3_path(path)
+        _get_s3().put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=data,
+            ContentType='application/gzip'
+        )
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def load_index(path: Optional[str] = None, force: bool = False) -> Optional[NewsIndex]:
+    """
+    인덱스 로드 (컨테이너 단위 캐시, INDEX_REFRESH_SECONDS마다 재로드)
+    파일이 없거나 읽을 수 없으면 None (실패 상태도 캐시하여 매 요청 S3 조회 방지)
+    """
+    path = path or os.environ.get('NEWS_INDEX_PATH', DEFAULT_INDEX_PATH)
+    now = time.time()
+    if (not force
+            and _index_cache['path'] == path
+            and now - _index_cache['loaded_at'] < INDEX_REFRESH_SECONDS):
+        return _index_cache['index']
+
+    try:
+        data = read_index_file(path)
+    except (ClientError, BotoCoreError) as e:
+        print(f"News index unavailable ({path}): {e}")
+        data = None
+    index = NewsIndex.from_bytes(data) if data else None
+    _index_cache.update({'index': index, 'path': path, 'loaded_at': now})
+    return index
@@ -0,0 +1,148 @@
+"""
+퀴즈 생성 시 미리 만들어 둔 해설 답변(explainers) 조회
+질문 의도(정답 이유 / 오답 이유 / 배경 용어)가 명확하면 Bedrock 호출 없이 바로 응답
+"""
+
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+
+# 상수 정의
+AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+QUIZ_TABLE = os.environ.get('QUIZ_TABLE', 'sedaily-quiz-data')
+RECENT_QUIZ_DAYS = 7
+EXPLAINER_CACHE_SECONDS = 600
+INTENT_MAX_LENGTH = 40  # 긴 복합 질문은 모델에 맡김
+
+_WHY = re.compile(r'왜|이유|근거|어째서|어떻게 해서')
+_WRONG = re.compile(r'틀린|틀렸|틀리|오답|아닌|아니|안 ?되')
+_CORRECT = re.compile(r'정답|맞는|맞나|맞은|답이|답은')
+_BACKGROUND = re.compile(r'용어|뜻|의미|개념|배경|무슨 말|뭔가요|뭐예요|뭐에요|무엇인가요')
+_OPTION_NUMBER = re.compile(r'(?<!\d)([1-4])(?!\d)')
+_CIRCLED = '①②③④'
+
+# 게임별 최근 퀴즈의 문제 해시 → explainers (컨테이너 캐시)
+_explainer_cache: Dict[str, Dict[str, Any]] = {}
+_table = None
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        _table = boto3.resource('dynamodb', region_name=AWS_REGION).Table(QUIZ_TABLE)
+    return _table
+
+
+def _question_hash(question_text: str) -> str:
+    return hashlib.sha256(question_text.strip().encode('utf-8')).hexdigest()[:16]
+
+
+def _load_recent_explainers(game_type: str) -> Dict[str, Dict[str, Any]]:
+    """게임별 최근 퀴즈들의 문제 → (explainers, correctAnswer) 매핑 (컨테이너 캐시)"""
+    cached = _explainer_cache.get(game_type)
+    if cached and time.time() - cached['loaded_at'] < EXPLAINER_CACHE_SECONDS:
+        return cached['questions']
+
+    response = _get_table().query(
+        KeyConditionExpression='PK = :pk',
+        ExpressionAttributeValues={':pk': f'QUIZ#{game_type}'},
+        ProjectionExpression='questions',
+        ScanIndexForward=False,
+        Limit=RECENT_QUIZ_DAYS
+    )
+
+    questions = {}
+    for item in response.get('Items', []):
+        for q in item.get('questions', []):
+            if q.get('explainers'):
+                questions[_question_hash(q.get('question', ''))] = {
+                    'explainers': q['explainers'],
+                    'correctAnswer': int(q.get('correctAnswer', 0))
+                }
+
+    _explainer_cache[game_type] = {'questions': questions, 'loaded_at': time.time()}
+    return questions
+
+
+def question_signals(user_question: str) -> Tuple[Tuple[int, ...], bool, bool, bool, bool]:
+    """
+    정답 번호와 무관한 질문 의미 신호: (선택지 인덱스들, 이유, 오답, 정답, 배경 표현 여부)
+    detect_intent와 답변 캐시 근사 일치(신호가 같은 질문끼리만 비교)가 공유
+    """
+    text = unicodedata.normalize('NFKC', user_question)
+    numbers = tuple(sorted({int(n) - 1 for n in _OPTION_NUMBER.findall(text)}))
+    return (numbers, bool(_WHY.search(text)), bool(_WRONG.search(text)), bool(_CORRECT.search(text)),
+            bool(_BACKGROUND.search(text)))
+
+
+def detect_intent(user_question: str, correct_answer: int) -> Optional[Dict[str, Any]]:
+    """
+    질문 의도 분류 (명확한 경우만)
+    반환: {'intent': 'whyCorrect' | 'whyWrong' | 'background', 'option': 선택지 인덱스 또는 None}
+    """
+    text = unicodedata.normalize('NFKC', user_question).strip()
+    if not text or len(text) > INTENT_MAX_LENGTH:
+        return None
+
+    numbers, why, wrong, correct, background = question_signals(text)
+    option = numbers[0] if len(numbers) == 1 else None
+    if len(numbers) > 1:
+        return None
+
+    if why:
+        if wrong:
+            if option is None or option != correct_answer:
+                return {'intent': 'whyWrong', 'option': option}
+            return None
+        if correct:
+            if option is not None and option != correct_answer:
+                return {'intent': 'whyWrong', 'option': option}
+            return {'intent': 'whyCorrect', 'option': None}
+        return None
+
+    if background:
+        return {'intent': 'background', 'option': None}
+    return None
+
+
+def find_pregenerated_answer(game_type: str, question_text: str, user_question: str) -> Optional[Dict[str, str]]:
+    """
+    사전 생성 답변 조회
+    반환: {'response': 답변, 'intent': 의도} 또는 None
+    """
+    if not game_type or not question_text:
+        return None
+
+    entry = _load_recent_explainers(game_type).get(_question_hash(question_text))
+    if not entry:
+        return None
+
+    correct = entry['correctAnswer']
+    intent = detect_intent(user_question, correct)
+    if not intent:
+        return None
+
+    explainers = entry['explainers']
+    if intent['intent'] == 'whyCorrect':
+        response = explainers.get('whyCorrect', '')
+    elif intent['intent'] == 'background':
+        response = explainers.get('background', '')
+    elif intent['option'] is not None:
+        why_wrong = explainers.get('whyWrong', [])
+        response = why_wrong[intent['option']] if intent['option'] < len(why_wrong) else ''
+    else:
+        # 번호 없이 "왜 나머지는 틀렸나요" → 오답 이유 전체
+        response = "\n\n".join(
+            f"{_CIRCLED[i]} {text}"
+            for i, text in enumerate(explainers.get('whyWrong', []))
+            if text and i != correct
+        )
+
+    if not response:
+        return None
+    return {'response': response, 'intent': intent['intent']}
@@ -0,0 +1,6 @@
+#!/bin/sh
+# enhanced-chatbot-stream 시작 스크립트 (Lambda Web Adapter가 실행, AWS_LAMBDA_EXEC_WRAPPER=/opt/bootstrap)
+# 어댑터가 함수 URL(RESPONSE_STREAM) 요청을 PORT의 WSGI 서버로 전달하고 응답을 그대로 스트리밍
+# 스크립트 실행은 런타임의 /opt/python 경로 설정을 거치지 않으므로 레이어 경로를 직접 추가
+export PYTHONPATH="/opt/python:${LAMBDA_TASK_ROOT}/lambda${PYTHONPATH:+:$PYTHONPATH}"
+exec python3 "${LAMBDA_TASK_ROOT}/lambda/enhanced-chatbot-handler.py"